@@ -300,8 +300,9 @@ class Plate(object):
 
         Parameters
         ----------
-        file_name : str, optional
-            Name of the Excel file to save.
+        file_name : str or file-like object, optional
+            Name of the Excel file to save, or binary file-like object to
+            write it to.
         workbook : Workbook, optional
             If not None, `file_name` is ignored, and a sheet with the
             instructions is directly added to workbook `workbook`.
@@ -389,12 +390,11 @@ class Plate(object):
         for i in range(ind_layout_rows):
             ind_layout.append(['']*(ind_layout_cols))
 
-        # Add well coordinates
+        # Add well coordinates, one row at a time
         for i in range(self.n_rows):
-            for j in range(self.n_cols):
-                row = i + len(inducers_rows)
-                col = j + len(inducers_cols)
-                ind_layout[row][col] += "({}, {})".format(i + 1, j + 1)
+            row = i + len(inducers_rows)
+            ind_layout[row][len(inducers_cols):] = [
+                "({}, {})".format(i + 1, j + 1) for j in range(self.n_cols)]
         # Add row inducer information
         for i, inducer in enumerate(inducers_rows):
             for j, val in enumerate(inducer.doses_table.index):
@@ -442,19 +442,19 @@ class Plate(object):
         plate_min_col = len(inducers_cols)
         plate_max_col = len(inducers_cols) + self.n_cols
 
-        # Create and populate worksheet
+        # Create and populate worksheet, one row at a time
         worksheet = workbook.create_sheet(title=sheet_name)
-        for i in range(len(ind_layout)):
-            for j in range(len(ind_layout[i])):
-                cell = worksheet.cell(row=i+1, column=j+1)
-                # Write value
-                cell.value = ind_layout[i][j]
-                # Apply styles
-                if (i >= plate_min_row) and (i < plate_max_row) and\
-                        (j >= plate_min_col) and (j < plate_max_col):
-                    cell.fill = plate_fill[0]
-                    cell.border = plate_border
-                    cell.alignment = plate_alignment
+        for ind_layout_row in ind_layout:
+            worksheet.append(ind_layout_row)
+        # Apply styles to plate area
+        for row in worksheet.iter_rows(min_row=plate_min_row + 1,
+                                       max_row=plate_max_row,
+                                       min_col=plate_min_col + 1,
+                                       max_col=plate_max_col):
+            for cell in row:
+                cell.fill = plate_fill[0]
+                cell.border = plate_border
+                cell.alignment = plate_alignment
 
     def add_cell_setup_instructions(self, workbook, sheet_name):
         """
@@ -1045,8 +1045,9 @@ class PlateArray(Plate):
 
         Parameters
         ----------
-        file_name : str, optional
-            Name of the Excel file to save.
+        file_name : str or file-like object, optional
+            Name of the Excel file to save, or binary file-like object to
+            write it to.
         workbook : Workbook, optional
             If not None, `file_name` is ignored, and a sheet with the
             instructions is directly added to workbook `workbook`.
@@ -1139,19 +1140,22 @@ class PlateArray(Plate):
         for i in range(ind_layout_rows):
             ind_layout.append(['']*(ind_layout_cols))
 
-        # Add well coordinates
+        # Add well coordinates, one row at a time. The plate name and column
+        # of each well in a row only depend on the column, so they are
+        # calculated once.
+        well_array_j = [j//(self.plate_n_cols) for j in range(self.n_cols)]
+        well_plate_j = [j%(self.plate_n_cols) + 1 for j in range(self.n_cols)]
         for i in range(self.n_rows):
-            for j in range(self.n_cols):
-                array_i = i//(self.plate_n_rows)
-                array_j = j//(self.plate_n_cols)
-                plate_i = i%(self.plate_n_rows)
-                plate_j = j%(self.plate_n_cols)
-                row = i + len(inducers_rows)
-                col = j + len(inducers_cols)
-                ind_layout[row][col] += "{} ({}, {})".format(
-                    self.plate_names[array_i*self.array_n_cols + array_j],
-                    plate_i + 1,
-                    plate_j + 1)
+            array_i = i//(self.plate_n_rows)
+            plate_i = i%(self.plate_n_rows)
+            row_plate_names = self.plate_names[
+                array_i*self.array_n_cols:(array_i + 1)*self.array_n_cols]
+            row = i + len(inducers_rows)
+            ind_layout[row][len(inducers_cols):] = [
+                "{} ({}, {})".format(row_plate_names[array_j],
+                                     plate_i + 1,
+                                     plate_j)
+                for array_j, plate_j in zip(well_array_j, well_plate_j)]
         # Add row inducer information
         for i, inducer in enumerate(inducers_rows):
             for j, val in enumerate(inducer.doses_table.index):
@@ -1199,21 +1203,23 @@ class PlateArray(Plate):
         plate_min_col = len(inducers_cols)
         plate_max_col = len(inducers_cols) + self.n_cols
 
-        # Create and populate worksheet
+        # Create and populate worksheet, one row at a time
         worksheet = workbook.create_sheet(title=sheet_name)
-        for i in range(len(ind_layout)):
-            for j in range(len(ind_layout[i])):
-                cell = worksheet.cell(row=i+1, column=j+1)
-                # Write value
-                cell.value = ind_layout[i][j]
-                # Apply styles
-                if (i >= plate_min_row) and (i < plate_max_row) and\
-                        (j >= plate_min_col) and (j < plate_max_col):
-                    array_i = (i - plate_min_row) // self.plate_n_rows
-                    array_j = (j - plate_min_col) // self.plate_n_cols
-                    cell.fill = plate_fill[(array_i + array_j)%2]
-                    cell.border = plate_border
-                    cell.alignment = plate_alignment
+        for ind_layout_row in ind_layout:
+            worksheet.append(ind_layout_row)
+        # Apply styles to plate area, alternating fill colors between
+        # adjacent plates
+        plate_area = worksheet.iter_rows(min_row=plate_min_row + 1,
+                                         max_row=plate_max_row,
+                                         min_col=plate_min_col + 1,
+                                         max_col=plate_max_col)
+        for i, row in enumerate(plate_area):
+            array_i = i // self.plate_n_rows
+            for j, cell in enumerate(row):
+                array_j = j // self.plate_n_cols
+                cell.fill = plate_fill[(array_i + array_j)%2]
+                cell.border = plate_border
+                cell.alignment = plate_alignment
 
     def close_plates(self):
         """
@@ -181,7 +181,7 @@ class TestExperiment(unittest.TestCase):
         summary_table_exp = pandas.DataFrame()
         summary_table_exp['Plate'] = ['P1']
         summary_table_exp['Strain'] = ['Test Strain 1']
-        pandas.util.testing.assert_frame_equal(summary_table,
+        pandas.testing.assert_frame_equal(summary_table,
                                                summary_table_exp)
         # Check proper plate setup instructions
         # Instructions will be compared to the ones generated by the plate
@@ -311,7 +311,7 @@ class TestExperiment(unittest.TestCase):
             summary_table_exp = pandas.DataFrame()
             summary_table_exp['Plate'] = ['P1']
             summary_table_exp['Strain'] = ['Test Strain 1']
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -433,7 +433,7 @@ class TestExperiment(unittest.TestCase):
             summary_table_exp = pandas.DataFrame()
             summary_table_exp['Plate'] = ['P1']
             summary_table_exp['Strain'] = ['Test Strain 1']
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -586,7 +586,7 @@ class TestExperiment(unittest.TestCase):
             summary_table_exp['Strain'] = ['Test Strain 1',
                                            'Test Strain 2',
                                            'Test Strain 3']
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -779,7 +779,7 @@ class TestExperiment(unittest.TestCase):
             summary_table_exp['Strain'] = ['Test Strain 1',
                                            'Test Strain 2',
                                            'Test Strain 3']
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -962,7 +962,7 @@ class TestExperiment(unittest.TestCase):
                                            'Test Strain 1',
                                            'Test Strain 1',
                                            'Autofluorescence Strain',]
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -1135,7 +1135,7 @@ class TestExperiment(unittest.TestCase):
                                            'Test Strain 1',
                                            'Test Strain 1',
                                            'Autofluorescence Strain',]
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -1314,7 +1314,7 @@ class TestExperiment(unittest.TestCase):
                                            'Test Strain 1',
                                            'Test Strain 1',
                                            'Autofluorescence Strain',]
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -1344,7 +1344,7 @@ class TestExperiment(unittest.TestCase):
                                                'Stack 1-3',
                                                'Stack 1-4',
                                                'Stack 1-5',]
-            pandas.util.testing.assert_frame_equal(resources_table,
+            pandas.testing.assert_frame_equal(resources_table,
                                                    resources_table_exp)
 
         # Check replicate measurement files
@@ -1523,7 +1523,7 @@ class TestExperiment(unittest.TestCase):
                                            'Test Strain 1',
                                            'Test Strain 1',
                                            'Autofluorescence Strain',]
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -1550,7 +1550,7 @@ class TestExperiment(unittest.TestCase):
             resources_table_exp['Plate'] = ['P1', 'P2', 'P3', 'P4', 'P5']
             resources_table_exp['Location'] = [locations[i]
                                                for i in location_idx[rep_idx]]
-            pandas.util.testing.assert_frame_equal(resources_table,
+            pandas.testing.assert_frame_equal(resources_table,
                                                    resources_table_exp)
 
         # Check replicate measurement files
@@ -1734,7 +1734,7 @@ class TestExperiment(unittest.TestCase):
                                            'Test Strain 1',
                                            'Test Strain 1',
                                            'Autofluorescence Strain',]
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -1764,7 +1764,7 @@ class TestExperiment(unittest.TestCase):
                              for i in numpy.argsort(locations_unsorted)]
             resources_table_exp['Plate'] = plates_rep
             resources_table_exp['Location'] = locations_rep
-            pandas.util.testing.assert_frame_equal(resources_table,
+            pandas.testing.assert_frame_equal(resources_table,
                                                    resources_table_exp)
 
         # Check replicate measurement files
@@ -2189,7 +2189,7 @@ class TestExperiment(unittest.TestCase):
                                            'Test Strain 1',
                                            'Test Strain 1',
                                            'Autofluorescence Strain',]
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -2219,7 +2219,7 @@ class TestExperiment(unittest.TestCase):
                              for i in numpy.argsort(locations_unsorted)]
             resources_table_exp['Plate'] = plates_rep
             resources_table_exp['Location'] = locations_rep
-            pandas.util.testing.assert_frame_equal(resources_table,
+            pandas.testing.assert_frame_equal(resources_table,
                                                    resources_table_exp)
 
         # Check replicate measurement files
@@ -2455,7 +2455,7 @@ class TestExperiment(unittest.TestCase):
                                            'Test Strain 1',
                                            'Test Strain 1',
                                            'Autofluorescence Strain',]
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -2485,7 +2485,7 @@ class TestExperiment(unittest.TestCase):
                              for i in numpy.argsort(locations_unsorted)]
             resources_table_exp['Plate'] = plates_rep
             resources_table_exp['Location'] = locations_rep
-            pandas.util.testing.assert_frame_equal(resources_table,
+            pandas.testing.assert_frame_equal(resources_table,
                                                    resources_table_exp)
 
         # Check replicate measurement files
@@ -2693,7 +2693,7 @@ class TestExperiment(unittest.TestCase):
                                            'Test Strain 1',
                                            'Test Strain 1',
                                            'Autofluorescence Strain',]
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -2880,7 +2880,7 @@ class TestExperiment(unittest.TestCase):
                                            'Test Strain 1',
                                            'Test Strain 1',
                                            'Autofluorescence Strain',]
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -3061,7 +3061,7 @@ class TestExperiment(unittest.TestCase):
                                            'Test Strain 1',
                                            'Test Strain 1',
                                            'Autofluorescence Strain',]
-            pandas.util.testing.assert_frame_equal(summary_table,
+            pandas.testing.assert_frame_equal(summary_table,
                                                    summary_table_exp)
             # Check proper plate setup instructions
             # Instructions will be compared to the ones generated by the plate
@@ -396,8 +396,8 @@ class TestChemicalInducer(unittest.TestCase):
         self.assertEqual(iptg.id_offset, 0)
         # Default dilutions table
         df = pandas.DataFrame()
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
-        pandas.util.testing.assert_frame_equal(iptg.doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg.doses_table, df)
         # Header for the dilutions table
         self.assertEqual(iptg._concentrations_header,
                          u"IPTG Concentration (µM)")
@@ -449,8 +449,8 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': numpy.linspace(0,1,11)},
             index=['I{:03d}'.format(i + 1) for i in range(11)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
-        pandas.util.testing.assert_frame_equal(iptg.doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg.doses_table, df)
         # Test intensities attribute
         numpy.testing.assert_array_equal(iptg.concentrations,
                                          numpy.linspace(0,1,11))
@@ -468,8 +468,8 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': numpy.linspace(0,1,11)},
             index=['IP{:03d}'.format(i + 24 + 1) for i in range(11)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
-        pandas.util.testing.assert_frame_equal(iptg.doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg.doses_table, df)
         # Test concentrations attribute
         numpy.testing.assert_array_equal(iptg.concentrations,
                                          numpy.linspace(0,1,11))
@@ -485,8 +485,8 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': numpy.linspace(0,1,21)},
             index=['I{:03d}'.format(i + 1) for i in range(21)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
-        pandas.util.testing.assert_frame_equal(iptg.doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg.doses_table, df)
         # Test concentrations attribute
         numpy.testing.assert_array_equal(iptg.concentrations,
                                          numpy.linspace(0,1,21))
@@ -502,8 +502,8 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': numpy.repeat(numpy.linspace(0,1,4), 3)},
             index=['I{:03d}'.format(i + 1) for i in range(12)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
-        pandas.util.testing.assert_frame_equal(iptg.doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg.doses_table, df)
         # Test concentrations attribute
         numpy.testing.assert_array_equal(iptg.concentrations,
                                          numpy.repeat(numpy.linspace(0,1,4), 3))
@@ -526,8 +526,8 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': numpy.logspace(-6,-3,10)},
             index=['I{:03d}'.format(i + 1) for i in range(10)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
-        pandas.util.testing.assert_frame_equal(iptg.doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg.doses_table, df)
         # Test concentrations attribute
         numpy.testing.assert_array_equal(iptg.concentrations,
                                          numpy.logspace(-6,-3,10))
@@ -544,8 +544,8 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': conc},
             index=['I{:03d}'.format(i + 1) for i in range(12)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
-        pandas.util.testing.assert_frame_equal(iptg.doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg.doses_table, df)
         # Test concentrations attribute
         numpy.testing.assert_array_equal(iptg.concentrations, conc)
 
@@ -561,8 +561,8 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': conc},
             index=['I{:03d}'.format(i + 1) for i in range(10)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
-        pandas.util.testing.assert_frame_equal(iptg.doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg.doses_table, df)
         # Test concentrations attribute
         numpy.testing.assert_array_equal(iptg.concentrations, conc)
 
@@ -583,8 +583,8 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': conc},
             index=['I{:03d}'.format(i + 1) for i in range(12)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
-        pandas.util.testing.assert_frame_equal(iptg.doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg.doses_table, df)
         # Test concentrations attribute
         numpy.testing.assert_array_equal(iptg.concentrations, conc)
 
@@ -817,9 +817,9 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': numpy.linspace(0,1,11)},
             index=['I{:03d}'.format(i + 1) for i in range(11)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
         # Check shuffled doses table
-        pandas.util.testing.assert_frame_equal(iptg.doses_table,
+        pandas.testing.assert_frame_equal(iptg.doses_table,
                                                df.iloc[shuffling_ind])
 
     def test_shuffle_disabled(self):
@@ -840,8 +840,8 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': numpy.linspace(0,1,11)},
             index=['I{:03d}'.format(i + 1) for i in range(11)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
-        pandas.util.testing.assert_frame_equal(iptg.doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg.doses_table, df)
 
     def test_sync_shuffling_fail(self):
         iptg = platedesign.inducer.ChemicalInducer(
@@ -894,8 +894,8 @@ class TestChemicalInducer(unittest.TestCase):
             {u'aTc Concentration (µM)': numpy.linspace(0,1,11) + 2},
             index=['a{:03d}'.format(i + 1) for i in range(11)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(atc._doses_table, df)
-        pandas.util.testing.assert_frame_equal(atc.doses_table, df)
+        pandas.testing.assert_frame_equal(atc._doses_table, df)
+        pandas.testing.assert_frame_equal(atc.doses_table, df)
 
     def test_sync_shuffling(self):
         iptg = platedesign.inducer.ChemicalInducer(
@@ -929,9 +929,9 @@ class TestChemicalInducer(unittest.TestCase):
             {u'IPTG Concentration (µM)': numpy.linspace(0,1,11)},
             index=['I{:03d}'.format(i + 1) for i in range(11)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(iptg._doses_table, df)
+        pandas.testing.assert_frame_equal(iptg._doses_table, df)
         # Check shuffled doses table
-        pandas.util.testing.assert_frame_equal(iptg.doses_table,
+        pandas.testing.assert_frame_equal(iptg.doses_table,
                                                df.iloc[shuffling_ind])
         # Check concentrations for dependent inducer
         concentrations = numpy.linspace(2,3,11)
@@ -942,9 +942,9 @@ class TestChemicalInducer(unittest.TestCase):
             {u'aTc Concentration (µM)': numpy.linspace(0,1,11) + 2},
             index=['a{:03d}'.format(i + 1) for i in range(11)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(atc._doses_table, df)
+        pandas.testing.assert_frame_equal(atc._doses_table, df)
         # Check shuffled doses table
-        pandas.util.testing.assert_frame_equal(atc.doses_table,
+        pandas.testing.assert_frame_equal(atc.doses_table,
                                                df.iloc[shuffling_ind])
 
     def test_save_exp_setup_instructions_error_1(self):
@@ -1071,7 +1071,7 @@ class TestChemicalInducer(unittest.TestCase):
         df.at[len(c) + 1, u'IPTG Concentration (µM)'] =\
             u'Distribute in aliquots of {} µL.'.format(100.)
         # Test for equality
-        pandas.util.testing.assert_frame_equal(df_in_file, df)
+        pandas.testing.assert_frame_equal(df_in_file, df)
 
     def test_save_exp_setup_instructions_2(self):
         iptg = platedesign.inducer.ChemicalInducer(
@@ -1119,7 +1119,7 @@ class TestChemicalInducer(unittest.TestCase):
         df.at[len(c) + 1, u'IPTG Concentration (µM)'] =\
             u'Distribute in aliquots of {} µL.'.format(100.)
         # Test for equality
-        pandas.util.testing.assert_frame_equal(df_in_file, df)
+        pandas.testing.assert_frame_equal(df_in_file, df)
 
     def test_save_exp_setup_instructions_3(self):
         iptg = platedesign.inducer.ChemicalInducer(
@@ -1172,7 +1172,7 @@ class TestChemicalInducer(unittest.TestCase):
         df.at[len(c) + 1, u'IPTG Concentration (µM)'] =\
             u'Distribute in aliquots of {} µL.'.format(36.)
         # Test for equality
-        pandas.util.testing.assert_frame_equal(df_in_file, df)
+        pandas.testing.assert_frame_equal(df_in_file, df)
 
     def test_save_exp_setup_instructions_4(self):
         iptg = platedesign.inducer.ChemicalInducer(
@@ -1213,7 +1213,7 @@ class TestChemicalInducer(unittest.TestCase):
         df.at[len(c) + 1, u'IPTG Concentration (µM)'] =\
             u'Distribute in aliquots of {} µL.'.format(6.)
         # Test for equality
-        pandas.util.testing.assert_frame_equal(df_in_file, df)
+        pandas.testing.assert_frame_equal(df_in_file, df)
 
     def test_save_exp_setup_instructions_workbook(self):
         iptg = platedesign.inducer.ChemicalInducer(
@@ -1262,7 +1262,7 @@ class TestChemicalInducer(unittest.TestCase):
         df.at[len(c) + 1, u'IPTG Concentration (µM)'] = \
             u'Distribute in aliquots of {} µL.'.format(100.)
         # Test for equality
-        pandas.util.testing.assert_frame_equal(df_in_wb, df)
+        pandas.testing.assert_frame_equal(df_in_wb, df)
 
 class TestChemicalGeneExpression(unittest.TestCase):
     """
@@ -1469,8 +1469,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         self.assertEqual(rr.id_offset, 0)
         # Default dilutions table
         df = pandas.DataFrame()
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
         # Headers for the dose table
         self.assertEqual(rr._concentrations_header,
                          u"IPTG Concentration (µM)")
@@ -1554,8 +1554,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
              u'RR Expression (MEFL)': expression_levels},
             index=['R{:03d}'.format(i + 1) for i in range(11)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_expression_levels_assignment(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1587,8 +1587,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
              u'RR Expression (MEFL)': expression_levels},
             index=['R{:03d}'.format(i + 1) for i in range(11)])
         df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_expression_levels_assignment_error(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1616,8 +1616,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
                                                   11)
         # Check that doses table is empty
         df = pandas.DataFrame()
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_concentrations_assignment_custom_id(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1651,8 +1651,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_expression_levels_assignment_custom_id(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1686,8 +1686,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_linear(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1716,8 +1716,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_linear_default(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1746,8 +1746,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_linear_min_is_y0(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1778,8 +1778,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_linear_no_min(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1810,8 +1810,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_linear_min_inducer(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1845,8 +1845,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_linear_ignore_min_inducer(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1876,8 +1876,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_linear_max_inducer(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1911,8 +1911,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_linear_ignore_max_inducer(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -1942,8 +1942,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_linear_no_max_error(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2006,8 +2006,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_linear_repeat_error(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2048,8 +2048,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_log_min_is_y0(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2082,8 +2082,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_log_no_min(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2116,8 +2116,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_log_min_inducer(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2153,8 +2153,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_log_ignore_min_inducer(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2186,8 +2186,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_log_max_inducer(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2223,8 +2223,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_log_ignore_max_inducer(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2256,8 +2256,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_log_no_max_error(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2320,8 +2320,8 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_set_gradient_log_repeat_error(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2450,9 +2450,9 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
         # Check shuffled doses table
-        pandas.util.testing.assert_frame_equal(rr.doses_table,
+        pandas.testing.assert_frame_equal(rr.doses_table,
                                                df.iloc[shuffling_ind])
 
     def test_shuffle_disabled(self):
@@ -2486,9 +2486,9 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.index.name='ID'
         df[u'IPTG Concentration (µM)'] = concentrations
         df[u'RR Expression (MEFL)'] = expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, df)
+        pandas.testing.assert_frame_equal(rr._doses_table, df)
         # Check shuffled doses table
-        pandas.util.testing.assert_frame_equal(rr.doses_table, df)
+        pandas.testing.assert_frame_equal(rr.doses_table, df)
 
     def test_sync_shuffling_fail(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2581,17 +2581,17 @@ class TestChemicalGeneExpression(unittest.TestCase):
         rr_df.index.name='ID'
         rr_df[u'IPTG Concentration (µM)'] = rr_concentrations
         rr_df[u'RR Expression (MEFL)'] = rr_expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, rr_df)
+        pandas.testing.assert_frame_equal(rr._doses_table, rr_df)
         # Check shuffled doses table
-        pandas.util.testing.assert_frame_equal(rr.doses_table, rr_df)
+        pandas.testing.assert_frame_equal(rr.doses_table, rr_df)
         sk_df = pandas.DataFrame(
             index=['S{:03d}'.format(i + 1) for i in range(12)])
         sk_df[u'Xylose Concentration (%)'] = sk_concentrations
         sk_df[u'SK Expression (MEFL)'] = sk_expression_levels
         sk_df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(sk._doses_table, sk_df)
+        pandas.testing.assert_frame_equal(sk._doses_table, sk_df)
         # Check shuffled doses table
-        pandas.util.testing.assert_frame_equal(sk.doses_table, sk_df)
+        pandas.testing.assert_frame_equal(sk.doses_table, sk_df)
 
     def test_sync_shuffling(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2647,18 +2647,18 @@ class TestChemicalGeneExpression(unittest.TestCase):
         rr_df.index.name='ID'
         rr_df[u'IPTG Concentration (µM)'] = rr_concentrations
         rr_df[u'RR Expression (MEFL)'] = rr_expression_levels
-        pandas.util.testing.assert_frame_equal(rr._doses_table, rr_df)
+        pandas.testing.assert_frame_equal(rr._doses_table, rr_df)
         # Check shuffled doses table
-        pandas.util.testing.assert_frame_equal(rr.doses_table,
+        pandas.testing.assert_frame_equal(rr.doses_table,
                                                rr_df.iloc[shuffling_ind])
         sk_df = pandas.DataFrame(
             index=['S{:03d}'.format(i + 1) for i in range(12)])
         sk_df[u'Xylose Concentration (%)'] = sk_concentrations
         sk_df[u'SK Expression (MEFL)'] = sk_expression_levels
         sk_df.index.name='ID'
-        pandas.util.testing.assert_frame_equal(sk._doses_table, sk_df)
+        pandas.testing.assert_frame_equal(sk._doses_table, sk_df)
         # Check shuffled doses table
-        pandas.util.testing.assert_frame_equal(sk.doses_table,
+        pandas.testing.assert_frame_equal(sk.doses_table,
                                                sk_df.iloc[shuffling_ind])
 
     def test_save_exp_setup_instructions_error_1(self):
@@ -2838,7 +2838,7 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.at[len(c) + 1, u'IPTG Concentration (µM)'] =\
             u'Distribute in aliquots of {} µL.'.format(100.)
         # Test for equality
-        pandas.util.testing.assert_frame_equal(df_in_file, df)
+        pandas.testing.assert_frame_equal(df_in_file, df)
 
     def test_save_exp_setup_instructions_2(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2890,7 +2890,7 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.at[len(c) + 1, u'IPTG Concentration (µM)'] =\
             u'Distribute in aliquots of {} µL.'.format(100.)
         # Test for equality
-        pandas.util.testing.assert_frame_equal(df_in_file, df)
+        pandas.testing.assert_frame_equal(df_in_file, df)
 
     def test_save_exp_setup_instructions_3(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -2947,7 +2947,7 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.at[len(c) + 1, u'IPTG Concentration (µM)'] =\
             u'Distribute in aliquots of {} µL.'.format(36.)
         # Test for equality
-        pandas.util.testing.assert_frame_equal(df_in_file, df)
+        pandas.testing.assert_frame_equal(df_in_file, df)
 
     def test_save_exp_setup_instructions_workbook(self):
         rr = platedesign.inducer.ChemicalGeneExpression(
@@ -3004,4 +3004,4 @@ class TestChemicalGeneExpression(unittest.TestCase):
         df.at[len(c) + 1, u'IPTG Concentration (µM)'] =\
             u'Distribute in aliquots of {} µL.'.format(100.)
         # Test for equality
-        pandas.util.testing.assert_frame_equal(df_in_wb, df)
+        pandas.testing.assert_frame_equal(df_in_wb, df)
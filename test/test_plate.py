@@ -5,12 +5,15 @@ Unit tests for plate classes
 """
 
 import collections
+import copy
+import io
 import itertools
 import os
 import random
 import re
 import six
 import shutil
+import tempfile
 import unittest
 
 import numpy
@@ -19,6 +22,229 @@ import pandas
 
 import platedesign
 
+# Classes used throughout the tests
+_PlateArray = platedesign.plate.PlateArray
+_ChemicalInducer = platedesign.inducer.ChemicalInducer
+
+def get_sheet_values(ws, coords):
+    """
+    Get values of worksheet cells at the specified (row, column) coordinates
+
+    All cells are read in a single pass over the worksheet, stopping at the
+    last requested row and column. Coordinates outside of the worksheet's
+    used range are reported as None. As in ``get_sheet_grid``, empty strings
+    are also reported as None.
+
+    """
+    values = dict.fromkeys(coords)
+    rows = ws.iter_rows(min_row=1,
+                        max_row=max(i for i, j in values),
+                        min_col=1,
+                        max_col=max(j for i, j in values),
+                        values_only=True)
+    for i, row in enumerate(rows, start=1):
+        for j, value in enumerate(row, start=1):
+            if (i, j) in values:
+                values[(i, j)] = None if value == '' else value
+    return values
+
+def get_sheet_grid(ws):
+    """
+    Get values of all worksheet cells as a tuple of rows
+
+    Rows and columns are indexed from zero, starting at cell A1. Empty
+    strings are reported as None, such that cells left blank read the same
+    whether the worksheet is in memory or loaded from a file.
+
+    """
+    return tuple(tuple(None if value == '' else value for value in row)
+                 for row in ws.iter_rows(min_row=1,
+                                         min_col=1,
+                                         values_only=True))
+
+def get_merged_ranges(ws):
+    """
+    Get coordinates of all merged cell ranges in a worksheet as a set
+
+    """
+    return set(r.coord for r in ws.merged_cells.ranges)
+
+# Inducers dictionary of a plate with no inducers applied
+EMPTY_INDUCERS = {'rows': [], 'cols': [], 'wells': [], 'media': []}
+
+def inducers_with(apply_to, inducers):
+    """
+    Get inducers dictionary of a plate with `inducers` applied to `apply_to`
+
+    """
+    d = {k: [] for k in EMPTY_INDUCERS}
+    d[apply_to] = inducers
+    return d
+
+# Plate names for the 2x3 plate arrays used in TestPlateArray. Plate arrays
+# created from it receive a list copy, so that the constant is unaffected
+# if a plate array modifies its list.
+PLATE_NAMES_6 = ('P1', 'P2', 'P3', 'P4', 'P5', 'P6')
+# Too few plate names for a 2x3 plate array
+PLATE_NAMES_4 = ['P1', 'P2', 'P3', 'P4']
+# PlateArray arguments with fewer plate names than plates in the array
+DIM_MISMATCH_KWARGS = {'name': 'A1',
+                       'array_n_rows': 2,
+                       'array_n_cols': 3,
+                       'plate_names': PLATE_NAMES_4}
+
+# Expected strings in the plate array spreadsheets used in TestPlateArray,
+# built once at import time.
+# IDs of 18 doses of inducers named "IPTG" and "aTc"
+IPTG_IDS_18 = tuple("I{:03d}".format(i + 1) for i in range(18))
+ATC_IDS_18 = tuple("a{:03d}".format(i + 1) for i in range(18))
+# Well labels of the 2x3 plate array, with the form "[plate name] ([row],
+# [column])" as they appear in the inducer setup sheets, as a tuple of rows
+# spanning the whole plate array.
+PLATE_ARRAY_WELL_LABELS = tuple(
+    tuple("{} ({}, {})".format(PLATE_NAMES_6[(i//4)*3 + j//6],
+                               i%4 + 1,
+                               j%6 + 1)
+          for j in range(18))
+    for i in range(8))
+# Well labels of a default 4x6 plate, with the form "([row], [column])" as
+# they appear in the inducer setup sheets of TestPlate, as a tuple of rows.
+PLATE_WELL_LABELS = tuple(
+    tuple("({}, {})".format(i + 1, j + 1) for j in range(6))
+    for i in range(4))
+
+def dose_ids(prefix, n):
+    """
+    Get the IDs of `n` doses of an inducer with the given ID prefix
+
+    """
+    return tuple("{}{:03d}".format(prefix, i + 1) for i in range(n))
+
+def well_contents(labels, id_lists):
+    """
+    Get expected contents of the wells area of an inducer setup sheet
+
+    Each well contains its label from `labels`, a tuple of rows, followed by
+    the well's dose ID from each sequence in `id_lists`. Wells are counted
+    row by row. Wells beyond the length of a sequence get no ID from it.
+
+    """
+    n_cols = len(labels[0])
+    return tuple(
+        tuple(label + "".join("\n" + ids[i*n_cols + j]
+                              for ids in id_lists
+                              if i*n_cols + j < len(ids))
+              for j, label in enumerate(labels_row))
+        for i, labels_row in enumerate(labels))
+
+def inducer_sheet_grid(wells_rows, instructions):
+    """
+    Get expected contents of an inducer setup sheet
+
+    `wells_rows` contains the rows with dose IDs and well labels, as a tuple
+    of rows. They are followed by an empty row, and by one row per setup
+    instruction in `instructions`.
+
+    """
+    n_cols = len(wells_rows[0])
+    return \
+        tuple(wells_rows) + \
+        ((None,)*n_cols,) + \
+        tuple((s,) + (None,)*(n_cols - 1) for s in instructions)
+
+def with_dose_id_cols(id_cols, labels):
+    """
+    Get rows of well labels preceded by the dose IDs of column inducers
+
+    Each sequence in `id_cols` contains one dose ID per row of `labels`.
+
+    """
+    return tuple(tuple(ids[i] for ids in id_cols) + labels_row
+                 for i, labels_row in enumerate(labels))
+
+# Inducer setup instructions for IPTG and aTc, with the shot volumes used in
+# the tests
+IPTG_WELLS_INSTRUCTION = u"Add 5.00µL of IPTG to each well."
+ATC_WELLS_INSTRUCTION = u"Add 10.00µL of aTc to each well."
+IPTG_MEDIA_INSTRUCTION = u"Add 5.00µL of IPTG to media."
+ATC_MEDIA_INSTRUCTION = u"Add 10.00µL of aTc to media."
+
+def mixed_inducers_grid(labels):
+    """
+    Get expected inducer setup sheet of the tests with mixed inducers
+
+    These tests apply the inducers from ``mixed_inducers`` to a plate or
+    plate array. `labels` contains the well labels as a tuple of rows.
+
+    """
+    n_rows = len(labels)
+    n_cols = len(labels[0])
+    xyl_wells = well_contents(labels, [dose_ids("X", n_rows*n_cols)])
+    instructions = [IPTG_WELLS_INSTRUCTION,
+                    ATC_WELLS_INSTRUCTION,
+                    u"Add 3.00µL of Xylose to each well.",
+                    u"Add 8.00µL of Sugar to media."]
+    return inducer_sheet_grid(
+        ((None,) + dose_ids("I", n_cols),) + \
+            with_dose_id_cols([dose_ids("a", n_rows)], xyl_wells),
+        instructions)
+
+# Last cell setup instruction for a plate with 15mL of media
+MEDIA_15ML_INSTRUCTIONS = \
+    "Add into 15.00mL media, and distribute into plate wells."
+
+# Last cell setup instruction for a plate array with 80mL of media
+MEDIA_80ML_INSTRUCTIONS = \
+    "Add into 80.00mL media, and distribute into plate wells."
+
+def create_plate_array():
+    """
+    Create a 2x3 plate array of default-sized plates, as used by most tests
+
+    """
+    return _PlateArray(name='A1',
+                       array_n_rows=2,
+                       array_n_cols=3,
+                       plate_names=list(PLATE_NAMES_6))
+
+def expected_plate_array_attrs(array_n_rows,
+                               array_n_cols,
+                               plate_n_rows=4,
+                               plate_n_cols=6,
+                               plate_names=PLATE_NAMES_6):
+    """
+    Get expected attributes of a newly created plate array named 'A1'
+
+    Attributes that depend on the array and plate dimensions are computed
+    from the specified dimensions.
+
+    """
+    n_rows = array_n_rows*plate_n_rows
+    n_cols = array_n_cols*plate_n_cols
+    return {
+        'name': 'A1',
+        'plate_names': list(plate_names),
+        'array_n_rows': array_n_rows,
+        'array_n_cols': array_n_cols,
+        'plate_n_rows': plate_n_rows,
+        'plate_n_cols': plate_n_cols,
+        'n_rows': n_rows,
+        'n_cols': n_cols,
+        'n_plates': array_n_rows*array_n_cols,
+        'samples_to_measure': n_rows*n_cols,
+        'sample_media_vol': None,
+        'total_media_vol': None,
+        'cell_strain_name': None,
+        'cell_setup_method': None,
+        'cell_predilution': 1,
+        'cell_predilution_vol': None,
+        'cell_initial_od600': None,
+        'cell_shot_vol': None,
+        'resources': collections.OrderedDict(),
+        'metadata': collections.OrderedDict(),
+        'inducers': EMPTY_INDUCERS,
+    }
+
 def test_excel_division_formula(test_case, s, number, cell):
     """
     Checks that string str is of the form "={number}/{cell}"
@@ -32,23 +258,412 @@ def test_excel_division_formula(test_case, s, number, cell):
     test_case.assertAlmostEqual(float(match.group(1)), number)
     test_case.assertEqual(match.group(2), cell)
 
+def assert_raises_msg(test_case, exception, msg, function, *args, **kwargs):
+    """
+    Check that calling `function` raises `exception`, reporting `msg` if not
+
+    Used in tests that loop over several cases, where `msg` identifies the
+    case. ``TestCase.assertRaises`` does not accept a message in python 2.
+
+    """
+    try:
+        function(*args, **kwargs)
+    except exception:
+        return
+    test_case.fail("{} not raised: {}".format(exception.__name__, msg))
+
+# Log-spaced gradients used by the tests. Each entry contains the inducer
+# name, units, minimum and maximum concentrations, and the numbers of
+# concentrations needed.
+GRADIENT_CONFIGS = (
+    ('IPTG', u'µM', 1e-6, 1e-3, (4, 6, 8, 12, 15, 18, 24, 80, 144)),
+    ('aTc', u'ng/µL', 0.5, 50, (4, 6, 8, 18, 24, 144)),
+    ('Xylose', u'%', 1e-6, 1e-3, (24, 144)),
+)
+
+def build_gradient_prototypes(configs):
+    """
+    Build one chemical inducer per gradient in `configs`.
+
+    Returns a dictionary indexed by inducer name and number of
+    concentrations.
+
+    """
+    prototypes = {}
+    for name, units, min, max, sizes in configs:
+        for n in sizes:
+            inducer = _ChemicalInducer(name=name, units=units)
+            inducer.set_gradient(min=min, max=max, n=n, scale='log')
+            prototypes[(name, n)] = inducer
+    return prototypes
+
+# Built once at import. Tests only get deep copies through
+# ``gradient_inducer``, so the prototypes are never modified.
+GRADIENT_PROTOTYPES = build_gradient_prototypes(GRADIENT_CONFIGS)
+
+def gradient_inducer(name, n):
+    """
+    Get a fresh chemical inducer with a log gradient of `n` concentrations.
+
+    The gradient must be listed in ``GRADIENT_CONFIGS``.
+
+    """
+    # Return a copy so that tests can modify the inducer freely
+    return copy.deepcopy(GRADIENT_PROTOTYPES[(name, n)])
+
+def iptg_gradient(n):
+    """
+    Get a fresh IPTG inducer with a log gradient of `n` concentrations.
+
+    """
+    return gradient_inducer('IPTG', n=n)
+
+def atc_gradient(n):
+    """
+    Get a fresh aTc inducer with a log gradient of `n` concentrations.
+
+    """
+    return gradient_inducer('aTc', n=n)
+
+def single_dose_inducer(name, units, concentration):
+    """
+    Get a chemical inducer with a single concentration.
+
+    """
+    inducer = _ChemicalInducer(name=name, units=units)
+    inducer.concentrations = [concentration]
+    return inducer
+
+def apply_chemical_inducer(p, name, units, concentrations, apply_to,
+                           shuffle=False):
+    """
+    Create a chemical inducer, optionally shuffle it, and apply it to `p`.
+
+    """
+    inducer = _ChemicalInducer(name=name, units=units)
+    inducer.concentrations = concentrations
+    if shuffle:
+        inducer.shuffle()
+    p.apply_inducer(inducer, apply_to=apply_to)
+    return inducer
+
+def mixed_inducers(n_rows, n_cols):
+    """
+    Get inducers of the tests with mixed inducers, for ``apply_inducers``.
+
+    IPTG is applied to rows, aTc to columns, Xylose to wells, and Sugar to
+    the media of a plate or plate array with `n_rows` rows and `n_cols`
+    columns.
+
+    """
+    xyl = gradient_inducer('Xylose', n=n_rows*n_cols)
+    return [(iptg_gradient(n=n_cols), 5., 'rows', False),
+            (atc_gradient(n=n_rows), 10., 'cols', False),
+            (xyl, 3., 'wells', False),
+            (single_dose_inducer('Sugar', u'ng/µL', 2), 8., 'media', False)]
+
+def apply_inducers(p, inducers):
+    """
+    Apply inducers to plate `p`, in order.
+
+    `inducers` contains tuples of an inducer, its shot volume, what to apply
+    it to, and whether to shuffle it first. The random seed is reset before
+    applying, so that shuffled doses are reproducible.
+
+    """
+    random.seed(1)
+    for inducer, shot_vol, apply_to, shuffle in inducers:
+        inducer.shot_vol = shot_vol
+        if shuffle:
+            inducer.shuffle()
+        p.apply_inducer(inducer, apply_to=apply_to)
+
+def inducer_setup_grids(p, inducers):
+    """
+    Apply inducers to plate `p` and get the contents of its setup sheets.
+
+    Inducers are applied with ``apply_inducers``, and replicate setup
+    instructions are saved to a new in-memory workbook. Return a dictionary
+    with the contents of each sheet as a tuple of rows, indexed by sheet
+    name.
+
+    """
+    apply_inducers(p, inducers)
+    # Create new spreadsheet
+    wb = openpyxl.Workbook()
+    # Remove sheet created by default
+    wb.remove(wb.active)
+    # Save instructions on spreadsheet in memory
+    p.save_rep_setup_instructions(workbook=wb)
+    return {ws.title: get_sheet_grid(ws) for ws in wb}
+
+# Cases for TestPlate.test_close_plates_inducer. Each case contains a name,
+# the number of samples to measure, the inducers to apply as arguments to
+# ``apply_chemical_inducer``, and the expected inducer columns in the closed
+# plate's well info. Inducers applied to rows vary along the plate columns,
+# and are thus tiled once per plate row. Inducers applied to columns are
+# repeated once per plate column.
+CLOSE_PLATES_INDUCER_CASES = [
+    ('row_1',
+     24,
+     [('IPTG', u'µM', [3, 4, 5, 6, 7, 8], 'rows')],
+     [(u'IPTG Concentration (µM)', numpy.tile([3., 4., 5., 6., 7., 8.], 4))]),
+    ('row_2',
+     24,
+     [('IPTG', u'µM', [3, 4, 5, 6, 7, 8], 'rows'),
+      ('aTc', u'ng/µL', [0.1, 0.2, 0.3, 0.4, 0.5, 0.6], 'rows')],
+     [(u'IPTG Concentration (µM)', numpy.tile([3., 4., 5., 6., 7., 8.], 4)),
+      (u'aTc Concentration (ng/µL)',
+       numpy.tile([0.1, 0.2, 0.3, 0.4, 0.5, 0.6], 4))]),
+    # Results of shuffling are different in python 2 and 3
+    ('row_3',
+     24,
+     [('IPTG', u'µM', [3, 4, 5, 6, 7, 8], 'rows', True),
+      ('aTc', u'ng/µL', [0.1, 0.2, 0.3, 0.4, 0.5, 0.6], 'rows')],
+     [(u'IPTG Concentration (µM)',
+       numpy.tile([4., 5., 8., 6., 7., 3.] if six.PY2 else
+                  [5., 6., 8., 3., 7., 4.], 4)),
+      (u'aTc Concentration (ng/µL)',
+       numpy.tile([0.1, 0.2, 0.3, 0.4, 0.5, 0.6], 4))]),
+    ('col_1',
+     24,
+     [('IPTG', u'µM', [3, 4, 5, 6], 'cols')],
+     [(u'IPTG Concentration (µM)', numpy.repeat([3., 4., 5., 6.], 6))]),
+    ('col_2',
+     24,
+     [('IPTG', u'µM', [3, 4, 5, 6], 'cols'),
+      ('aTc', u'ng/µL', [0.1, 0.2, 0.3, 0.4], 'cols')],
+     [(u'IPTG Concentration (µM)', numpy.repeat([3., 4., 5., 6.], 6)),
+      (u'aTc Concentration (ng/µL)', numpy.repeat([0.1, 0.2, 0.3, 0.4], 6))]),
+    # Results of shuffling are different in python 2 and 3
+    ('col_3',
+     24,
+     [('IPTG', u'µM', [3, 4, 5, 6], 'cols', True),
+      ('aTc', u'ng/µL', [0.1, 0.2, 0.3, 0.4], 'cols')],
+     [(u'IPTG Concentration (µM)',
+       numpy.repeat([6., 4., 5., 3.] if six.PY2 else [6., 3., 5., 4.], 6)),
+      (u'aTc Concentration (ng/µL)', numpy.repeat([0.1, 0.2, 0.3, 0.4], 6))]),
+    ('wells_1',
+     24,
+     [('IPTG', u'µM', numpy.arange(24) + 1, 'wells')],
+     [(u'IPTG Concentration (µM)', numpy.arange(1., 25.))]),
+    ('wells_2',
+     24,
+     [('IPTG', u'µM', numpy.arange(24) + 1, 'wells'),
+      ('aTc', u'ng/µL', (numpy.arange(24) + 1)/10., 'wells')],
+     [(u'IPTG Concentration (µM)', numpy.arange(1., 25.)),
+      (u'aTc Concentration (ng/µL)', numpy.arange(1., 25.)/10.)]),
+    # Results of shuffling are different in python 2 and 3
+    ('wells_3',
+     24,
+     [('IPTG', u'µM', numpy.arange(24) + 1, 'wells', True),
+      ('aTc', u'ng/µL', (numpy.arange(24) + 1)/10., 'wells')],
+     [(u'IPTG Concentration (µM)', [24., 3., 8., 22., 11., 13.,
+                                   19., 16., 7., 5., 15., 23.,
+                                   21., 18., 1., 2., 14., 12.,
+                                   9., 10., 6., 17., 20., 4.] if six.PY2 else
+                                  [21., 12., 24., 18., 22., 14.,
+                                   6., 11., 10., 7., 1., 8.,
+                                   2., 20., 17., 13., 23., 15.,
+                                   16., 4., 9., 3., 19., 5.]),
+      (u'aTc Concentration (ng/µL)', numpy.arange(1., 25.)/10.)]),
+    ('wells_4',
+     12,
+     [('IPTG', u'µM', numpy.arange(12) + 1, 'wells')],
+     [(u'IPTG Concentration (µM)',
+       numpy.append(numpy.arange(1., 13.), [numpy.nan]*12))]),
+    ('media_1',
+     24,
+     [('IPTG', u'µM', [3], 'media')],
+     [(u'IPTG Concentration (µM)', numpy.full(24, 3.))]),
+    ('media_2',
+     24,
+     [('IPTG', u'µM', [3], 'media'),
+      ('aTc', u'ng/µL', [5], 'media')],
+     [(u'IPTG Concentration (µM)', numpy.full(24, 3.)),
+      (u'aTc Concentration (ng/µL)', numpy.full(24, 5.))]),
+    ('media_3',
+     12,
+     [('IPTG', u'µM', [3], 'media')],
+     [(u'IPTG Concentration (µM)',
+       numpy.append(numpy.full(12, 3.), [numpy.nan]*12))]),
+    ]
+
+# Cases for TestPlateArray.test_close_plates_inducer, in the same format as
+# CLOSE_PLATES_INDUCER_CASES. The expected inducer columns cover all wells
+# of the 2x3 plate array in row-major order, and are split into the well
+# info of each closed plate by ``split_plate_array_well_info``.
+CLOSE_PLATE_ARRAY_INDUCER_CASES = [
+    ('row_1',
+     144,
+     [('IPTG', u'µM', numpy.arange(18) + 3, 'rows')],
+     [(u'IPTG Concentration (µM)', numpy.tile(numpy.arange(3., 21.), 8))]),
+    ('row_2',
+     144,
+     [('IPTG', u'µM', numpy.arange(18) + 3, 'rows'),
+      ('aTc', u'ng/µL', (numpy.arange(18.) + 1)/10., 'rows')],
+     [(u'IPTG Concentration (µM)', numpy.tile(numpy.arange(3., 21.), 8)),
+      (u'aTc Concentration (ng/µL)',
+       numpy.tile(numpy.arange(1., 19.)/10., 8))]),
+    # Results of shuffling are different in python 2 and 3
+    ('row_3',
+     144,
+     [('IPTG', u'µM', numpy.arange(18) + 3, 'rows', True),
+      ('aTc', u'ng/µL', (numpy.arange(18.) + 1)/10., 'rows')],
+     [(u'IPTG Concentration (µM)',
+       numpy.tile([14., 18., 20., 4., 13., 7., 19., 16., 12.,
+                   3., 11., 10., 8., 9., 6., 15., 17., 5.] if six.PY2 else
+                  [13., 8., 19., 20., 12., 3., 18., 17., 6.,
+                   9., 14., 16., 15., 10., 4., 11., 5., 7.], 8)),
+      (u'aTc Concentration (ng/µL)',
+       numpy.tile(numpy.arange(1., 19.)/10., 8))]),
+    ('col_1',
+     144,
+     [('IPTG', u'µM', numpy.arange(8) + 3, 'cols')],
+     [(u'IPTG Concentration (µM)', numpy.repeat(numpy.arange(3., 11.), 18))]),
+    ('col_2',
+     144,
+     [('IPTG', u'µM', numpy.arange(8) + 3, 'cols'),
+      ('aTc', u'ng/µL', (numpy.arange(8.) + 1)/10., 'cols')],
+     [(u'IPTG Concentration (µM)', numpy.repeat(numpy.arange(3., 11.), 18)),
+      (u'aTc Concentration (ng/µL)',
+       numpy.repeat(numpy.arange(1., 9.)/10., 18))]),
+    # Results of shuffling are different in python 2 and 3
+    ('col_3',
+     144,
+     [('IPTG', u'µM', numpy.arange(8) + 3, 'cols', True),
+      ('aTc', u'ng/µL', (numpy.arange(8.) + 1)/10., 'cols')],
+     [(u'IPTG Concentration (µM)',
+       numpy.repeat([3., 5., 6., 9., 10., 7., 8., 4.] if six.PY2 else
+                    [6., 9., 4., 8., 10., 3., 7., 5.], 18)),
+      (u'aTc Concentration (ng/µL)',
+       numpy.repeat(numpy.arange(1., 9.)/10., 18))]),
+    ('wells_1',
+     144,
+     [('IPTG', u'µM', numpy.arange(144) + 3, 'wells')],
+     [(u'IPTG Concentration (µM)', numpy.arange(3., 147.))]),
+    ('wells_2',
+     144,
+     [('IPTG', u'µM', numpy.arange(144) + 3, 'wells'),
+      ('aTc', u'ng/µL', (numpy.arange(144) + 1)/10., 'wells')],
+     [(u'IPTG Concentration (µM)', numpy.arange(3., 147.)),
+      (u'aTc Concentration (ng/µL)', numpy.arange(1., 145.)/10.)]),
+    # Results of shuffling are different in python 2 and 3
+    ('wells_3',
+     144,
+     [('IPTG', u'µM', numpy.arange(144) + 3, 'wells', True),
+      ('aTc', u'ng/µL', (numpy.arange(144) + 1)/10., 'wells')],
+     [(u'IPTG Concentration (µM)',
+       [ 20., 118.,  83.,  51.,  64.,  61.,  74.,  13.,  46.,
+        125.,  77.,  35.,  50., 131.,  12.,  30.,   7.,  45.,
+         25., 112.,   4.,  63.,  87.,   9.,  85., 100.,  81.,
+        129.,  19.,   8.,  10., 105.,  58.,  78.,  89.,  67.,
+        104.,  16.,  21.,  23.,  11.,  26.,  40., 102., 107.,
+        119., 136.,  41.,  76.,  47.,  44., 142., 133., 113.,
+         79.,  18.,  70., 141.,  59.,  33.,  86.,  56.,  68.,
+        101.,  97., 134.,  14., 115.,  99.,  88.,  52.,  90.,
+        139.,  39.,  98., 110., 109.,  42.,  37., 130.,  95.,
+        145., 140.,  17., 143., 108.,  24., 120.,  55.,  48.,
+         80.,  84.,  57.,  31.,  66.,  82.,  43.,  94.,  73.,
+         75.,  36., 138.,  91., 106., 146.,  71.,  62.,  93.,
+          5.,  34.,  54.,  27., 128.,  29., 132., 121., 122.,
+        126.,  53.,  28.,  49., 117.,  69., 127., 137., 116.,
+        123.,  32.,  96., 135.,   3., 103.,  60., 114.,   6.,
+         15., 144.,  92.,  65.,  72.,  38., 111., 124.,  22.] if six.PY2 else
+       [ 98., 131.,  29.,  23.,  87.,  62., 106.,  84., 122.,
+        109.,  60.,  12.,   8., 135.,  82., 124.,  63.,  79.,
+         75., 145.,  80., 101., 114.,  20.,  24.,  11.,  38.,
+         77.,  21., 112.,  76., 108.,  55.,  46.,  81., 146.,
+         91., 132.,  17.,  93.,  65.,  97.,  44.,  58., 144.,
+         88.,  42.,  48.,  22., 110., 143., 116.,  69., 103.,
+        133.,  28., 130.,  36.,  13.,  52.,   9.,  35., 125.,
+        128.,  14.,  50.,  49.,  25.,  94.,  54.,  34.,  64.,
+          7.,  53.,  99., 104., 126.,  39.,  41., 137.,  92.,
+        111.,  67.,  45.,  18.,  96.,  83.,  26.,  15.,  85.,
+         74., 138., 120.,  40.,  61., 107.,  89., 134.,  47.,
+        136.,  73.,  66.,  59., 139.,  31.,  70., 119., 142.,
+         57.,  30.,  90.,  51., 115.,   4.,  72.,  86., 121.,
+          5.,   6.,  43., 141.,  16., 140.,  78.,  32., 105.,
+         95.,  71., 117.,   3., 113., 102.,  10., 127.,  27.,
+         56., 100., 123., 118., 129.,  33.,  68.,  19.,  37.]),
+      (u'aTc Concentration (ng/µL)', numpy.arange(1., 145.)/10.)]),
+    ('wells_4',
+     80,
+     [('IPTG', u'µM', numpy.arange(80) + 3, 'wells')],
+     [(u'IPTG Concentration (µM)',
+       numpy.append(numpy.arange(3., 83.), [numpy.nan]*64))]),
+    ('media_1',
+     144,
+     [('IPTG', u'µM', [3], 'media')],
+     [(u'IPTG Concentration (µM)', numpy.full(144, 3.))]),
+    ('media_2',
+     144,
+     [('IPTG', u'µM', [3], 'media'),
+      ('aTc', u'ng/µL', [5], 'media')],
+     [(u'IPTG Concentration (µM)', numpy.full(144, 3.)),
+      (u'aTc Concentration (ng/µL)', numpy.full(144, 5.))]),
+    ('media_3',
+     80,
+     [('IPTG', u'µM', [3], 'media')],
+     [(u'IPTG Concentration (µM)',
+       numpy.append(numpy.full(80, 3.), [numpy.nan]*64))]),
+    ]
+
+def split_plate_array_well_info(columns):
+    """
+    Split well info columns of the 2x3 test plate array into its plates.
+
+    `columns` is a list of (name, values) tuples with the values of every
+    well in the plate array, in row-major order. Returns a list with the
+    well info DataFrame of each plate, in the order of the plate names.
+
+    """
+    well_infos = []
+    for array_row in range(2):
+        for array_col in range(3):
+            well_info = collections.OrderedDict()
+            for name, values in columns:
+                grid = numpy.reshape(values, (8, 18))
+                well_info[name] = grid[array_row*4:(array_row + 1)*4,
+                                       array_col*6:(array_col + 1)*6].ravel()
+            well_infos.append(pandas.DataFrame(well_info))
+    return well_infos
+
 class TestPlate(unittest.TestCase):
     """
     Tests for the Plate class
 
     """
+    @classmethod
+    def setUpClass(cls):
+        # Directory where to save temporary files, shared by all tests. It is
+        # unique to this process, so parallel test processes do not collide.
+        cls.temp_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        # Delete temporary directory
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
     def setUp(self):
-        # Directory where to save temporary files
-        self.temp_dir = "test/temp_plate"
-        if not os.path.exists(self.temp_dir):
-            os.makedirs(self.temp_dir)
         # Set random seed
         random.seed(1)
 
-    def tearDown(self):
-        # Delete temporary directory
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    def _xlsx_path(self):
+        """
+        Get path of a spreadsheet file in the temporary directory, named
+        after the running test.
+
+        """
+        return os.path.join(self.temp_dir, self._testMethodName + '.xlsx')
+
+    def _assert_basic(self, cp, msg=None):
+        """
+        Check name and dimensions of a closed plate with default size.
+
+        """
+        self.assertEqual((cp.name, cp.n_rows, cp.n_cols), ('P1', 4, 6),
+                         msg=msg)
 
     def test_create(self):
         p = platedesign.plate.Plate(name='P1')
@@ -71,10 +686,7 @@ class TestPlate(unittest.TestCase):
         self.assertIsNone(p.cell_shot_vol)
         self.assertEqual(p.resources, collections.OrderedDict())
         self.assertEqual(p.metadata, collections.OrderedDict())
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
     def test_non_default_attributes(self):
         p = platedesign.plate.Plate(name='P1', n_rows=8, n_cols=12)
@@ -94,10 +706,7 @@ class TestPlate(unittest.TestCase):
         self.assertIsNone(p.cell_shot_vol)
         self.assertEqual(p.resources, collections.OrderedDict())
         self.assertEqual(p.metadata, collections.OrderedDict())
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
     def test_apply_inducer_media_vol_1(self):
         # Create plate
@@ -189,35 +798,21 @@ class TestPlate(unittest.TestCase):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=6, scale='log')
+        iptg = iptg_gradient(n=6)
         # Apply inducer to plate
         p.apply_inducer(iptg, apply_to='rows')
         # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [iptg],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, inducers_with('rows', [iptg]))
 
     def test_apply_inducer_rows_error_1(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=4, scale='log')
+        iptg = iptg_gradient(n=4)
         # Apply inducer to plate
         self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='rows')
         # Check that inducers dictionary in plate has not been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
     def test_apply_inducer_rows_error_2(self):
         # Create plate
@@ -225,52 +820,31 @@ class TestPlate(unittest.TestCase):
         # Limit number of samples to measure
         p.samples_to_measure = 12
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=6, scale='log')
+        iptg = iptg_gradient(n=6)
         # Apply inducer to plate
         self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='rows')
         # Check that inducers dictionary in plate has not been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
     def test_apply_inducer_cols(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=4, scale='log')
+        iptg = iptg_gradient(n=4)
         # Apply inducer to plate
         p.apply_inducer(iptg, apply_to='cols')
         # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [iptg],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, inducers_with('cols', [iptg]))
 
     def test_apply_inducer_cols_error_1(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=6, scale='log')
+        iptg = iptg_gradient(n=6)
         # Apply inducer to plate
         self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='cols')
         # Check that inducers dictionary in plate has not been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
     def test_apply_inducer_cols_error_2(self):
         # Create plate
@@ -278,35 +852,21 @@ class TestPlate(unittest.TestCase):
         # Limit number of samples to measure
         p.samples_to_measure = 12
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=4, scale='log')
+        iptg = iptg_gradient(n=4)
         # Apply inducer to plate
         self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='cols')
         # Check that inducers dictionary in plate has not been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
     def test_apply_inducer_wells(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=24, scale='log')
+        iptg = iptg_gradient(n=24)
         # Apply inducer to plate
         p.apply_inducer(iptg, apply_to='wells')
         # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [iptg],
-                                      'media': []})
+        self.assertEqual(p.inducers, inducers_with('wells', [iptg]))
 
     def test_apply_inducer_wells_2(self):
         # Create plate
@@ -314,35 +874,21 @@ class TestPlate(unittest.TestCase):
         # Limit number of samples to measure
         p.samples_to_measure = 12
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=12, scale='log')
+        iptg = iptg_gradient(n=12)
         # Apply inducer to plate
         p.apply_inducer(iptg, apply_to='wells')
         # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [iptg],
-                                      'media': []})
+        self.assertEqual(p.inducers, inducers_with('wells', [iptg]))
 
     def test_apply_inducer_wells_error_1(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=15, scale='log')
+        iptg = iptg_gradient(n=15)
         # Apply inducer to plate
         self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='wells')
         # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
     def test_apply_inducer_wells_error_2(self):
         # Create plate
@@ -350,24 +896,17 @@ class TestPlate(unittest.TestCase):
         # Limit number of samples to measure
         p.samples_to_measure = 12
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=15, scale='log')
+        iptg = iptg_gradient(n=15)
         # Apply inducer to plate
         self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='wells')
         # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
     def test_apply_inducer_media_1(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
+        iptg = _ChemicalInducer(
             name='IPTG',
             units=u'µM')
         # Set concentrations
@@ -375,10 +914,7 @@ class TestPlate(unittest.TestCase):
         # Apply inducer to plate
         p.apply_inducer(iptg, apply_to='media')
         # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': [iptg]})
+        self.assertEqual(p.inducers, inducers_with('media', [iptg]))
 
     def test_apply_inducer_media_2(self):
         # Create plate
@@ -386,7 +922,7 @@ class TestPlate(unittest.TestCase):
         # Limit number of samples to measure
         p.samples_to_measure = 12
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
+        iptg = _ChemicalInducer(
             name='IPTG',
             units=u'µM')
         # Set concentrations
@@ -394,16 +930,13 @@ class TestPlate(unittest.TestCase):
         # Apply inducer to plate
         p.apply_inducer(iptg, apply_to='media')
         # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': [iptg]})
+        self.assertEqual(p.inducers, inducers_with('media', [iptg]))
 
     def test_apply_inducer_media_error_1(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
+        iptg = _ChemicalInducer(
             name='IPTG',
             units=u'µM')
         # Set concentrations
@@ -411,16 +944,13 @@ class TestPlate(unittest.TestCase):
         # Apply inducer to plate
         self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='media')
         # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
     def test_apply_inducer_error_1(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
+        iptg = _ChemicalInducer(
             name='IPTG',
             units=u'µM')
         # Set concentrations
@@ -428,17 +958,13 @@ class TestPlate(unittest.TestCase):
         # Apply inducer to plate
         self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='all')
         # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
     def test_save_exp_setup_instructions_1(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Run save_exp_setup_instructions
-        p.save_exp_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_exp.xlsx'))
+        p.save_exp_setup_instructions(file_name=self._xlsx_path())
         # save_exp_setup_instructions does not do anything in Plate. There is
         # no need to check for results.
 
@@ -472,13 +998,14 @@ class TestPlate(unittest.TestCase):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
+        file_name = self._xlsx_path()
+        p.save_rep_setup_instructions(file_name=file_name)
+        # Load spreadsheet in read-only mode
+        wb = openpyxl.load_workbook(filename=file_name, read_only=True)
         # Spreadsheet should only contain an empty sheet named "Sheet 1"
         self.assertEqual(wb.sheetnames, ["Sheet 1"])
+        # Read-only workbooks keep the file open until closed
+        wb.close()
 
     def test_save_rep_setup_instructions_cell_setup_fixed_od600_1(self):
         # Create plate
@@ -488,29 +1015,35 @@ class TestPlate(unittest.TestCase):
         p.cell_strain_name = 'Test strain 1'
         p.cell_setup_method = 'fixed_od600'
         p.cell_initial_od600 = 1e-5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
         # Spreadsheet should contain one sheet
         self.assertEqual(wb.sheetnames, ["Cells for Plate P1"])
         # Check cell inoculation instructions
         ws = wb["Cells for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertEqual(ws.cell(row=2, column=1).value, "Preculture/aliquot OD600")
-        self.assertEqual(ws.cell(row=2, column=2).value, None)
-        self.assertEqual(ws.cell(row=2, column=3).value, None)
-        self.assertEqual(ws.cell(row=3, column=1).value, "Target OD600")
-        self.assertEqual(ws.cell(row=3, column=2).value, 1e-5)
-        self.assertEqual(ws.cell(row=3, column=3).value, None)
-        self.assertEqual(ws.cell(row=4, column=1).value, "Preculture/aliquot volume")
-        test_excel_division_formula(self, ws.cell(row=4, column=2).value, 0.15, "B2")
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Add into 15.00mL "
-            "media, and distribute into plate wells.")
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Preculture/aliquot OD600",
+            (2, 2): None,
+            (2, 3): None,
+            (3, 1): "Target OD600",
+            (3, 2): 1e-5,
+            (3, 3): None,
+            (4, 1): "Preculture/aliquot volume",
+            (4, 3): u"µL",
+            (5, 1): MEDIA_15ML_INSTRUCTIONS,
+        }
+        # Read expected values and formula cell in a single pass
+        values = get_sheet_values(ws, list(expected_values) + [(4, 2)])
+        formula = values.pop((4, 2))
+        self.assertEqual(values, expected_values)
+        test_excel_division_formula(self, formula, 0.15, "B2")
 
     def test_save_rep_setup_instructions_cell_setup_fixed_od600_2(self):
         # Create plate
@@ -522,42 +1055,49 @@ class TestPlate(unittest.TestCase):
         p.cell_predilution = 100
         p.cell_predilution_vol = 1000
         p.cell_initial_od600 = 1e-5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
         # Spreadsheet should contain one sheet
         self.assertEqual(wb.sheetnames, ["Cells for Plate P1"])
         # Check cell inoculation instructions
         ws = wb["Cells for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=3, column=2).value, 100)
-        self.assertEqual(ws.cell(row=3, column=3).value, "x")
-        self.assertEqual(ws.cell(row=4, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=4, column=2).value, 990)
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 10)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=6, column=1).value, "Predilution OD600")
-        self.assertEqual(ws.cell(row=6, column=2).value, None)
-        self.assertEqual(ws.cell(row=6, column=3).value, None)
-        self.assertTrue('A7:C7' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=7, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Target OD600")
-        self.assertEqual(ws.cell(row=8, column=2).value, 1e-5)
-        self.assertEqual(ws.cell(row=8, column=3).value, None)
-        self.assertEqual(ws.cell(row=9, column=1).value, "Predilution volume")
-        test_excel_division_formula(self, ws.cell(row=9, column=2).value, 0.15, "B6")
-        self.assertEqual(ws.cell(row=9, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=10, column=1).value, "Add into 15.00mL "
-            "media, and distribute into plate wells.")
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Predilution factor",
+            (3, 2): 100,
+            (3, 3): "x",
+            (4, 1): "Media volume",
+            (4, 2): 990,
+            (4, 3): u"µL",
+            (5, 1): "Preculture/aliquot volume",
+            (5, 2): 10,
+            (5, 3): u"µL",
+            (6, 1): "Predilution OD600",
+            (6, 2): None,
+            (6, 3): None,
+            (7, 1): "Inoculation",
+            (8, 1): "Target OD600",
+            (8, 2): 1e-5,
+            (8, 3): None,
+            (9, 1): "Predilution volume",
+            (9, 3): u"µL",
+            (10, 1): MEDIA_15ML_INSTRUCTIONS,
+        }
+        # Read expected values and formula cell in a single pass
+        values = get_sheet_values(ws, list(expected_values) + [(9, 2)])
+        formula = values.pop((9, 2))
+        self.assertEqual(values, expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A7:C7', merged)
+        test_excel_division_formula(self, formula, 0.15, "B6")
 
     def test_save_rep_setup_instructions_cell_setup_fixed_od600_3(self):
         # Create plate
@@ -570,42 +1110,49 @@ class TestPlate(unittest.TestCase):
         p.cell_predilution = 100
         p.cell_predilution_vol = 1000
         p.cell_initial_od600 = 1e-5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
         # Spreadsheet should contain one sheet
         self.assertEqual(wb.sheetnames, ["Cells for Plate P1"])
         # Check cell inoculation instructions
         ws = wb["Cells for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Preculture/aliquot OD600")
-        self.assertEqual(ws.cell(row=3, column=2).value, None)
-        self.assertEqual(ws.cell(row=3, column=3).value, None)
-        self.assertEqual(ws.cell(row=4, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=4, column=2).value, 100)
-        self.assertEqual(ws.cell(row=4, column=3).value, "x")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 990)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=6, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=6, column=2).value, 10)
-        self.assertEqual(ws.cell(row=6, column=3).value, u"µL")
-        self.assertTrue('A7:C7' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=7, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Target OD600")
-        self.assertEqual(ws.cell(row=8, column=2).value, 1e-5)
-        self.assertEqual(ws.cell(row=8, column=3).value, None)
-        self.assertEqual(ws.cell(row=9, column=1).value, "Predilution volume")
-        test_excel_division_formula(self, ws.cell(row=9, column=2).value, 15., "B3")
-        self.assertEqual(ws.cell(row=9, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=10, column=1).value, "Add into 15.00mL "
-            "media, and distribute into plate wells.")
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Preculture/aliquot OD600",
+            (3, 2): None,
+            (3, 3): None,
+            (4, 1): "Predilution factor",
+            (4, 2): 100,
+            (4, 3): "x",
+            (5, 1): "Media volume",
+            (5, 2): 990,
+            (5, 3): u"µL",
+            (6, 1): "Preculture/aliquot volume",
+            (6, 2): 10,
+            (6, 3): u"µL",
+            (7, 1): "Inoculation",
+            (8, 1): "Target OD600",
+            (8, 2): 1e-5,
+            (8, 3): None,
+            (9, 1): "Predilution volume",
+            (9, 3): u"µL",
+            (10, 1): MEDIA_15ML_INSTRUCTIONS,
+        }
+        # Read expected values and formula cell in a single pass
+        values = get_sheet_values(ws, list(expected_values) + [(9, 2)])
+        formula = values.pop((9, 2))
+        self.assertEqual(values, expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A7:C7', merged)
+        test_excel_division_formula(self, formula, 15., "B3")
 
     def test_save_rep_setup_instructions_cell_setup_fixed_od600_error_1(self):
         # Create plate
@@ -621,7 +1168,7 @@ class TestPlate(unittest.TestCase):
         self.assertRaises(
             ValueError,
             p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
+            file_name=self._xlsx_path())
 
     def test_save_rep_setup_instructions_cell_setup_fixed_od600_error_2(self):
         # Create plate
@@ -637,7 +1184,7 @@ class TestPlate(unittest.TestCase):
         self.assertRaises(
             ValueError,
             p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
+            file_name=self._xlsx_path())
 
     def test_save_rep_setup_instructions_cell_setup_fixed_volume_1(self):
         # Create plate
@@ -647,23 +1194,27 @@ class TestPlate(unittest.TestCase):
         p.cell_strain_name = 'Test strain 1'
         p.cell_setup_method = 'fixed_volume'
         p.cell_shot_vol = 5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
         # Spreadsheet should contain one sheet
         self.assertEqual(wb.sheetnames, ["Cells for Plate P1"])
         # Check cell inoculation instructions
         ws = wb["Cells for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertEqual(ws.cell(row=2, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=2, column=2).value, 5)
-        self.assertEqual(ws.cell(row=2, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Add into 15.00mL "
-            "media, and distribute into plate wells.")
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Preculture/aliquot volume",
+            (2, 2): 5,
+            (2, 3): u"µL",
+            (3, 1): MEDIA_15ML_INSTRUCTIONS,
+        }
+        self.assertEqual(get_sheet_values(ws, expected_values),
+                         expected_values)
 
     def test_save_rep_setup_instructions_cell_setup_fixed_volume_2(self):
         # Create plate
@@ -675,36 +1226,41 @@ class TestPlate(unittest.TestCase):
         p.cell_predilution = 100
         p.cell_predilution_vol = 1000
         p.cell_shot_vol = 5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
         # Spreadsheet should contain one sheet
         self.assertEqual(wb.sheetnames, ["Cells for Plate P1"])
         # Check cell inoculation instructions
         ws = wb["Cells for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=3, column=2).value, 100)
-        self.assertEqual(ws.cell(row=3, column=3).value, "x")
-        self.assertEqual(ws.cell(row=4, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=4, column=2).value, 990)
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 10)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertTrue('A6:C6' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=6, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=7, column=1).value, "Predilution volume")
-        self.assertEqual(ws.cell(row=7, column=2).value, 5)
-        self.assertEqual(ws.cell(row=7, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Add into 15.00mL "
-            "media, and distribute into plate wells.")
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Predilution factor",
+            (3, 2): 100,
+            (3, 3): "x",
+            (4, 1): "Media volume",
+            (4, 2): 990,
+            (4, 3): u"µL",
+            (5, 1): "Preculture/aliquot volume",
+            (5, 2): 10,
+            (5, 3): u"µL",
+            (6, 1): "Inoculation",
+            (7, 1): "Predilution volume",
+            (7, 2): 5,
+            (7, 3): u"µL",
+            (8, 1): MEDIA_15ML_INSTRUCTIONS,
+        }
+        self.assertEqual(get_sheet_values(ws, expected_values),
+                         expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A6:C6', merged)
 
     def test_save_rep_setup_instructions_cell_setup_fixed_volume_error_1(self):
         # Create plate
@@ -720,7 +1276,7 @@ class TestPlate(unittest.TestCase):
         self.assertRaises(
             ValueError,
             p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
+            file_name=self._xlsx_path())
 
     def test_save_rep_setup_instructions_cell_setup_fixed_volume_error_2(self):
         # Create plate
@@ -736,7 +1292,7 @@ class TestPlate(unittest.TestCase):
         self.assertRaises(
             ValueError,
             p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
+            file_name=self._xlsx_path())
 
     def test_save_rep_setup_instructions_cell_setup_fixed_dilution_1(self):
         # Create plate
@@ -746,23 +1302,27 @@ class TestPlate(unittest.TestCase):
         p.cell_strain_name = 'Test strain 1'
         p.cell_setup_method = 'fixed_dilution'
         p.cell_total_dilution = 1e4
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
         # Spreadsheet should contain one sheet
         self.assertEqual(wb.sheetnames, ["Cells for Plate P1"])
         # Check cell inoculation instructions
         ws = wb["Cells for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertEqual(ws.cell(row=2, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=2, column=2).value, 1.5)
-        self.assertEqual(ws.cell(row=2, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Add into 15.00mL "
-            "media, and distribute into plate wells.")
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Preculture/aliquot volume",
+            (2, 2): 1.5,
+            (2, 3): u"µL",
+            (3, 1): MEDIA_15ML_INSTRUCTIONS,
+        }
+        self.assertEqual(get_sheet_values(ws, expected_values),
+                         expected_values)
 
     def test_save_rep_setup_instructions_cell_setup_fixed_dilution_2(self):
         # Create plate
@@ -774,36 +1334,41 @@ class TestPlate(unittest.TestCase):
         p.cell_predilution = 100
         p.cell_predilution_vol = 1000
         p.cell_total_dilution = 1e5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
         # Spreadsheet should contain one sheet
         self.assertEqual(wb.sheetnames, ["Cells for Plate P1"])
         # Check cell inoculation instructions
         ws = wb["Cells for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=3, column=2).value, 100)
-        self.assertEqual(ws.cell(row=3, column=3).value, "x")
-        self.assertEqual(ws.cell(row=4, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=4, column=2).value, 990)
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 10)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertTrue('A6:C6' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=6, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=7, column=1).value, "Predilution volume")
-        self.assertEqual(ws.cell(row=7, column=2).value, 15)
-        self.assertEqual(ws.cell(row=7, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Add into 15.00mL "
-            "media, and distribute into plate wells.")
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Predilution factor",
+            (3, 2): 100,
+            (3, 3): "x",
+            (4, 1): "Media volume",
+            (4, 2): 990,
+            (4, 3): u"µL",
+            (5, 1): "Preculture/aliquot volume",
+            (5, 2): 10,
+            (5, 3): u"µL",
+            (6, 1): "Inoculation",
+            (7, 1): "Predilution volume",
+            (7, 2): 15,
+            (7, 3): u"µL",
+            (8, 1): MEDIA_15ML_INSTRUCTIONS,
+        }
+        self.assertEqual(get_sheet_values(ws, expected_values),
+                         expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A6:C6', merged)
 
     def test_save_rep_setup_instructions_cell_setup_fixed_dilution_error_1(self):
         # Create plate
@@ -819,7 +1384,7 @@ class TestPlate(unittest.TestCase):
         self.assertRaises(
             ValueError,
             p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
+            file_name=self._xlsx_path())
 
     def test_save_rep_setup_instructions_cell_setup_fixed_dilution_error_2(self):
         # Create plate
@@ -835,1116 +1400,302 @@ class TestPlate(unittest.TestCase):
         self.assertRaises(
             ValueError,
             p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
+            file_name=self._xlsx_path())
+
+    def test_save_rep_setup_instructions_inducer_rows(self):
+        # Shuffled IPTG dose IDs used in the last case. The order of IPTG
+        # values after shuffling has been checked manually. The order after
+        # shuffling is different in python 2 and 3.
+        if six.PY2:
+            shuffled_iptg_ids = ("I002", "I003", "I006",
+                                 "I004", "I005", "I001")
+        elif six.PY3:
+            shuffled_iptg_ids = ("I003", "I004", "I006",
+                                 "I001", "I005", "I002")
+        # Each case contains a name, the inducers to apply as arguments to
+        # apply_inducers, the expected dose ID rows, and the expected
+        # instructions
+        cases = [
+            ('iptg',
+             [(iptg_gradient(n=6), 5., 'rows', False)],
+             (IPTG_IDS_18[:6],),
+             [IPTG_WELLS_INSTRUCTION]),
+            ('iptg_atc',
+             [(iptg_gradient(n=6), 5., 'rows', False),
+              (atc_gradient(n=6), 10., 'rows', False)],
+             (IPTG_IDS_18[:6], ATC_IDS_18[:6]),
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+            ('shuffled_iptg_atc',
+             [(iptg_gradient(n=6), 5., 'rows', True),
+              (atc_gradient(n=6), 10., 'rows', False)],
+             (shuffled_iptg_ids, ATC_IDS_18[:6]),
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+        ]
+        for name, inducers, id_rows, instructions in cases:
+            p = platedesign.plate.Plate(name='P1')
+            grids = inducer_setup_grids(p, inducers)
+            expected_grid = inducer_sheet_grid(
+                id_rows + PLATE_WELL_LABELS,
+                instructions)
+            self.assertEqual(grids,
+                             {"Inducers for Plate P1": expected_grid},
+                             msg=name)
+
+    def test_save_rep_setup_instructions_inducer_cols(self):
+        # Shuffled IPTG dose IDs used in the last case. IPTG concentrations
+        # have been checked manually. The order after shuffling is different
+        # in python 2 and 3.
+        if six.PY2:
+            shuffled_iptg_ids = ("I004", "I002", "I003", "I001")
+        elif six.PY3:
+            shuffled_iptg_ids = ("I004", "I001", "I003", "I002")
+        # Each case contains a name, the inducers to apply as arguments to
+        # apply_inducers, the expected dose ID columns, and the expected
+        # instructions
+        cases = [
+            ('iptg',
+             [(iptg_gradient(n=4), 5., 'cols', False)],
+             (IPTG_IDS_18[:4],),
+             [IPTG_WELLS_INSTRUCTION]),
+            ('iptg_atc',
+             [(iptg_gradient(n=4), 5., 'cols', False),
+              (atc_gradient(n=4), 10., 'cols', False)],
+             (IPTG_IDS_18[:4], ATC_IDS_18[:4]),
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+            ('shuffled_iptg_atc',
+             [(iptg_gradient(n=4), 5., 'cols', True),
+              (atc_gradient(n=4), 10., 'cols', False)],
+             (shuffled_iptg_ids, ATC_IDS_18[:4]),
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+        ]
+        for name, inducers, id_cols, instructions in cases:
+            p = platedesign.plate.Plate(name='P1')
+            grids = inducer_setup_grids(p, inducers)
+            expected_grid = inducer_sheet_grid(
+                with_dose_id_cols(id_cols, PLATE_WELL_LABELS),
+                instructions)
+            self.assertEqual(grids,
+                             {"Inducers for Plate P1": expected_grid},
+                             msg=name)
+
+    def test_save_rep_setup_instructions_inducer_wells(self):
+        # Shuffled IPTG dose IDs used in the last case, one per well counted
+        # row by row. Results after shuffling are different in python 2 and
+        # 3.
+        if six.PY2:
+            shuffled_iptg_ids = (
+                "I024", "I003", "I008", "I022", "I011", "I013",
+                "I019", "I016", "I007", "I005", "I015", "I023",
+                "I021", "I018", "I001", "I002", "I014", "I012",
+                "I009", "I010", "I006", "I017", "I020", "I004")
+        elif six.PY3:
+            shuffled_iptg_ids = (
+                "I021", "I012", "I024", "I018", "I022", "I014",
+                "I006", "I011", "I010", "I007", "I001", "I008",
+                "I002", "I020", "I017", "I013", "I023", "I015",
+                "I016", "I004", "I009", "I003", "I019", "I005")
+        # Each case contains a name, the number of samples to measure, the
+        # inducers to apply as arguments to apply_inducers, the expected dose
+        # IDs of each inducer, and the expected instructions. Wells beyond
+        # the samples to measure only contain their labels.
+        cases = [
+            ('iptg',
+             24,
+             [(iptg_gradient(n=24), 5., 'wells', False)],
+             [dose_ids("I", 24)],
+             [IPTG_WELLS_INSTRUCTION]),
+            ('iptg_atc',
+             24,
+             [(iptg_gradient(n=24), 5., 'wells', False),
+              (atc_gradient(n=24), 10., 'wells', False)],
+             [dose_ids("I", 24), dose_ids("a", 24)],
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+            ('iptg_12_samples',
+             12,
+             [(iptg_gradient(n=12), 5., 'wells', False)],
+             [dose_ids("I", 12)],
+             [IPTG_WELLS_INSTRUCTION]),
+            ('shuffled_iptg_atc',
+             24,
+             [(iptg_gradient(n=24), 5., 'wells', True),
+              (atc_gradient(n=24), 10., 'wells', False)],
+             [shuffled_iptg_ids, dose_ids("a", 24)],
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+        ]
+        for name, n_samples, inducers, id_lists, instructions in cases:
+            p = platedesign.plate.Plate(name='P1')
+            p.samples_to_measure = n_samples
+            grids = inducer_setup_grids(p, inducers)
+            expected_grid = inducer_sheet_grid(
+                well_contents(PLATE_WELL_LABELS, id_lists),
+                instructions)
+            self.assertEqual(grids,
+                             {"Inducers for Plate P1": expected_grid},
+                             msg=name)
+
+    def test_save_rep_setup_instructions_inducer_media(self):
+        # Each case contains a name, the inducers to apply as arguments to
+        # apply_inducers, and the expected instructions
+        cases = [
+            ('iptg',
+             [(single_dose_inducer('IPTG', u'µM', 12), 5., 'media', False)],
+             [IPTG_MEDIA_INSTRUCTION]),
+            ('iptg_atc',
+             [(single_dose_inducer('IPTG', u'µM', 12), 5., 'media', False),
+              (single_dose_inducer('aTc', u'ng/µL', 2), 10., 'media', False)],
+             [IPTG_MEDIA_INSTRUCTION, ATC_MEDIA_INSTRUCTION]),
+        ]
+        for name, inducers, instructions in cases:
+            p = platedesign.plate.Plate(name='P1')
+            grids = inducer_setup_grids(p, inducers)
+            expected_grid = inducer_sheet_grid(PLATE_WELL_LABELS,
+                                               instructions)
+            self.assertEqual(grids,
+                             {"Inducers for Plate P1": expected_grid},
+                             msg=name)
 
-    def test_save_rep_setup_instructions_inducer_rows_1(self):
+    def test_save_rep_setup_instructions_inducer_mixed(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=6, scale='log')
-        iptg.shot_vol = 5.
-        p.apply_inducer(iptg, apply_to='rows')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "I002")
-        self.assertEqual(ws.cell(row=1, column=3).value, "I003")
-        self.assertEqual(ws.cell(row=1, column=4).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=5).value, "I005")
-        self.assertEqual(ws.cell(row=1, column=6).value, "I006")
-        self.assertEqual(ws.cell(row=2, column=1).value, "(1, 1)")
-        self.assertEqual(ws.cell(row=2, column=2).value, "(1, 2)")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(1, 3)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(1, 4)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(1, 5)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(1, 6)")
-        self.assertEqual(ws.cell(row=3, column=1).value, "(2, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(2, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(2, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(2, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(2, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(2, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "(3, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(3, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(3, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(3, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(3, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(3, 6)")
-        self.assertEqual(ws.cell(row=5, column=1).value, "(4, 1)")
-        self.assertEqual(ws.cell(row=5, column=2).value, "(4, 2)")
-        self.assertEqual(ws.cell(row=5, column=3).value, "(4, 3)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "(4, 4)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "(4, 5)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "(4, 6)")
-        self.assertIsNone(ws.cell(row=6, column=1).value)
-        self.assertEqual(ws.cell(row=7, column=1).value, u"Add 5.00µL of IPTG to each well.")
-
-    def test_save_rep_setup_instructions_inducer_rows_2(self):
+        grids = inducer_setup_grids(p, mixed_inducers(4, 6))
+        self.assertEqual(
+            grids,
+            {"Inducers for Plate P1": mixed_inducers_grid(PLATE_WELL_LABELS)})
+
+    def test_save_rep_setup_instructions_cells_and_inducer(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=6, scale='log')
-        iptg.shot_vol = 5.
-        p.apply_inducer(iptg, apply_to='rows')
-        # Create second inducer for plate rows
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.set_gradient(min=0.5, max=50, n=6, scale='log')
-        atc.shot_vol = 10.
-        p.apply_inducer(atc, apply_to='rows')
+        p.total_media_vol = 15000.
+        # Add some information for cell setup
+        p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_od600'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_initial_od600 = 1e-5
+
+        # Apply inducers to plate rows, columns, wells, and media
+        apply_inducers(p, mixed_inducers(4, 6))
         # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
+        file_name = self._xlsx_path()
+        p.save_rep_setup_instructions(file_name=file_name)
         # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
+        wb = openpyxl.load_workbook(filename=file_name)
+        # Check that sheet exists in spreadsheet
+        self.assertTrue("Inducers for Plate P1" in wb.sheetnames)
         # Check inducer inoculation instructions
         ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "I002")
-        self.assertEqual(ws.cell(row=1, column=3).value, "I003")
-        self.assertEqual(ws.cell(row=1, column=4).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=5).value, "I005")
-        self.assertEqual(ws.cell(row=1, column=6).value, "I006")
-        self.assertEqual(ws.cell(row=2, column=1).value, "a001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "a002")
-        self.assertEqual(ws.cell(row=2, column=3).value, "a003")
-        self.assertEqual(ws.cell(row=2, column=4).value, "a004")
-        self.assertEqual(ws.cell(row=2, column=5).value, "a005")
-        self.assertEqual(ws.cell(row=2, column=6).value, "a006")
-        self.assertEqual(ws.cell(row=3, column=1).value, "(1, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(1, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(1, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(1, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(1, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(1, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "(2, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(2, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(2, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(2, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(2, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(2, 6)")
-        self.assertEqual(ws.cell(row=5, column=1).value, "(3, 1)")
-        self.assertEqual(ws.cell(row=5, column=2).value, "(3, 2)")
-        self.assertEqual(ws.cell(row=5, column=3).value, "(3, 3)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "(3, 4)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "(3, 5)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "(3, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value, "(4, 1)")
-        self.assertEqual(ws.cell(row=6, column=2).value, "(4, 2)")
-        self.assertEqual(ws.cell(row=6, column=3).value, "(4, 3)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "(4, 4)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "(4, 5)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "(4, 6)")
-        self.assertIsNone(ws.cell(row=7, column=1).value)
-        self.assertEqual(ws.cell(row=8, column=1).value, u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=9, column=1).value, u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_rows_3(self):
+        grid = get_sheet_grid(ws)
+        self.assertEqual(grid, mixed_inducers_grid(PLATE_WELL_LABELS))
+
+        # Check that sheet exists in spreadsheet
+        self.assertTrue("Cells for Plate P1" in wb.sheetnames)
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate P1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Predilution factor",
+            (3, 2): 100,
+            (3, 3): "x",
+            (4, 1): "Media volume",
+            (4, 2): 990,
+            (4, 3): u"µL",
+            (5, 1): "Preculture/aliquot volume",
+            (5, 2): 10,
+            (5, 3): u"µL",
+            (6, 1): "Predilution OD600",
+            (6, 2): None,
+            (6, 3): None,
+            (7, 1): "Inoculation",
+            (8, 1): "Target OD600",
+            (8, 2): 1e-5,
+            (8, 3): None,
+            (9, 1): "Predilution volume",
+            (9, 3): u"µL",
+            (10, 1): MEDIA_15ML_INSTRUCTIONS,
+        }
+        # Read expected values and formula cell in a single pass
+        values = get_sheet_values(ws, list(expected_values) + [(9, 2)])
+        formula = values.pop((9, 2))
+        self.assertEqual(values, expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A7:C7', merged)
+        test_excel_division_formula(self, formula, 0.15, "B6")
+
+    def test_save_rep_setup_instructions_cells_and_inducer_workbook(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=6, scale='log')
-        iptg.shot_vol = 5.
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='rows')
-        # Create second inducer for plate rows
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.set_gradient(min=0.5, max=50, n=6, scale='log')
-        atc.shot_vol = 10.
-        p.apply_inducer(atc, apply_to='rows')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
+        p.total_media_vol = 15000.
+        # Add some information for cell setup
+        p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_od600'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_initial_od600 = 1e-5
+
+        # Apply inducers to plate rows, columns, wells, and media
+        apply_inducers(p, mixed_inducers(4, 6))
+
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Save instructions on existing spreadsheet
+        p.save_rep_setup_instructions(workbook=wb)
+
+        # Check that sheet exists in spreadsheet
+        self.assertTrue("Inducers for Plate P1" in wb.sheetnames)
         # Check inducer inoculation instructions
-        # The order of IPTG values after shuffling has been checked manually
-        # The order after shuffling is different in python 2 and 3
         ws = wb["Inducers for Plate P1"]
-        if six.PY2:
-            self.assertEqual(ws.cell(row=1, column=1).value, "I002")
-            self.assertEqual(ws.cell(row=1, column=2).value, "I003")
-            self.assertEqual(ws.cell(row=1, column=3).value, "I006")
-            self.assertEqual(ws.cell(row=1, column=4).value, "I004")
-            self.assertEqual(ws.cell(row=1, column=5).value, "I005")
-            self.assertEqual(ws.cell(row=1, column=6).value, "I001")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=1, column=1).value, "I003")
-            self.assertEqual(ws.cell(row=1, column=2).value, "I004")
-            self.assertEqual(ws.cell(row=1, column=3).value, "I006")
-            self.assertEqual(ws.cell(row=1, column=4).value, "I001")
-            self.assertEqual(ws.cell(row=1, column=5).value, "I005")
-            self.assertEqual(ws.cell(row=1, column=6).value, "I002")
-        self.assertEqual(ws.cell(row=2, column=1).value, "a001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "a002")
-        self.assertEqual(ws.cell(row=2, column=3).value, "a003")
-        self.assertEqual(ws.cell(row=2, column=4).value, "a004")
-        self.assertEqual(ws.cell(row=2, column=5).value, "a005")
-        self.assertEqual(ws.cell(row=2, column=6).value, "a006")
-        self.assertEqual(ws.cell(row=3, column=1).value, "(1, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(1, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(1, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(1, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(1, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(1, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "(2, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(2, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(2, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(2, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(2, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(2, 6)")
-        self.assertEqual(ws.cell(row=5, column=1).value, "(3, 1)")
-        self.assertEqual(ws.cell(row=5, column=2).value, "(3, 2)")
-        self.assertEqual(ws.cell(row=5, column=3).value, "(3, 3)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "(3, 4)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "(3, 5)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "(3, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value, "(4, 1)")
-        self.assertEqual(ws.cell(row=6, column=2).value, "(4, 2)")
-        self.assertEqual(ws.cell(row=6, column=3).value, "(4, 3)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "(4, 4)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "(4, 5)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "(4, 6)")
-        self.assertIsNone(ws.cell(row=7, column=1).value)
-        self.assertEqual(ws.cell(row=8, column=1).value, u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=9, column=1).value, u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_cols_1(self):
+        grid = get_sheet_grid(ws)
+        self.assertEqual(grid, mixed_inducers_grid(PLATE_WELL_LABELS))
+
+        # Check that sheet exists in spreadsheet
+        self.assertTrue("Cells for Plate P1" in wb.sheetnames)
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate P1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Predilution factor",
+            (3, 2): 100,
+            (3, 3): "x",
+            (4, 1): "Media volume",
+            (4, 2): 990,
+            (4, 3): u"µL",
+            (5, 1): "Preculture/aliquot volume",
+            (5, 2): 10,
+            (5, 3): u"µL",
+            (6, 1): "Predilution OD600",
+            (6, 2): None,
+            (6, 3): None,
+            (7, 1): "Inoculation",
+            (8, 1): "Target OD600",
+            (8, 2): 1e-5,
+            (8, 3): None,
+            (9, 1): "Predilution volume",
+            (9, 3): u"µL",
+            (10, 1): MEDIA_15ML_INSTRUCTIONS,
+        }
+        # Read expected values and formula cell in a single pass
+        values = get_sheet_values(ws, list(expected_values) + [(9, 2)])
+        formula = values.pop((9, 2))
+        self.assertEqual(values, expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A7:C7', merged)
+        test_excel_division_formula(self, formula, 0.15, "B6")
+
+    def test_save_rep_setup_instructions_argument_error(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate columns
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=4, scale='log')
-        iptg.shot_vol = 5.
-        p.apply_inducer(iptg, apply_to='cols')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "(1, 1)")
-        self.assertEqual(ws.cell(row=1, column=3).value, "(1, 2)")
-        self.assertEqual(ws.cell(row=1, column=4).value, "(1, 3)")
-        self.assertEqual(ws.cell(row=1, column=5).value, "(1, 4)")
-        self.assertEqual(ws.cell(row=1, column=6).value, "(1, 5)")
-        self.assertEqual(ws.cell(row=1, column=7).value, "(1, 6)")
-        self.assertEqual(ws.cell(row=2, column=1).value, "I002")
-        self.assertEqual(ws.cell(row=2, column=2).value, "(2, 1)")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(2, 2)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(2, 3)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(2, 4)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(2, 5)")
-        self.assertEqual(ws.cell(row=2, column=7).value, "(2, 6)")
-        self.assertEqual(ws.cell(row=3, column=1).value, "I003")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(3, 1)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(3, 2)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(3, 3)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(3, 4)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(3, 5)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "(3, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "I004")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(4, 1)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(4, 2)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(4, 3)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(4, 4)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(4, 5)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "(4, 6)")
-        self.assertIsNone(ws.cell(row=5, column=1).value)
-        self.assertEqual(ws.cell(row=6, column=1).value, u"Add 5.00µL of IPTG to each well.")
-
-    def test_save_rep_setup_instructions_inducer_cols_2(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate columns
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=4, scale='log')
-        iptg.shot_vol = 5.
-        p.apply_inducer(iptg, apply_to='cols')
-        # Create second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.set_gradient(min=0.5, max=50, n=4, scale='log')
-        atc.shot_vol = 10.
-        p.apply_inducer(atc, apply_to='cols')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "a001")
-        self.assertEqual(ws.cell(row=1, column=3).value, "(1, 1)")
-        self.assertEqual(ws.cell(row=1, column=4).value, "(1, 2)")
-        self.assertEqual(ws.cell(row=1, column=5).value, "(1, 3)")
-        self.assertEqual(ws.cell(row=1, column=6).value, "(1, 4)")
-        self.assertEqual(ws.cell(row=1, column=7).value, "(1, 5)")
-        self.assertEqual(ws.cell(row=1, column=8).value, "(1, 6)")
-        self.assertEqual(ws.cell(row=2, column=1).value, "I002")
-        self.assertEqual(ws.cell(row=2, column=2).value, "a002")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(2, 1)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(2, 2)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(2, 3)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(2, 4)")
-        self.assertEqual(ws.cell(row=2, column=7).value, "(2, 5)")
-        self.assertEqual(ws.cell(row=2, column=8).value, "(2, 6)")
-        self.assertEqual(ws.cell(row=3, column=1).value, "I003")
-        self.assertEqual(ws.cell(row=3, column=2).value, "a003")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(3, 1)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(3, 2)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(3, 3)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(3, 4)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "(3, 5)")
-        self.assertEqual(ws.cell(row=3, column=8).value, "(3, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "I004")
-        self.assertEqual(ws.cell(row=4, column=2).value, "a004")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(4, 1)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(4, 2)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(4, 3)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(4, 4)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "(4, 5)")
-        self.assertEqual(ws.cell(row=4, column=8).value, "(4, 6)")
-        self.assertIsNone(ws.cell(row=5, column=1).value)
-        self.assertEqual(ws.cell(row=6, column=1).value, u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=7, column=1).value, u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_cols_3(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate columns
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=4, scale='log')
-        iptg.shot_vol = 5.
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='cols')
-        # Create second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.set_gradient(min=0.5, max=50, n=4, scale='log')
-        atc.shot_vol = 10.
-        p.apply_inducer(atc, apply_to='cols')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        # IPTG concentrations have been checked manually
-        # The order after shuffling is different in python 2 and 3
-        ws = wb["Inducers for Plate P1"]
-        if six.PY2:
-            self.assertEqual(ws.cell(row=1, column=1).value, "I004")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=1, column=1).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=2).value, "a001")
-        self.assertEqual(ws.cell(row=1, column=3).value, "(1, 1)")
-        self.assertEqual(ws.cell(row=1, column=4).value, "(1, 2)")
-        self.assertEqual(ws.cell(row=1, column=5).value, "(1, 3)")
-        self.assertEqual(ws.cell(row=1, column=6).value, "(1, 4)")
-        self.assertEqual(ws.cell(row=1, column=7).value, "(1, 5)")
-        self.assertEqual(ws.cell(row=1, column=8).value, "(1, 6)")
-        if six.PY2:
-            self.assertEqual(ws.cell(row=2, column=1).value, "I002")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=2, column=1).value, "I001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "a002")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(2, 1)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(2, 2)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(2, 3)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(2, 4)")
-        self.assertEqual(ws.cell(row=2, column=7).value, "(2, 5)")
-        self.assertEqual(ws.cell(row=2, column=8).value, "(2, 6)")
-        if six.PY2:
-            self.assertEqual(ws.cell(row=3, column=1).value, "I003")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=3, column=1).value, "I003")
-        self.assertEqual(ws.cell(row=3, column=2).value, "a003")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(3, 1)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(3, 2)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(3, 3)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(3, 4)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "(3, 5)")
-        self.assertEqual(ws.cell(row=3, column=8).value, "(3, 6)")
-        if six.PY2:
-            self.assertEqual(ws.cell(row=4, column=1).value, "I001")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=4, column=1).value, "I002")
-        self.assertEqual(ws.cell(row=4, column=2).value, "a004")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(4, 1)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(4, 2)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(4, 3)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(4, 4)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "(4, 5)")
-        self.assertEqual(ws.cell(row=4, column=8).value, "(4, 6)")
-        self.assertIsNone(ws.cell(row=5, column=1).value)
-        self.assertEqual(ws.cell(row=6, column=1).value, u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=7, column=1).value, u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_wells_1(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=24, scale='log')
-        iptg.shot_vol = 5.
-        p.apply_inducer(iptg, apply_to='wells')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "(1, 1)\nI001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "(1, 2)\nI002")
-        self.assertEqual(ws.cell(row=1, column=3).value, "(1, 3)\nI003")
-        self.assertEqual(ws.cell(row=1, column=4).value, "(1, 4)\nI004")
-        self.assertEqual(ws.cell(row=1, column=5).value, "(1, 5)\nI005")
-        self.assertEqual(ws.cell(row=1, column=6).value, "(1, 6)\nI006")
-        self.assertEqual(ws.cell(row=2, column=1).value, "(2, 1)\nI007")
-        self.assertEqual(ws.cell(row=2, column=2).value, "(2, 2)\nI008")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(2, 3)\nI009")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(2, 4)\nI010")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(2, 5)\nI011")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(2, 6)\nI012")
-        self.assertEqual(ws.cell(row=3, column=1).value, "(3, 1)\nI013")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(3, 2)\nI014")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(3, 3)\nI015")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(3, 4)\nI016")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(3, 5)\nI017")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(3, 6)\nI018")
-        self.assertEqual(ws.cell(row=4, column=1).value, "(4, 1)\nI019")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(4, 2)\nI020")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(4, 3)\nI021")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(4, 4)\nI022")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(4, 5)\nI023")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(4, 6)\nI024")
-        self.assertIsNone(ws.cell(row=5, column=1).value)
-        self.assertEqual(ws.cell(row=6, column=1).value, u"Add 5.00µL of IPTG to each well.")
-
-    def test_save_rep_setup_instructions_inducer_wells_2(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=24, scale='log')
-        iptg.shot_vol = 5.
-        p.apply_inducer(iptg, apply_to='wells')
-        # Create second inducer for plate
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.set_gradient(min=0.5, max=50, n=24, scale='log')
-        atc.shot_vol = 10.
-        p.apply_inducer(atc, apply_to='wells')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "(1, 1)\nI001\na001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "(1, 2)\nI002\na002")
-        self.assertEqual(ws.cell(row=1, column=3).value, "(1, 3)\nI003\na003")
-        self.assertEqual(ws.cell(row=1, column=4).value, "(1, 4)\nI004\na004")
-        self.assertEqual(ws.cell(row=1, column=5).value, "(1, 5)\nI005\na005")
-        self.assertEqual(ws.cell(row=1, column=6).value, "(1, 6)\nI006\na006")
-        self.assertEqual(ws.cell(row=2, column=1).value, "(2, 1)\nI007\na007")
-        self.assertEqual(ws.cell(row=2, column=2).value, "(2, 2)\nI008\na008")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(2, 3)\nI009\na009")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(2, 4)\nI010\na010")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(2, 5)\nI011\na011")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(2, 6)\nI012\na012")
-        self.assertEqual(ws.cell(row=3, column=1).value, "(3, 1)\nI013\na013")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(3, 2)\nI014\na014")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(3, 3)\nI015\na015")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(3, 4)\nI016\na016")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(3, 5)\nI017\na017")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(3, 6)\nI018\na018")
-        self.assertEqual(ws.cell(row=4, column=1).value, "(4, 1)\nI019\na019")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(4, 2)\nI020\na020")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(4, 3)\nI021\na021")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(4, 4)\nI022\na022")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(4, 5)\nI023\na023")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(4, 6)\nI024\na024")
-        self.assertIsNone(ws.cell(row=5, column=1).value)
-        self.assertEqual(ws.cell(row=6, column=1).value, u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=7, column=1).value, u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_wells_3(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.samples_to_measure = 12
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=12, scale='log')
-        iptg.shot_vol = 5.
-        # Apply inducer to plate
-        p.apply_inducer(iptg, apply_to='wells')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "(1, 1)\nI001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "(1, 2)\nI002")
-        self.assertEqual(ws.cell(row=1, column=3).value, "(1, 3)\nI003")
-        self.assertEqual(ws.cell(row=1, column=4).value, "(1, 4)\nI004")
-        self.assertEqual(ws.cell(row=1, column=5).value, "(1, 5)\nI005")
-        self.assertEqual(ws.cell(row=1, column=6).value, "(1, 6)\nI006")
-        self.assertEqual(ws.cell(row=2, column=1).value, "(2, 1)\nI007")
-        self.assertEqual(ws.cell(row=2, column=2).value, "(2, 2)\nI008")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(2, 3)\nI009")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(2, 4)\nI010")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(2, 5)\nI011")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(2, 6)\nI012")
-        self.assertEqual(ws.cell(row=3, column=1).value, "(3, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(3, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(3, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(3, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(3, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(3, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "(4, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(4, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(4, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(4, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(4, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(4, 6)")
-        self.assertIsNone(ws.cell(row=5, column=1).value)
-        self.assertEqual(ws.cell(row=6, column=1).value, u"Add 5.00µL of IPTG to each well.")
-
-    def test_save_rep_setup_instructions_inducer_wells_4(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=24, scale='log')
-        iptg.shot_vol = 5.
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='wells')
-        # Create second inducer for plate
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.set_gradient(min=0.5, max=50, n=24, scale='log')
-        atc.shot_vol = 10.
-        p.apply_inducer(atc, apply_to='wells')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        # Results after shuffling are different in python 2 and 3
-        ws = wb["Inducers for Plate P1"]
-        if six.PY2:
-            self.assertEqual(ws.cell(row=1, column=1).value, "(1, 1)\nI024\na001")
-            self.assertEqual(ws.cell(row=1, column=2).value, "(1, 2)\nI003\na002")
-            self.assertEqual(ws.cell(row=1, column=3).value, "(1, 3)\nI008\na003")
-            self.assertEqual(ws.cell(row=1, column=4).value, "(1, 4)\nI022\na004")
-            self.assertEqual(ws.cell(row=1, column=5).value, "(1, 5)\nI011\na005")
-            self.assertEqual(ws.cell(row=1, column=6).value, "(1, 6)\nI013\na006")
-            self.assertEqual(ws.cell(row=2, column=1).value, "(2, 1)\nI019\na007")
-            self.assertEqual(ws.cell(row=2, column=2).value, "(2, 2)\nI016\na008")
-            self.assertEqual(ws.cell(row=2, column=3).value, "(2, 3)\nI007\na009")
-            self.assertEqual(ws.cell(row=2, column=4).value, "(2, 4)\nI005\na010")
-            self.assertEqual(ws.cell(row=2, column=5).value, "(2, 5)\nI015\na011")
-            self.assertEqual(ws.cell(row=2, column=6).value, "(2, 6)\nI023\na012")
-            self.assertEqual(ws.cell(row=3, column=1).value, "(3, 1)\nI021\na013")
-            self.assertEqual(ws.cell(row=3, column=2).value, "(3, 2)\nI018\na014")
-            self.assertEqual(ws.cell(row=3, column=3).value, "(3, 3)\nI001\na015")
-            self.assertEqual(ws.cell(row=3, column=4).value, "(3, 4)\nI002\na016")
-            self.assertEqual(ws.cell(row=3, column=5).value, "(3, 5)\nI014\na017")
-            self.assertEqual(ws.cell(row=3, column=6).value, "(3, 6)\nI012\na018")
-            self.assertEqual(ws.cell(row=4, column=1).value, "(4, 1)\nI009\na019")
-            self.assertEqual(ws.cell(row=4, column=2).value, "(4, 2)\nI010\na020")
-            self.assertEqual(ws.cell(row=4, column=3).value, "(4, 3)\nI006\na021")
-            self.assertEqual(ws.cell(row=4, column=4).value, "(4, 4)\nI017\na022")
-            self.assertEqual(ws.cell(row=4, column=5).value, "(4, 5)\nI020\na023")
-            self.assertEqual(ws.cell(row=4, column=6).value, "(4, 6)\nI004\na024")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=1, column=1).value, "(1, 1)\nI021\na001")
-            self.assertEqual(ws.cell(row=1, column=2).value, "(1, 2)\nI012\na002")
-            self.assertEqual(ws.cell(row=1, column=3).value, "(1, 3)\nI024\na003")
-            self.assertEqual(ws.cell(row=1, column=4).value, "(1, 4)\nI018\na004")
-            self.assertEqual(ws.cell(row=1, column=5).value, "(1, 5)\nI022\na005")
-            self.assertEqual(ws.cell(row=1, column=6).value, "(1, 6)\nI014\na006")
-            self.assertEqual(ws.cell(row=2, column=1).value, "(2, 1)\nI006\na007")
-            self.assertEqual(ws.cell(row=2, column=2).value, "(2, 2)\nI011\na008")
-            self.assertEqual(ws.cell(row=2, column=3).value, "(2, 3)\nI010\na009")
-            self.assertEqual(ws.cell(row=2, column=4).value, "(2, 4)\nI007\na010")
-            self.assertEqual(ws.cell(row=2, column=5).value, "(2, 5)\nI001\na011")
-            self.assertEqual(ws.cell(row=2, column=6).value, "(2, 6)\nI008\na012")
-            self.assertEqual(ws.cell(row=3, column=1).value, "(3, 1)\nI002\na013")
-            self.assertEqual(ws.cell(row=3, column=2).value, "(3, 2)\nI020\na014")
-            self.assertEqual(ws.cell(row=3, column=3).value, "(3, 3)\nI017\na015")
-            self.assertEqual(ws.cell(row=3, column=4).value, "(3, 4)\nI013\na016")
-            self.assertEqual(ws.cell(row=3, column=5).value, "(3, 5)\nI023\na017")
-            self.assertEqual(ws.cell(row=3, column=6).value, "(3, 6)\nI015\na018")
-            self.assertEqual(ws.cell(row=4, column=1).value, "(4, 1)\nI016\na019")
-            self.assertEqual(ws.cell(row=4, column=2).value, "(4, 2)\nI004\na020")
-            self.assertEqual(ws.cell(row=4, column=3).value, "(4, 3)\nI009\na021")
-            self.assertEqual(ws.cell(row=4, column=4).value, "(4, 4)\nI003\na022")
-            self.assertEqual(ws.cell(row=4, column=5).value, "(4, 5)\nI019\na023")
-            self.assertEqual(ws.cell(row=4, column=6).value, "(4, 6)\nI005\na024")
-        self.assertIsNone(ws.cell(row=5, column=1).value)
-        self.assertEqual(ws.cell(row=6, column=1).value, u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=7, column=1).value, u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_media_1(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        # Set single concentration
-        iptg.concentrations = [12]
-        # Apply inducer to plate
-        p.apply_inducer(iptg, apply_to='media')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "(1, 1)")
-        self.assertEqual(ws.cell(row=1, column=2).value, "(1, 2)")
-        self.assertEqual(ws.cell(row=1, column=3).value, "(1, 3)")
-        self.assertEqual(ws.cell(row=1, column=4).value, "(1, 4)")
-        self.assertEqual(ws.cell(row=1, column=5).value, "(1, 5)")
-        self.assertEqual(ws.cell(row=1, column=6).value, "(1, 6)")
-        self.assertEqual(ws.cell(row=2, column=1).value, "(2, 1)")
-        self.assertEqual(ws.cell(row=2, column=2).value, "(2, 2)")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(2, 3)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(2, 4)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(2, 5)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(2, 6)")
-        self.assertEqual(ws.cell(row=3, column=1).value, "(3, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(3, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(3, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(3, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(3, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(3, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "(4, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(4, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(4, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(4, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(4, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(4, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value,
-                         u"Add 5.00µL of IPTG to media.")
-
-    def test_save_rep_setup_instructions_inducer_media_2(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        # Set single concentration
-        iptg.concentrations = [12]
-        # Apply inducer to plate
-        p.apply_inducer(iptg, apply_to='media')
-        # Create inducer for plate
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        # Set single concentration
-        atc.concentrations = [2]
-        # Apply inducer to plate
-        p.apply_inducer(atc, apply_to='media')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "(1, 1)")
-        self.assertEqual(ws.cell(row=1, column=2).value, "(1, 2)")
-        self.assertEqual(ws.cell(row=1, column=3).value, "(1, 3)")
-        self.assertEqual(ws.cell(row=1, column=4).value, "(1, 4)")
-        self.assertEqual(ws.cell(row=1, column=5).value, "(1, 5)")
-        self.assertEqual(ws.cell(row=1, column=6).value, "(1, 6)")
-        self.assertEqual(ws.cell(row=2, column=1).value, "(2, 1)")
-        self.assertEqual(ws.cell(row=2, column=2).value, "(2, 2)")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(2, 3)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(2, 4)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(2, 5)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(2, 6)")
-        self.assertEqual(ws.cell(row=3, column=1).value, "(3, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(3, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(3, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(3, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(3, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(3, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "(4, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(4, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(4, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(4, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(4, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(4, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value,
-                         u"Add 5.00µL of IPTG to media.")
-        self.assertEqual(ws.cell(row=7, column=1).value,
-                         u"Add 10.00µL of aTc to media.")
-
-    def test_save_rep_setup_instructions_inducer_mixed(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=6, scale='log')
-        # Apply inducer to plate
-        p.apply_inducer(iptg, apply_to='rows')
-
-        # Create second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        # Set concentrations from gradient
-        atc.set_gradient(min=0.5, max=50, n=4, scale='log')
-        # Apply inducer to plate
-        p.apply_inducer(atc, apply_to='cols')
-
-        # Create inducer for plate wells
-        xyl = platedesign.inducer.ChemicalInducer(
-            name='Xylose',
-            units=u'%')
-        xyl.shot_vol = 3.
-        # Set concentrations from gradient
-        xyl.set_gradient(min=1e-6, max=1e-3, n=24, scale='log')
-        # Apply inducer to plate
-        p.apply_inducer(xyl, apply_to='wells')
-
-        # Create inducer for plate
-        sugar = platedesign.inducer.ChemicalInducer(
-            name='Sugar',
-            units=u'ng/µL')
-        sugar.shot_vol = 8.
-        # Set single concentration
-        sugar.concentrations = [2]
-        # Apply inducer to plate
-        p.apply_inducer(sugar, apply_to='media')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate P1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, None)
-        self.assertEqual(ws.cell(row=1, column=2).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=3).value, "I002")
-        self.assertEqual(ws.cell(row=1, column=4).value, "I003")
-        self.assertEqual(ws.cell(row=1, column=5).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=6).value, "I005")
-        self.assertEqual(ws.cell(row=1, column=7).value, "I006")
-        self.assertEqual(ws.cell(row=2, column=1).value, "a001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "(1, 1)\nX001")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(1, 2)\nX002")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(1, 3)\nX003")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(1, 4)\nX004")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(1, 5)\nX005")
-        self.assertEqual(ws.cell(row=2, column=7).value, "(1, 6)\nX006")
-        self.assertEqual(ws.cell(row=3, column=1).value, "a002")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(2, 1)\nX007")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(2, 2)\nX008")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(2, 3)\nX009")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(2, 4)\nX010")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(2, 5)\nX011")
-        self.assertEqual(ws.cell(row=3, column=7).value, "(2, 6)\nX012")
-        self.assertEqual(ws.cell(row=4, column=1).value, "a003")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(3, 1)\nX013")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(3, 2)\nX014")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(3, 3)\nX015")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(3, 4)\nX016")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(3, 5)\nX017")
-        self.assertEqual(ws.cell(row=4, column=7).value, "(3, 6)\nX018")
-        self.assertEqual(ws.cell(row=5, column=1).value, "a004")
-        self.assertEqual(ws.cell(row=5, column=2).value, "(4, 1)\nX019")
-        self.assertEqual(ws.cell(row=5, column=3).value, "(4, 2)\nX020")
-        self.assertEqual(ws.cell(row=5, column=4).value, "(4, 3)\nX021")
-        self.assertEqual(ws.cell(row=5, column=5).value, "(4, 4)\nX022")
-        self.assertEqual(ws.cell(row=5, column=6).value, "(4, 5)\nX023")
-        self.assertEqual(ws.cell(row=5, column=7).value, "(4, 6)\nX024")
-        self.assertEqual(ws.cell(row=7, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=8, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-        self.assertEqual(ws.cell(row=9, column=1).value,
-                         u"Add 3.00µL of Xylose to each well.")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 8.00µL of Sugar to media.")
-
-    def test_save_rep_setup_instructions_cells_and_inducer(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.total_media_vol = 15000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_initial_od600 = 1e-5
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=6, scale='log')
-        # Apply inducer to plate
-        p.apply_inducer(iptg, apply_to='rows')
-
-        # Create second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        # Set concentrations from gradient
-        atc.set_gradient(min=0.5, max=50, n=4, scale='log')
-        # Apply inducer to plate
-        p.apply_inducer(atc, apply_to='cols')
-
-        # Create inducer for plate wells
-        xyl = platedesign.inducer.ChemicalInducer(
-            name='Xylose',
-            units=u'%')
-        xyl.shot_vol = 3.
-        # Set concentrations from gradient
-        xyl.set_gradient(min=1e-6, max=1e-3, n=24, scale='log')
-        # Apply inducer to plate
-        p.apply_inducer(xyl, apply_to='wells')
-
-        # Create inducer for plate
-        sugar = platedesign.inducer.ChemicalInducer(
-            name='Sugar',
-            units=u'ng/µL')
-        sugar.shot_vol = 8.
-        # Set single concentration
-        sugar.concentrations = [2]
-        # Apply inducer to plate
-        p.apply_inducer(sugar, apply_to='media')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Check that sheet exists in spreadsheet
-        self.assertTrue("Inducers for Plate P1" in wb.sheetnames)
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, None)
-        self.assertEqual(ws.cell(row=1, column=2).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=3).value, "I002")
-        self.assertEqual(ws.cell(row=1, column=4).value, "I003")
-        self.assertEqual(ws.cell(row=1, column=5).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=6).value, "I005")
-        self.assertEqual(ws.cell(row=1, column=7).value, "I006")
-        self.assertEqual(ws.cell(row=2, column=1).value, "a001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "(1, 1)\nX001")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(1, 2)\nX002")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(1, 3)\nX003")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(1, 4)\nX004")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(1, 5)\nX005")
-        self.assertEqual(ws.cell(row=2, column=7).value, "(1, 6)\nX006")
-        self.assertEqual(ws.cell(row=3, column=1).value, "a002")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(2, 1)\nX007")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(2, 2)\nX008")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(2, 3)\nX009")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(2, 4)\nX010")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(2, 5)\nX011")
-        self.assertEqual(ws.cell(row=3, column=7).value, "(2, 6)\nX012")
-        self.assertEqual(ws.cell(row=4, column=1).value, "a003")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(3, 1)\nX013")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(3, 2)\nX014")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(3, 3)\nX015")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(3, 4)\nX016")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(3, 5)\nX017")
-        self.assertEqual(ws.cell(row=4, column=7).value, "(3, 6)\nX018")
-        self.assertEqual(ws.cell(row=5, column=1).value, "a004")
-        self.assertEqual(ws.cell(row=5, column=2).value, "(4, 1)\nX019")
-        self.assertEqual(ws.cell(row=5, column=3).value, "(4, 2)\nX020")
-        self.assertEqual(ws.cell(row=5, column=4).value, "(4, 3)\nX021")
-        self.assertEqual(ws.cell(row=5, column=5).value, "(4, 4)\nX022")
-        self.assertEqual(ws.cell(row=5, column=6).value, "(4, 5)\nX023")
-        self.assertEqual(ws.cell(row=5, column=7).value, "(4, 6)\nX024")
-        self.assertEqual(ws.cell(row=7, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=8, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-        self.assertEqual(ws.cell(row=9, column=1).value,
-                         u"Add 3.00µL of Xylose to each well.")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 8.00µL of Sugar to media.")
-
-        # Check that sheet exists in spreadsheet
-        self.assertTrue("Cells for Plate P1" in wb.sheetnames)
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=3, column=2).value, 100)
-        self.assertEqual(ws.cell(row=3, column=3).value, "x")
-        self.assertEqual(ws.cell(row=4, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=4, column=2).value, 990)
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 10)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=6, column=1).value, "Predilution OD600")
-        self.assertEqual(ws.cell(row=6, column=2).value, None)
-        self.assertEqual(ws.cell(row=6, column=3).value, None)
-        self.assertTrue('A7:C7' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=7, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Target OD600")
-        self.assertEqual(ws.cell(row=8, column=2).value, 1e-5)
-        self.assertEqual(ws.cell(row=8, column=3).value, None)
-        self.assertEqual(ws.cell(row=9, column=1).value, "Predilution volume")
-        test_excel_division_formula(self, ws.cell(row=9, column=2).value, 0.15, "B6")
-        self.assertEqual(ws.cell(row=9, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=10, column=1).value, "Add into 15.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_cells_and_inducer_workbook(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.total_media_vol = 15000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_initial_od600 = 1e-5
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        # Set concentrations from gradient
-        iptg.set_gradient(min=1e-6, max=1e-3, n=6, scale='log')
-        # Apply inducer to plate
-        p.apply_inducer(iptg, apply_to='rows')
-
-        # Create second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        # Set concentrations from gradient
-        atc.set_gradient(min=0.5, max=50, n=4, scale='log')
-        # Apply inducer to plate
-        p.apply_inducer(atc, apply_to='cols')
-
-        # Create inducer for plate wells
-        xyl = platedesign.inducer.ChemicalInducer(
-            name='Xylose',
-            units=u'%')
-        xyl.shot_vol = 3.
-        # Set concentrations from gradient
-        xyl.set_gradient(min=1e-6, max=1e-3, n=24, scale='log')
-        # Apply inducer to plate
-        p.apply_inducer(xyl, apply_to='wells')
-
-        # Create inducer for plate
-        sugar = platedesign.inducer.ChemicalInducer(
-            name='Sugar',
-            units=u'ng/µL')
-        sugar.shot_vol = 8.
-        # Set single concentration
-        sugar.concentrations = [2]
-        # Apply inducer to plate
-        p.apply_inducer(sugar, apply_to='media')
-
-        # Create new spreadsheet
-        wb = openpyxl.Workbook()
-        # Save instructions on existing spreadsheet
-        p.save_rep_setup_instructions(workbook=wb)
-
-        # Check that sheet exists in spreadsheet
-        self.assertTrue("Inducers for Plate P1" in wb.sheetnames)
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "")
-        self.assertEqual(ws.cell(row=1, column=2).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=3).value, "I002")
-        self.assertEqual(ws.cell(row=1, column=4).value, "I003")
-        self.assertEqual(ws.cell(row=1, column=5).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=6).value, "I005")
-        self.assertEqual(ws.cell(row=1, column=7).value, "I006")
-        self.assertEqual(ws.cell(row=2, column=1).value, "a001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "(1, 1)\nX001")
-        self.assertEqual(ws.cell(row=2, column=3).value, "(1, 2)\nX002")
-        self.assertEqual(ws.cell(row=2, column=4).value, "(1, 3)\nX003")
-        self.assertEqual(ws.cell(row=2, column=5).value, "(1, 4)\nX004")
-        self.assertEqual(ws.cell(row=2, column=6).value, "(1, 5)\nX005")
-        self.assertEqual(ws.cell(row=2, column=7).value, "(1, 6)\nX006")
-        self.assertEqual(ws.cell(row=3, column=1).value, "a002")
-        self.assertEqual(ws.cell(row=3, column=2).value, "(2, 1)\nX007")
-        self.assertEqual(ws.cell(row=3, column=3).value, "(2, 2)\nX008")
-        self.assertEqual(ws.cell(row=3, column=4).value, "(2, 3)\nX009")
-        self.assertEqual(ws.cell(row=3, column=5).value, "(2, 4)\nX010")
-        self.assertEqual(ws.cell(row=3, column=6).value, "(2, 5)\nX011")
-        self.assertEqual(ws.cell(row=3, column=7).value, "(2, 6)\nX012")
-        self.assertEqual(ws.cell(row=4, column=1).value, "a003")
-        self.assertEqual(ws.cell(row=4, column=2).value, "(3, 1)\nX013")
-        self.assertEqual(ws.cell(row=4, column=3).value, "(3, 2)\nX014")
-        self.assertEqual(ws.cell(row=4, column=4).value, "(3, 3)\nX015")
-        self.assertEqual(ws.cell(row=4, column=5).value, "(3, 4)\nX016")
-        self.assertEqual(ws.cell(row=4, column=6).value, "(3, 5)\nX017")
-        self.assertEqual(ws.cell(row=4, column=7).value, "(3, 6)\nX018")
-        self.assertEqual(ws.cell(row=5, column=1).value, "a004")
-        self.assertEqual(ws.cell(row=5, column=2).value, "(4, 1)\nX019")
-        self.assertEqual(ws.cell(row=5, column=3).value, "(4, 2)\nX020")
-        self.assertEqual(ws.cell(row=5, column=4).value, "(4, 3)\nX021")
-        self.assertEqual(ws.cell(row=5, column=5).value, "(4, 4)\nX022")
-        self.assertEqual(ws.cell(row=5, column=6).value, "(4, 5)\nX023")
-        self.assertEqual(ws.cell(row=5, column=7).value, "(4, 6)\nX024")
-        self.assertEqual(ws.cell(row=7, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=8, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-        self.assertEqual(ws.cell(row=9, column=1).value,
-                         u"Add 3.00µL of Xylose to each well.")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 8.00µL of Sugar to media.")
-
-        # Check that sheet exists in spreadsheet
-        self.assertTrue("Cells for Plate P1" in wb.sheetnames)
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate P1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=3, column=2).value, 100)
-        self.assertEqual(ws.cell(row=3, column=3).value, "x")
-        self.assertEqual(ws.cell(row=4, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=4, column=2).value, 990)
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 10)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=6, column=1).value, "Predilution OD600")
-        self.assertEqual(ws.cell(row=6, column=2).value, None)
-        self.assertEqual(ws.cell(row=6, column=3).value, None)
-        self.assertTrue('A7:C7' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=7, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Target OD600")
-        self.assertEqual(ws.cell(row=8, column=2).value, 1e-5)
-        self.assertEqual(ws.cell(row=8, column=3).value, None)
-        self.assertEqual(ws.cell(row=9, column=1).value, "Predilution volume")
-        test_excel_division_formula(self, ws.cell(row=9, column=2).value, 0.15, "B6")
-        self.assertEqual(ws.cell(row=9, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=10, column=1).value, "Add into 15.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_argument_error(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        # Run save_rep_setup_instructions with no arguments
-        self.assertRaises(ValueError, p.save_rep_setup_instructions)
-
-    def test_save_rep_setup_files(self):
+        # Run save_rep_setup_instructions with no arguments
+        self.assertRaises(ValueError, p.save_rep_setup_instructions)
+
+    def test_save_rep_setup_files(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         # Check that save_rep_setup_files runs successfully
@@ -1988,17 +1739,14 @@ class TestPlate(unittest.TestCase):
         # Get the only closed place
         cp = cps[0]
         # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
+        self._assert_basic(cp)
         # Check plate info
         self.assertEqual(len(cp.plate_info), 1)
         self.assertTrue('Strain' in cp.plate_info)
         self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
         # Check well info
-        well_info = pandas.DataFrame()
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
+        well_info = pandas.DataFrame({'Measure': [True]*24})
+        pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
     def test_close_plates_resources(self):
         # Create plate
@@ -2013,9 +1761,7 @@ class TestPlate(unittest.TestCase):
         # Get the only closed place
         cp = cps[0]
         # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
+        self._assert_basic(cp)
         # Check plate info
         self.assertEqual(len(cp.plate_info), 3)
         self.assertTrue('Strain' in cp.plate_info)
@@ -2025,9 +1771,8 @@ class TestPlate(unittest.TestCase):
         self.assertTrue('Thermometer' in cp.plate_info)
         self.assertEqual(cp.plate_info['Thermometer'], 'Alcohol thermometer 1')
         # Check well info
-        well_info = pandas.DataFrame()
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
+        well_info = pandas.DataFrame({'Measure': [True]*24})
+        pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
     def test_close_plates_resources_error_1(self):
         # Create plate
@@ -2055,9 +1800,7 @@ class TestPlate(unittest.TestCase):
         # Get the only closed place
         cp = cps[0]
         # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
+        self._assert_basic(cp)
         # Check plate info
         self.assertEqual(len(cp.plate_info), 3)
         self.assertTrue('Strain' in cp.plate_info)
@@ -2067,9 +1810,8 @@ class TestPlate(unittest.TestCase):
         self.assertTrue('Meta 2' in cp.plate_info)
         self.assertEqual(cp.plate_info['Meta 2'], 'Value 2')
         # Check well info
-        well_info = pandas.DataFrame()
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
+        well_info = pandas.DataFrame({'Measure': [True]*24})
+        pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
     def test_close_plates_cell_inoculation_1(self):
         # Create plate
@@ -2084,9 +1826,7 @@ class TestPlate(unittest.TestCase):
         # Get the only closed place
         cp = cps[0]
         # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
+        self._assert_basic(cp)
         # Check plate info
         self.assertEqual(len(cp.plate_info), 3)
         self.assertTrue('Strain' in cp.plate_info)
@@ -2096,9 +1836,8 @@ class TestPlate(unittest.TestCase):
         self.assertTrue('Initial OD600' in cp.plate_info)
         self.assertEqual(cp.plate_info['Initial OD600'], 1e-5)
         # Check well info
-        well_info = pandas.DataFrame()
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
+        well_info = pandas.DataFrame({'Measure': [True]*24})
+        pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
     def test_close_plates_cell_inoculation_2(self):
         # Create plate
@@ -2115,9 +1854,7 @@ class TestPlate(unittest.TestCase):
         # Get the only closed place
         cp = cps[0]
         # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
+        self._assert_basic(cp)
         # Check plate info
         self.assertEqual(len(cp.plate_info), 3)
         self.assertTrue('Strain' in cp.plate_info)
@@ -2127,9 +1864,8 @@ class TestPlate(unittest.TestCase):
         self.assertTrue('Initial OD600' in cp.plate_info)
         self.assertEqual(cp.plate_info['Initial OD600'], 1e-5)
         # Check well info
-        well_info = pandas.DataFrame()
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
+        well_info = pandas.DataFrame({'Measure': [True]*24})
+        pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
     def test_close_plates_cell_inoculation_3(self):
         # Create plate
@@ -2144,9 +1880,7 @@ class TestPlate(unittest.TestCase):
         # Get the only closed place
         cp = cps[0]
         # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
+        self._assert_basic(cp)
         # Check plate info
         self.assertEqual(len(cp.plate_info), 3)
         self.assertTrue('Strain' in cp.plate_info)
@@ -2156,9 +1890,8 @@ class TestPlate(unittest.TestCase):
         self.assertTrue('Cell Inoculated Vol.' in cp.plate_info)
         self.assertEqual(cp.plate_info['Cell Inoculated Vol.'], 5)
         # Check well info
-        well_info = pandas.DataFrame()
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
+        well_info = pandas.DataFrame({'Measure': [True]*24})
+        pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
     def test_close_plates_cell_inoculation_4(self):
         # Create plate
@@ -2175,9 +1908,7 @@ class TestPlate(unittest.TestCase):
         # Get the only closed place
         cp = cps[0]
         # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
+        self._assert_basic(cp)
         # Check plate info
         self.assertEqual(len(cp.plate_info), 3)
         self.assertTrue('Strain' in cp.plate_info)
@@ -2187,9 +1918,8 @@ class TestPlate(unittest.TestCase):
         self.assertTrue('Cell Inoculated Vol.' in cp.plate_info)
         self.assertEqual(cp.plate_info['Cell Inoculated Vol.'], 5)
         # Check well info
-        well_info = pandas.DataFrame()
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
+        well_info = pandas.DataFrame({'Measure': [True]*24})
+        pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
     def test_close_plates_cell_inoculation_5(self):
         # Create plate
@@ -2204,9 +1934,7 @@ class TestPlate(unittest.TestCase):
         # Get the only closed place
         cp = cps[0]
         # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
+        self._assert_basic(cp)
         # Check plate info
         self.assertEqual(len(cp.plate_info), 3)
         self.assertTrue('Strain' in cp.plate_info)
@@ -2216,9 +1944,8 @@ class TestPlate(unittest.TestCase):
         self.assertTrue('Total Cell Dilution' in cp.plate_info)
         self.assertEqual(cp.plate_info['Total Cell Dilution'], 1e4)
         # Check well info
-        well_info = pandas.DataFrame()
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
+        well_info = pandas.DataFrame({'Measure': [True]*24})
+        pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
     def test_close_plates_cell_inoculation_6(self):
         # Create plate
@@ -2235,9 +1962,7 @@ class TestPlate(unittest.TestCase):
         # Get the only closed place
         cp = cps[0]
         # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
+        self._assert_basic(cp)
         # Check plate info
         self.assertEqual(len(cp.plate_info), 3)
         self.assertTrue('Strain' in cp.plate_info)
@@ -2247,5639 +1972,1097 @@ class TestPlate(unittest.TestCase):
         self.assertTrue('Total Cell Dilution' in cp.plate_info)
         self.assertEqual(cp.plate_info['Total Cell Dilution'], 1e5)
         # Check well info
-        well_info = pandas.DataFrame()
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
+        well_info = pandas.DataFrame({'Measure': [True]*24})
+        pandas.testing.assert_frame_equal(cp.well_info, well_info)
+
+    def test_close_plates_inducer(self):
+        for case_name, samples_to_measure, inducers, inducer_columns in \
+                CLOSE_PLATES_INDUCER_CASES:
+            # Reset random seed so that shuffling is reproducible
+            random.seed(1)
+            # Create plate
+            p = platedesign.plate.Plate(name='P1')
+            p.samples_to_measure = samples_to_measure
+            p.cell_strain_name = 'Test strain 1'
+            # Create and apply inducers
+            for inducer_args in inducers:
+                apply_chemical_inducer(p, *inducer_args)
+
+            # Call close plates and check length of output
+            cps = p.close_plates()
+            self.assertEqual(len(cps), 1, msg=case_name)
+            # Get the only closed place
+            cp = cps[0]
+            # Check basic properties
+            self._assert_basic(cp, msg=case_name)
+            # Check plate info
+            self.assertEqual(len(cp.plate_info), 1, msg=case_name)
+            self.assertTrue('Strain' in cp.plate_info, msg=case_name)
+            self.assertEqual(cp.plate_info['Strain'],
+                             'Test strain 1',
+                             msg=case_name)
+            # Check well info. The case name is reported as the name of the
+            # compared object.
+            well_info = pandas.DataFrame(collections.OrderedDict(
+                inducer_columns +
+                [('Measure', [True]*samples_to_measure +
+                             [False]*(24 - samples_to_measure))]))
+            pandas.testing.assert_frame_equal(
+                cp.well_info,
+                well_info,
+                obj='well_info of case {}'.format(case_name))
 
-    def test_close_plates_inducer_row_1(self):
+    def test_close_plates_combined(self):
         # Create plate
         p = platedesign.plate.Plate(name='P1')
         p.cell_strain_name = 'Test strain 1'
+        # Add some resources
+        p.resources['Incubator'] = ['Incubator 1']
+        p.resources['Thermometer'] = ['Alcohol thermometer 1']
+        # Add some metadata
+        p.metadata['Meta 1'] = 'Value 1'
+        p.metadata['Meta 2'] = 'Value 2'
+        # Add cell inoculation info
+        p.cell_setup_method = 'fixed_volume'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_shot_vol = 5
 
         # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
+        iptg = _ChemicalInducer(
             name='IPTG',
             units=u'µM')
         iptg.concentrations = [3, 4, 5, 6, 7, 8]
         p.apply_inducer(iptg, apply_to='rows')
 
+        # Second inducer for plate columns
+        atc = _ChemicalInducer(
+            name='aTc',
+            units=u'ng/µL')
+        atc.concentrations = [0.1, 0.2, 0.3, 0.4]
+        p.apply_inducer(atc, apply_to='cols')
+
         # Call close plates and check length of output
         cps = p.close_plates()
         self.assertEqual(len(cps), 1)
         # Get the only closed place
         cp = cps[0]
         # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
+        self._assert_basic(cp)
+
         # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
+        self.assertEqual(len(cp.plate_info), 7)
         self.assertTrue('Strain' in cp.plate_info)
         self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [3., 4., 5., 6., 7., 8.,
-                                                 3., 4., 5., 6., 7., 8.,
-                                                 3., 4., 5., 6., 7., 8.,
-                                                 3., 4., 5., 6., 7., 8.]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_row_2(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3, 4, 5, 6, 7, 8]
-        p.apply_inducer(iptg, apply_to='rows')
-
-        # Second inducer for plate rows
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
-        p.apply_inducer(atc, apply_to='rows')
+        self.assertTrue('Incubator' in cp.plate_info)
+        self.assertEqual(cp.plate_info['Incubator'], 'Incubator 1')
+        self.assertTrue('Thermometer' in cp.plate_info)
+        self.assertEqual(cp.plate_info['Thermometer'], 'Alcohol thermometer 1')
+        self.assertTrue('Meta 1' in cp.plate_info)
+        self.assertEqual(cp.plate_info['Meta 1'], 'Value 1')
+        self.assertTrue('Meta 2' in cp.plate_info)
+        self.assertEqual(cp.plate_info['Meta 2'], 'Value 2')
+        self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
+        self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 100)
+        self.assertTrue('Cell Inoculated Vol.' in cp.plate_info)
+        self.assertEqual(cp.plate_info['Cell Inoculated Vol.'], 5)
 
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
         # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [3., 4., 5., 6., 7., 8.,
-                                                 3., 4., 5., 6., 7., 8.,
-                                                 3., 4., 5., 6., 7., 8.,
-                                                 3., 4., 5., 6., 7., 8.]
-        well_info[u'aTc Concentration (ng/µL)'] = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-                                                   0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-                                                   0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-                                                   0.1, 0.2, 0.3, 0.4, 0.5, 0.6,]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_row_3(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
+        well_info = pandas.DataFrame(collections.OrderedDict([
+            (u'IPTG Concentration (µM)', [3., 4., 5., 6., 7., 8.,
+                                          3., 4., 5., 6., 7., 8.,
+                                          3., 4., 5., 6., 7., 8.,
+                                          3., 4., 5., 6., 7., 8.]),
+            (u'aTc Concentration (ng/µL)', [0.1, 0.1, 0.1, 0.1, 0.1, 0.1,
+                                            0.2, 0.2, 0.2, 0.2, 0.2, 0.2,
+                                            0.3, 0.3, 0.3, 0.3, 0.3, 0.3,
+                                            0.4, 0.4, 0.4, 0.4, 0.4, 0.4,]),
+            ('Measure', [True]*24)]))
+        pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3, 4, 5, 6, 7, 8]
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='rows')
+class TestPlateArray(unittest.TestCase):
+    """
+    Tests for the PlateArray class
 
-        # Second inducer for plate rows
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
-        p.apply_inducer(atc, apply_to='rows')
+    """
+    @classmethod
+    def setUpClass(cls):
+        # Directory where to save temporary files, shared by all tests. It is
+        # unique to this process, so parallel test processes do not collide.
+        cls.temp_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        # Delete temporary directory
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
 
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        # Results of shuffling are different in python 2 and 3
-        if six.PY2:
-            well_info[u'IPTG Concentration (µM)'] = [4., 5., 8., 6., 7., 3.,
-                                                     4., 5., 8., 6., 7., 3.,
-                                                     4., 5., 8., 6., 7., 3.,
-                                                     4., 5., 8., 6., 7., 3.,]
-        elif six.PY3:
-            well_info[u'IPTG Concentration (µM)'] = [5., 6., 8., 3., 7., 4.,
-                                                     5., 6., 8., 3., 7., 4.,
-                                                     5., 6., 8., 3., 7., 4.,
-                                                     5., 6., 8., 3., 7., 4.,]
-        well_info[u'aTc Concentration (ng/µL)'] = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-                                                   0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-                                                   0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-                                                   0.1, 0.2, 0.3, 0.4, 0.5, 0.6,]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_col_1(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
+    def _xlsx_path(self):
+        """
+        Get path of a spreadsheet file in the temporary directory, named
+        after the running test.
 
-        # Create inducer for plate columns
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3, 4, 5, 6]
-        p.apply_inducer(iptg, apply_to='cols')
+        """
+        return os.path.join(self.temp_dir, self._testMethodName + '.xlsx')
 
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [3., 3., 3., 3., 3., 3.,
-                                                 4., 4., 4., 4., 4., 4.,
-                                                 5., 5., 5., 5., 5., 5.,
-                                                 6., 6., 6., 6., 6., 6.,]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_col_2(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
+    def setUp(self):
+        # Set random seed
+        random.seed(1)
+        # Plate array used by most tests
+        self.p = create_plate_array()
 
-        # Create inducer for plate columns
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3, 4, 5, 6]
-        p.apply_inducer(iptg, apply_to='cols')
+    def test_create(self):
+        p = _PlateArray(name='A1',
+                        array_n_rows=2,
+                        array_n_cols=3,
+                        plate_names=list(PLATE_NAMES_6))
 
-        # Second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = [0.1, 0.2, 0.3, 0.4]
-        p.apply_inducer(atc, apply_to='cols')
+    def test_create_dim_mismatch_error(self):
+        self.assertRaises(ValueError, _PlateArray, **DIM_MISMATCH_KWARGS)
 
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [3., 3., 3., 3., 3., 3.,
-                                                 4., 4., 4., 4., 4., 4.,
-                                                 5., 5., 5., 5., 5., 5.,
-                                                 6., 6., 6., 6., 6., 6.,]
-        well_info[u'aTc Concentration (ng/µL)'] = [0.1, 0.1, 0.1, 0.1, 0.1, 0.1,
-                                                   0.2, 0.2, 0.2, 0.2, 0.2, 0.2,
-                                                   0.3, 0.3, 0.3, 0.3, 0.3, 0.3,
-                                                   0.4, 0.4, 0.4, 0.4, 0.4, 0.4,]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_col_3(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
+    def test_default_attributes(self):
+        p = self.p
+        # Check all attributes
+        expected_attrs = expected_plate_array_attrs(2, 3)
+        attrs = {k: getattr(p, k) for k in expected_attrs}
+        self.assertEqual(attrs, expected_attrs)
 
-        # Create inducer for plate columns
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3, 4, 5, 6]
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='cols')
+    def test_non_default_attributes(self):
+        p = _PlateArray(name='A1',
+                        array_n_rows=2,
+                        array_n_cols=3,
+                        plate_names=list(PLATE_NAMES_6),
+                        plate_n_rows=8,
+                        plate_n_cols=12)
+        # Check all attributes
+        expected_attrs = expected_plate_array_attrs(2, 3, 8, 12)
+        attrs = {k: getattr(p, k) for k in expected_attrs}
+        self.assertEqual(attrs, expected_attrs)
 
-        # Second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = [0.1, 0.2, 0.3, 0.4]
-        p.apply_inducer(atc, apply_to='cols')
+    def test_apply_inducer_media_vol_1(self):
+        p = self.p
+        # Set media volume
+        p.total_media_vol = 80000
+        p.sample_media_vol = 500
+        # Get media volume for inducer application
+        self.assertEqual(p.apply_inducer_media_vol('rows'), 500)
+        self.assertEqual(p.apply_inducer_media_vol('cols'), 500)
+        self.assertEqual(p.apply_inducer_media_vol('wells'), 500)
+        self.assertEqual(p.apply_inducer_media_vol('media'), 80000)
 
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        # Results of shuffling are different in python 2 and 3
-        if six.PY2:
-            well_info[u'IPTG Concentration (µM)'] = [6., 6., 6., 6., 6., 6.,
-                                                     4., 4., 4., 4., 4., 4.,
-                                                     5., 5., 5., 5., 5., 5.,
-                                                     3., 3., 3., 3., 3., 3.,]
-        elif six.PY3:
-            well_info[u'IPTG Concentration (µM)'] = [6., 6., 6., 6., 6., 6.,
-                                                     3., 3., 3., 3., 3., 3.,
-                                                     5., 5., 5., 5., 5., 5.,
-                                                     4., 4., 4., 4., 4., 4.,]
-        well_info[u'aTc Concentration (ng/µL)'] = [0.1, 0.1, 0.1, 0.1, 0.1, 0.1,
-                                                   0.2, 0.2, 0.2, 0.2, 0.2, 0.2,
-                                                   0.3, 0.3, 0.3, 0.3, 0.3, 0.3,
-                                                   0.4, 0.4, 0.4, 0.4, 0.4, 0.4,]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_wells_1(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
+    def test_apply_inducer_media_vol_error_1(self):
+        p = self.p
+        # Set media volume
+        p.total_media_vol = 80000
+        p.sample_media_vol = 500
+        # Limit number of samples to measure
+        p.samples_to_measure = 80
+        # Get media volume for inducer application
+        self.assertEqual(p.apply_inducer_media_vol('wells'), 500)
+        self.assertEqual(p.apply_inducer_media_vol('media'), 80000)
+        # Verify that exception is raised for 'rows' and 'cols'
+        self.assertRaises(ValueError, p.apply_inducer_media_vol, 'rows')
+        self.assertRaises(ValueError, p.apply_inducer_media_vol, 'cols')
 
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(24) + 1
+    def test_apply_inducer_media_vol_errors(self):
+        # Each case contains media volume attributes to set, the 'apply_to'
+        # argument, and the expected exception
+        cases = [
+            ({'total_media_vol': 80000, 'sample_media_vol': 500},
+             'all',
+             ValueError),
+            ({'total_media_vol': 80000}, 'rows', AttributeError),
+            ({'sample_media_vol': 500}, 'rows', AttributeError),
+            ({}, 'rows', AttributeError),
+        ]
+        for attrs, apply_to, exception in cases:
+            msg = "attrs={}, apply_to={}".format(attrs, apply_to)
+            p = create_plate_array()
+            for attr, value in attrs.items():
+                setattr(p, attr, value)
+            # Verify that exception is raised
+            assert_raises_msg(self,
+                              exception,
+                              msg,
+                              p.apply_inducer_media_vol,
+                              apply_to)
+
+    def test_apply_inducer_n_shots(self):
+        p = self.p
+        # Get number of shots for inducer application
+        self.assertEqual(p.apply_inducer_n_shots('rows'), 8)
+        self.assertEqual(p.apply_inducer_n_shots('cols'), 18)
+        self.assertEqual(p.apply_inducer_n_shots('wells'), 1)
+        self.assertEqual(p.apply_inducer_n_shots('media'), 1)
+
+    def test_apply_inducer_n_shots_error_1(self):
+        p = self.p
+        # Limit number of samples to measure
+        p.samples_to_measure = 80
+        # Get number of shots for inducer application
+        self.assertEqual(p.apply_inducer_n_shots('wells'), 1)
+        self.assertEqual(p.apply_inducer_n_shots('media'), 1)
+        # Verify that exception is raised for 'rows' and 'cols'
+        self.assertRaises(ValueError, p.apply_inducer_n_shots, 'rows')
+        self.assertRaises(ValueError, p.apply_inducer_n_shots, 'cols')
+
+    def test_apply_inducer_n_shots_error_2(self):
+        p = self.p
+        # Verify that exception is raised for an invalid 'apply_to' argument
+        self.assertRaises(ValueError, p.apply_inducer_n_shots, 'all')
+
+    def test_apply_inducer_rows(self):
+        p = self.p
+        # Create inducer
+        iptg = iptg_gradient(n=18)
+        p.apply_inducer(iptg, apply_to='rows')
+        # Check that inducers dictionary in plate has been updated
+        self.assertEqual(p.inducers, inducers_with('rows', [iptg]))
+
+    def test_apply_inducer_size_errors(self):
+        # Each case contains the number of samples to measure, the 'apply_to'
+        # argument, and a number of inducer concentrations that does not
+        # match the plate array
+        cases = [
+            (144, 'rows', 6),
+            (80, 'rows', 18),
+            (144, 'cols', 4),
+            (80, 'cols', 8),
+            (144, 'wells', 24),
+            (80, 'wells', 24),
+        ]
+        for samples_to_measure, apply_to, n in cases:
+            msg = "samples_to_measure={}, apply_to={}, n={}".format(
+                samples_to_measure, apply_to, n)
+            p = create_plate_array()
+            p.samples_to_measure = samples_to_measure
+            # Create inducer
+            iptg = iptg_gradient(n=n)
+            assert_raises_msg(self,
+                              ValueError,
+                              msg,
+                              p.apply_inducer,
+                              iptg,
+                              apply_to=apply_to)
+            # Check that inducers dictionary in plate has not been updated
+            self.assertEqual(p.inducers, EMPTY_INDUCERS, msg=msg)
+
+    def test_apply_inducer_cols(self):
+        p = self.p
+        # Create inducer
+        iptg = iptg_gradient(n=8)
+        p.apply_inducer(iptg, apply_to='cols')
+        # Check that inducers dictionary in plate has been updated
+        self.assertEqual(p.inducers, inducers_with('cols', [iptg]))
+
+    def test_apply_inducer_wells_1(self):
+        p = self.p
+        # Create inducer
+        iptg = iptg_gradient(n=144)
         p.apply_inducer(iptg, apply_to='wells')
+        # Check that inducers dictionary in plate has been updated
+        self.assertEqual(p.inducers, inducers_with('wells', [iptg]))
 
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [1., 2., 3., 4., 5., 6.,
-                                                 7., 8., 9., 10., 11., 12.,
-                                                 13., 14., 15., 16., 17., 18.,
-                                                 19., 20., 21., 22., 23., 24.]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_wells_2(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
+    def test_apply_inducer_wells_2(self):
+        p = self.p
+        # Limit number of samples to measure
+        p.samples_to_measure = 80
+        # Create inducer
+        iptg = iptg_gradient(n=80)
+        p.apply_inducer(iptg, apply_to='wells')
+        # Check that inducers dictionary in plate has been updated
+        self.assertEqual(p.inducers, inducers_with('wells', [iptg]))
 
-        # Create inducers for plate
-        iptg = platedesign.inducer.ChemicalInducer(
+    def test_apply_inducer_media_1(self):
+        p = self.p
+        # Create inducer
+        iptg = _ChemicalInducer(
             name='IPTG',
             units=u'µM')
-        iptg.concentrations = numpy.arange(24) + 1
-        p.apply_inducer(iptg, apply_to='wells')
-
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = (numpy.arange(24) + 1)/10.
-        p.apply_inducer(atc, apply_to='wells')
+        iptg.concentrations = [1]
+        p.apply_inducer(iptg, apply_to='media')
+        # Check that inducers dictionary in plate has been updated
+        self.assertEqual(p.inducers, inducers_with('media', [iptg]))
 
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [1., 2., 3., 4., 5., 6.,
-                                                 7., 8., 9., 10., 11., 12.,
-                                                 13., 14., 15., 16., 17., 18.,
-                                                 19., 20., 21., 22., 23., 24.]
-        well_info[u'aTc Concentration (ng/µL)'] = [0.1, 0.2, 0.3, 0.4, 0.5 ,0.6,
-                                                   0.7, 0.8, 0.9, 1.0, 1.1, 1.2,
-                                                   1.3, 1.4, 1.5, 1.6, 1.7, 1.8,
-                                                   1.9, 2.0, 2.1, 2.2, 2.3, 2.4]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_wells_3(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
+    def test_apply_inducer_media_2(self):
+        p = self.p
+        # Limit number of samples to measure
+        p.samples_to_measure = 80
+        # Create inducer
+        iptg = _ChemicalInducer(
+            name='IPTG',
+            units=u'µM')
+        iptg.concentrations = [1]
+        p.apply_inducer(iptg, apply_to='media')
+        # Check that inducers dictionary in plate has been updated
+        self.assertEqual(p.inducers, inducers_with('media', [iptg]))
 
-        # Create inducers for plate
-        iptg = platedesign.inducer.ChemicalInducer(
+    def test_apply_inducer_media_error_1(self):
+        p = self.p
+        # Create inducer
+        iptg = _ChemicalInducer(
             name='IPTG',
             units=u'µM')
-        iptg.concentrations = numpy.arange(24) + 1
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='wells')
+        iptg.concentrations = [1, 10]
+        self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='media')
+        # Check that inducers dictionary in plate has been updated
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = (numpy.arange(24) + 1)/10.
-        p.apply_inducer(atc, apply_to='wells')
-
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        # Results from shuffling are different in python 2 and 3
-        if six.PY2:
-            well_info[u'IPTG Concentration (µM)'] = [24., 3., 8., 22., 11., 13.,
-                                                     19., 16., 7., 5., 15., 23.,
-                                                     21., 18., 1., 2., 14., 12.,
-                                                     9., 10., 6., 17., 20., 4.,]
-        elif six.PY3:
-            well_info[u'IPTG Concentration (µM)'] = [ 21., 12., 24., 18., 22., 14.,
-                                                       6., 11., 10.,  7.,  1.,  8.,
-                                                       2., 20., 17., 13., 23., 15.,
-                                                       16., 4.,  9.,  3., 19.,  5.]
-        well_info[u'aTc Concentration (ng/µL)'] = [0.1, 0.2, 0.3, 0.4, 0.5 ,0.6,
-                                                   0.7, 0.8, 0.9, 1.0, 1.1, 1.2,
-                                                   1.3, 1.4, 1.5, 1.6, 1.7, 1.8,
-                                                   1.9, 2.0, 2.1, 2.2, 2.3, 2.4]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_wells_4(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.samples_to_measure = 12
-        p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(12) + 1
-        p.apply_inducer(iptg, apply_to='wells')
-
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [1., 2., 3., 4., 5., 6.,
-                                                 7., 8., 9., 10., 11., 12.,
-                                                 None, None, None, None, None, None,
-                                                 None, None, None, None, None, None]
-        well_info['Measure'] = [True]*12 + [False]*12
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_media_1(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3]
-        p.apply_inducer(iptg, apply_to='media')
-
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [3., 3., 3., 3., 3., 3.,
-                                                 3., 3., 3., 3., 3., 3.,
-                                                 3., 3., 3., 3., 3., 3.,
-                                                 3., 3., 3., 3., 3., 3.,]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_media_2(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3]
-        p.apply_inducer(iptg, apply_to='media')
-
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = [5]
-        p.apply_inducer(atc, apply_to='media')
-
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [3., 3., 3., 3., 3., 3.,
-                                                 3., 3., 3., 3., 3., 3.,
-                                                 3., 3., 3., 3., 3., 3.,
-                                                 3., 3., 3., 3., 3., 3.,]
-        well_info[u'aTc Concentration (ng/µL)'] = [5., 5., 5., 5., 5., 5.,
-                                                   5., 5., 5., 5., 5., 5.,
-                                                   5., 5., 5., 5., 5., 5.,
-                                                   5., 5., 5., 5., 5., 5.,]
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_media_3(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.samples_to_measure = 12
-        p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3]
-        p.apply_inducer(iptg, apply_to='media')
-
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 1)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [3., 3., 3., 3., 3., 3.,
-                                                 3., 3., 3., 3., 3., 3.,
-                                                 None, None, None, None, None, None,
-                                                 None, None, None, None, None, None]
-        well_info['Measure'] = [True]*12 + [False]*12
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_combined(self):
-        # Create plate
-        p = platedesign.plate.Plate(name='P1')
-        p.cell_strain_name = 'Test strain 1'
-        # Add some resources
-        p.resources['Incubator'] = ['Incubator 1']
-        p.resources['Thermometer'] = ['Alcohol thermometer 1']
-        # Add some metadata
-        p.metadata['Meta 1'] = 'Value 1'
-        p.metadata['Meta 2'] = 'Value 2'
-        # Add cell inoculation info
-        p.cell_setup_method = 'fixed_volume'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_shot_vol = 5
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3, 4, 5, 6, 7, 8]
-        p.apply_inducer(iptg, apply_to='rows')
-
-        # Second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = [0.1, 0.2, 0.3, 0.4]
-        p.apply_inducer(atc, apply_to='cols')
-
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 1)
-        # Get the only closed place
-        cp = cps[0]
-        # Check basic properties
-        self.assertEqual(cp.name, 'P1')
-        self.assertEqual(cp.n_rows, 4)
-        self.assertEqual(cp.n_cols, 6)
-
-        # Check plate info
-        self.assertEqual(len(cp.plate_info), 7)
-        self.assertTrue('Strain' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-        self.assertTrue('Incubator' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Incubator'], 'Incubator 1')
-        self.assertTrue('Thermometer' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Thermometer'], 'Alcohol thermometer 1')
-        self.assertTrue('Meta 1' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Meta 1'], 'Value 1')
-        self.assertTrue('Meta 2' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Meta 2'], 'Value 2')
-        self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 100)
-        self.assertTrue('Cell Inoculated Vol.' in cp.plate_info)
-        self.assertEqual(cp.plate_info['Cell Inoculated Vol.'], 5)
-
-        # Check well info
-        well_info = pandas.DataFrame()
-        well_info[u'IPTG Concentration (µM)'] = [3., 4., 5., 6., 7., 8.,
-                                                 3., 4., 5., 6., 7., 8.,
-                                                 3., 4., 5., 6., 7., 8.,
-                                                 3., 4., 5., 6., 7., 8.]
-        well_info[u'aTc Concentration (ng/µL)'] = [0.1, 0.1, 0.1, 0.1, 0.1, 0.1,
-                                                   0.2, 0.2, 0.2, 0.2, 0.2, 0.2,
-                                                   0.3, 0.3, 0.3, 0.3, 0.3, 0.3,
-                                                   0.4, 0.4, 0.4, 0.4, 0.4, 0.4,]
-
-        well_info['Measure'] = [True]*24
-        pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-class TestPlateArray(unittest.TestCase):
-    """
-    Tests for the PlateArray class
-
-    """
-    def setUp(self):
-        # Directory where to save temporary files
-        self.temp_dir = "test/temp_plate_array"
-        if not os.path.exists(self.temp_dir):
-            os.makedirs(self.temp_dir)
-        # Set random seed
-        random.seed(1)
-
-    def tearDown(self):
-        # Delete temporary directory
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
-
-    def test_create(self):
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-
-    def test_create_dim_mismatch_error(self):
-        self.assertRaises(ValueError,
-                          platedesign.plate.PlateArray,
-                          name='A1',
-                          array_n_rows=2,
-                          array_n_cols=3,
-                          plate_names=['P{}'.format(i+1)
-                                       for i in range(4)])
-
-    def test_default_attributes(self):
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Check all attributes
-        self.assertEqual(p.name, 'A1')
-        self.assertEqual(p.plate_names, ['P{}'.format(i+1)
-                                         for i in range(6)])
-        self.assertEqual(p.array_n_rows, 2)
-        self.assertEqual(p.array_n_cols, 3)
-        self.assertEqual(p.plate_n_rows, 4)
-        self.assertEqual(p.plate_n_cols, 6)
-        self.assertEqual(p.n_rows, 8)
-        self.assertEqual(p.n_cols, 18)
-        self.assertEqual(p.n_plates, 6)
-        self.assertEqual(p.samples_to_measure, 144)
-        self.assertIsNone(p.sample_media_vol)
-        self.assertIsNone(p.total_media_vol)
-        self.assertIsNone(p.cell_strain_name)
-        self.assertIsNone(p.cell_setup_method)
-        self.assertEqual(p.cell_predilution, 1)
-        self.assertIsNone(p.cell_predilution_vol)
-        self.assertIsNone(p.cell_initial_od600)
-        self.assertIsNone(p.cell_shot_vol)
-        self.assertEqual(p.resources, collections.OrderedDict())
-        self.assertEqual(p.metadata, collections.OrderedDict())
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_non_default_attributes(self):
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)],
-                                         plate_n_rows=8,
-                                         plate_n_cols=12)
-        # Check all attributes
-        self.assertEqual(p.name, 'A1')
-        self.assertEqual(p.plate_names, ['P{}'.format(i+1)
-                                         for i in range(6)])
-        self.assertEqual(p.array_n_rows, 2)
-        self.assertEqual(p.array_n_cols, 3)
-        self.assertEqual(p.plate_n_rows, 8)
-        self.assertEqual(p.plate_n_cols, 12)
-        self.assertEqual(p.n_rows, 16)
-        self.assertEqual(p.n_cols, 36)
-        self.assertEqual(p.n_plates, 6)
-        self.assertEqual(p.samples_to_measure, 576)
-        self.assertIsNone(p.sample_media_vol)
-        self.assertIsNone(p.total_media_vol)
-        self.assertIsNone(p.cell_strain_name)
-        self.assertIsNone(p.cell_setup_method)
-        self.assertEqual(p.cell_predilution, 1)
-        self.assertIsNone(p.cell_predilution_vol)
-        self.assertIsNone(p.cell_initial_od600)
-        self.assertIsNone(p.cell_shot_vol)
-        self.assertEqual(p.resources, collections.OrderedDict())
-        self.assertEqual(p.metadata, collections.OrderedDict())
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_apply_inducer_media_vol_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Set media volume
-        p.total_media_vol = 80000
-        p.sample_media_vol = 500
-        # Get media volume for inducer application
-        self.assertEqual(p.apply_inducer_media_vol('rows'), 500)
-        self.assertEqual(p.apply_inducer_media_vol('cols'), 500)
-        self.assertEqual(p.apply_inducer_media_vol('wells'), 500)
-        self.assertEqual(p.apply_inducer_media_vol('media'), 80000)
-
-    def test_apply_inducer_media_vol_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Set media volume
-        p.total_media_vol = 80000
-        p.sample_media_vol = 500
-        # Limit number of samples to measure
-        p.samples_to_measure = 80
-        # Get media volume for inducer application
-        self.assertEqual(p.apply_inducer_media_vol('wells'), 500)
-        self.assertEqual(p.apply_inducer_media_vol('media'), 80000)
-        # Verify that exception is raised for 'rows' and 'cols'
-        self.assertRaises(ValueError, p.apply_inducer_media_vol, 'rows')
-        self.assertRaises(ValueError, p.apply_inducer_media_vol, 'cols')
-
-    def test_apply_inducer_media_vol_error_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Set media volume
-        p.total_media_vol = 80000
-        p.sample_media_vol = 500
-        # Verify that exception is raised for an invalid 'apply_to' argument
-        self.assertRaises(ValueError, p.apply_inducer_media_vol, 'all')
-
-    def test_apply_inducer_media_vol_error_3(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Only set total media volume
-        p.total_media_vol = 80000
-        # Verify that exception is raised
-        self.assertRaises(AttributeError, p.apply_inducer_media_vol, 'rows')
-
-    def test_apply_inducer_media_vol_error_4(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Only set sample media volume
-        p.sample_media_vol = 500
-        # Verify that exception is raised
-        self.assertRaises(AttributeError, p.apply_inducer_media_vol, 'rows')
-
-    def test_apply_inducer_media_vol_error_5(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Don't set any media volume
-        # Verify that exception is raised
-        self.assertRaises(AttributeError, p.apply_inducer_media_vol, 'rows')
-
-    def test_apply_inducer_n_shots(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Get number of shots for inducer application
-        self.assertEqual(p.apply_inducer_n_shots('rows'), 8)
-        self.assertEqual(p.apply_inducer_n_shots('cols'), 18)
-        self.assertEqual(p.apply_inducer_n_shots('wells'), 1)
-        self.assertEqual(p.apply_inducer_n_shots('media'), 1)
-
-    def test_apply_inducer_n_shots_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Limit number of samples to measure
-        p.samples_to_measure = 80
-        # Get number of shots for inducer application
-        self.assertEqual(p.apply_inducer_n_shots('wells'), 1)
-        self.assertEqual(p.apply_inducer_n_shots('media'), 1)
-        # Verify that exception is raised for 'rows' and 'cols'
-        self.assertRaises(ValueError, p.apply_inducer_n_shots, 'rows')
-        self.assertRaises(ValueError, p.apply_inducer_n_shots, 'cols')
-
-    def test_apply_inducer_n_shots_error_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Verify that exception is raised for an invalid 'apply_to' argument
-        self.assertRaises(ValueError, p.apply_inducer_n_shots, 'all')
-
-    def test_apply_inducer_rows(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=18, scale='log')
-        p.apply_inducer(iptg, apply_to='rows')
-        # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [iptg],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_apply_inducer_rows_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=6, scale='log')
-        self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='rows')
-        # Check that inducers dictionary in plate has not been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_apply_inducer_rows_error_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Limit number of samples to measure
-        p.samples_to_measure = 80
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=18, scale='log')
-        self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='rows')
-        # Check that inducers dictionary in plate has not been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_apply_inducer_cols(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=8, scale='log')
-        p.apply_inducer(iptg, apply_to='cols')
-        # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [iptg],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_apply_inducer_cols_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=4, scale='log')
-        self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='cols')
-        # Check that inducers dictionary in plate has not been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_apply_inducer_cols_error_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Limit number of samples to measure
-        p.samples_to_measure = 80
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=8, scale='log')
-        self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='cols')
-        # Check that inducers dictionary in plate has not been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_apply_inducer_wells_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=144, scale='log')
-        p.apply_inducer(iptg, apply_to='wells')
-        # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [iptg],
-                                      'media': []})
-
-    def test_apply_inducer_wells_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Limit number of samples to measure
-        p.samples_to_measure = 80
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=80, scale='log')
-        p.apply_inducer(iptg, apply_to='wells')
-        # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [iptg],
-                                      'media': []})
-
-    def test_apply_inducer_wells_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=24, scale='log')
-        self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='wells')
-        # Check that inducers dictionary in plate has not been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_apply_inducer_wells_error_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Limit number of samples to measure
-        p.samples_to_measure = 80
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=24, scale='log')
-        self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='wells')
-        # Check that inducers dictionary in plate has not been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_apply_inducer_media_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [1]
-        p.apply_inducer(iptg, apply_to='media')
-        # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': [iptg]})
-
-    def test_apply_inducer_media_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Limit number of samples to measure
-        p.samples_to_measure = 80
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [1]
-        p.apply_inducer(iptg, apply_to='media')
-        # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': [iptg]})
-
-    def test_apply_inducer_media_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [1, 10]
-        self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='media')
-        # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_apply_inducer_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        # Set concentrations
-        iptg.concentrations = [1]
-        # Apply inducer to plate
-        self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='all')
-        # Check that inducers dictionary in plate has been updated
-        self.assertEqual(p.inducers, {'rows': [],
-                                      'cols': [],
-                                      'wells': [],
-                                      'media': []})
-
-    def test_save_exp_setup_instructions_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Run save_exp_setup_instructions
-        p.save_exp_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_exp.xlsx'))
-        # save_exp_setup_instructions does not do anything in Plate. There is
-        # no need to check for results.
-
-    def test_save_exp_setup_instructions_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create new spreadsheet
-        wb_test = openpyxl.Workbook()
-        # Remove sheet created by default
-        wb_test.remove(wb_test.active)
-        # Run save_exp_setup_instructions
-        p.save_exp_setup_instructions(workbook=wb_test)
-        # save_exp_setup_instructions does not do anything in Plate. There is
-        # no need to check for results.
-
-    def test_save_exp_setup_instructions_argument_error(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Run save_exp_setup_instructions with no arguments
-        self.assertRaises(ValueError, p.save_exp_setup_instructions)
-
-    def test_save_exp_setup_files(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Check that save_exp_setup_files runs successfully
-        p.save_exp_setup_files()
-        # save_exp_setup_files does not do anything in Plate. There is no need
-        # to check for results.
-
-    def test_save_rep_setup_instructions_empty(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should only contain an empty sheet named "Sheet 1"
-        self.assertEqual(wb.sheetnames, ["Sheet 1"])
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_od600_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_initial_od600 = 1e-5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertEqual(ws.cell(row=2, column=1).value, "Preculture/aliquot OD600")
-        self.assertEqual(ws.cell(row=2, column=2).value, None)
-        self.assertEqual(ws.cell(row=2, column=3).value, None)
-        self.assertEqual(ws.cell(row=3, column=1).value, "Target OD600")
-        self.assertEqual(ws.cell(row=3, column=2).value, 1e-5)
-        self.assertEqual(ws.cell(row=3, column=3).value, None)
-        self.assertEqual(ws.cell(row=4, column=1).value, "Preculture/aliquot volume")
-        test_excel_division_formula(self, ws.cell(row=4, column=2).value, 0.8, "B2")
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Add into 80.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_od600_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_initial_od600 = 1e-5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=3, column=2).value, 100)
-        self.assertEqual(ws.cell(row=3, column=3).value, "x")
-        self.assertEqual(ws.cell(row=4, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=4, column=2).value, 990)
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 10)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=6, column=1).value, "Predilution OD600")
-        self.assertEqual(ws.cell(row=6, column=2).value, None)
-        self.assertEqual(ws.cell(row=6, column=3).value, None)
-        self.assertTrue('A7:C7' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=7, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Target OD600")
-        self.assertEqual(ws.cell(row=8, column=2).value, 1e-5)
-        self.assertEqual(ws.cell(row=8, column=3).value, None)
-        self.assertEqual(ws.cell(row=9, column=1).value, "Predilution volume")
-        test_excel_division_formula(self, ws.cell(row=9, column=2).value, 0.8, "B6")
-        self.assertEqual(ws.cell(row=9, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=10, column=1).value, "Add into 80.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_od600_3(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_od600_measure_from_dilution = False
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_initial_od600 = 1e-5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Preculture/aliquot OD600")
-        self.assertEqual(ws.cell(row=3, column=2).value, None)
-        self.assertEqual(ws.cell(row=3, column=3).value, None)
-        self.assertEqual(ws.cell(row=4, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=4, column=2).value, 100)
-        self.assertEqual(ws.cell(row=4, column=3).value, "x")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 990)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=6, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=6, column=2).value, 10)
-        self.assertEqual(ws.cell(row=6, column=3).value, u"µL")
-        self.assertTrue('A7:C7' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=7, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Target OD600")
-        self.assertEqual(ws.cell(row=8, column=2).value, 1e-5)
-        self.assertEqual(ws.cell(row=8, column=3).value, None)
-        self.assertEqual(ws.cell(row=9, column=1).value, "Predilution volume")
-        test_excel_division_formula(self, ws.cell(row=9, column=2).value, 80., "B3")
-        self.assertEqual(ws.cell(row=9, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=10, column=1).value, "Add into 80.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_od600_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        # Do not include target od600
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        # Run save_rep_setup_instructions
-        self.assertRaises(
-            ValueError,
-            p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_od600_error_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        # Do not include predilution volume
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_predilution = 100
-        p.cell_initial_od600 = 1e-5
-        # Run save_rep_setup_instructions
-        self.assertRaises(
-            ValueError,
-            p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_volume_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_volume'
-        p.cell_shot_vol = 5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertEqual(ws.cell(row=2, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=2, column=2).value, 5)
-        self.assertEqual(ws.cell(row=2, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Add into 80.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_volume_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_volume'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_shot_vol = 5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=3, column=2).value, 100)
-        self.assertEqual(ws.cell(row=3, column=3).value, "x")
-        self.assertEqual(ws.cell(row=4, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=4, column=2).value, 990)
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 10)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertTrue('A6:C6' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=6, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=7, column=1).value, "Predilution volume")
-        self.assertEqual(ws.cell(row=7, column=2).value, 5)
-        self.assertEqual(ws.cell(row=7, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Add into 80.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_volume_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        # Do not include shot volume
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_volume'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        # Run save_rep_setup_instructions
-        self.assertRaises(
-            ValueError,
-            p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_volume_error_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        # Do not include predilution volume
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_volume'
-        p.cell_predilution = 100
-        p.cell_shot_vol = 5
-        # Run save_rep_setup_instructions
-        self.assertRaises(
-            ValueError,
-            p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_dilution_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_dilution'
-        p.cell_total_dilution = 1e4
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertEqual(ws.cell(row=2, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=2, column=2).value, 8)
-        self.assertEqual(ws.cell(row=2, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Add into 80.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_dilution_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_dilution'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_total_dilution = 1e5
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=3, column=2).value, 100)
-        self.assertEqual(ws.cell(row=3, column=3).value, "x")
-        self.assertEqual(ws.cell(row=4, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=4, column=2).value, 990)
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 10)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertTrue('A6:C6' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=6, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=7, column=1).value, "Predilution volume")
-        self.assertEqual(ws.cell(row=7, column=2).value, 80)
-        self.assertEqual(ws.cell(row=7, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Add into 80.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_dilution_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        # Do not include total dilution
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_dilution'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        # Run save_rep_setup_instructions
-        self.assertRaises(
-            ValueError,
-            p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
-
-    def test_save_rep_setup_instructions_cell_setup_fixed_dilution_error_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        # Do not include predilution volume
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_dilution'
-        p.cell_predilution = 100
-        p.cell_total_dilution = 1e5
-        # Run save_rep_setup_instructions
-        self.assertRaises(
-            ValueError,
-            p.save_rep_setup_instructions,
-            file_name=os.path.join(self.temp_dir, 'plate_rep.xlsx'))
-
-    def test_save_rep_setup_instructions_inducer_rows_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.set_gradient(min=1e-6, max=1e-3, n=18, scale='log')
-        iptg.shot_vol = 5.
-        p.apply_inducer(iptg, apply_to='rows')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "I002")
-        self.assertEqual(ws.cell(row=1, column=3).value, "I003")
-        self.assertEqual(ws.cell(row=1, column=4).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=5).value, "I005")
-        self.assertEqual(ws.cell(row=1, column=6).value, "I006")
-        self.assertEqual(ws.cell(row=1, column=7).value, "I007")
-        self.assertEqual(ws.cell(row=1, column=8).value, "I008")
-        self.assertEqual(ws.cell(row=1, column=9).value, "I009")
-        self.assertEqual(ws.cell(row=1, column=10).value, "I010")
-        self.assertEqual(ws.cell(row=1, column=11).value, "I011")
-        self.assertEqual(ws.cell(row=1, column=12).value, "I012")
-        self.assertEqual(ws.cell(row=1, column=13).value, "I013")
-        self.assertEqual(ws.cell(row=1, column=14).value, "I014")
-        self.assertEqual(ws.cell(row=1, column=15).value, "I015")
-        self.assertEqual(ws.cell(row=1, column=16).value, "I016")
-        self.assertEqual(ws.cell(row=1, column=17).value, "I017")
-        self.assertEqual(ws.cell(row=1, column=18).value, "I018")
-        self.assertEqual(ws.cell(row=2, column=1).value, "P1 (1, 1)")
-        self.assertEqual(ws.cell(row=2, column=2).value, "P1 (1, 2)")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (1, 3)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (1, 4)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (1, 5)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (1, 6)")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P2 (1, 1)")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P2 (1, 2)")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (1, 3)")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (1, 4)")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (1, 5)")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (1, 6)")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P3 (1, 1)")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P3 (1, 2)")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (1, 3)")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (1, 4)")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (1, 5)")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (1, 6)")
-        self.assertEqual(ws.cell(row=3, column=1).value, "P1 (2, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (2, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (2, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (2, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (2, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (2, 6)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P2 (2, 1)")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (2, 2)")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (2, 3)")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (2, 4)")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (2, 5)")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (2, 6)")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P3 (2, 1)")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (2, 2)")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (2, 3)")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (2, 4)")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (2, 5)")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (2, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "P1 (3, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (3, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (3, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (3, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (3, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (3, 6)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P2 (3, 1)")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (3, 2)")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (3, 3)")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (3, 4)")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (3, 5)")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (3, 6)")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P3 (3, 1)")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (3, 2)")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (3, 3)")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (3, 4)")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (3, 5)")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (3, 6)")
-        self.assertEqual(ws.cell(row=5, column=1).value, "P1 (4, 1)")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P1 (4, 2)")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P1 (4, 3)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P1 (4, 4)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P1 (4, 5)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P1 (4, 6)")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P2 (4, 1)")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P2 (4, 2)")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P2 (4, 3)")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P2 (4, 4)")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P2 (4, 5)")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P2 (4, 6)")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P3 (4, 1)")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P3 (4, 2)")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P3 (4, 3)")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P3 (4, 4)")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P3 (4, 5)")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P3 (4, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value, "P4 (1, 1)")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P4 (1, 2)")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (1, 3)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (1, 4)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (1, 5)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (1, 6)")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P5 (1, 1)")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P5 (1, 2)")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (1, 3)")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (1, 4)")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (1, 5)")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (1, 6)")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P6 (1, 1)")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P6 (1, 2)")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (1, 3)")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (1, 4)")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (1, 5)")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (1, 6)")
-        self.assertEqual(ws.cell(row=7, column=1).value, "P4 (2, 1)")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (2, 2)")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (2, 3)")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (2, 4)")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (2, 5)")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (2, 6)")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P5 (2, 1)")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (2, 2)")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (2, 3)")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (2, 4)")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (2, 5)")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (2, 6)")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P6 (2, 1)")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (2, 2)")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (2, 3)")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (2, 4)")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (2, 5)")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (2, 6)")
-        self.assertEqual(ws.cell(row=8, column=1).value, "P4 (3, 1)")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (3, 2)")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (3, 3)")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (3, 4)")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (3, 5)")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (3, 6)")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P5 (3, 1)")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (3, 2)")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (3, 3)")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (3, 4)")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (3, 5)")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (3, 6)")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P6 (3, 1)")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (3, 2)")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (3, 3)")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (3, 4)")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (3, 5)")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (3, 6)")
-        self.assertEqual(ws.cell(row=9, column=1).value, "P4 (4, 1)")
-        self.assertEqual(ws.cell(row=9, column=2).value, "P4 (4, 2)")
-        self.assertEqual(ws.cell(row=9, column=3).value, "P4 (4, 3)")
-        self.assertEqual(ws.cell(row=9, column=4).value, "P4 (4, 4)")
-        self.assertEqual(ws.cell(row=9, column=5).value, "P4 (4, 5)")
-        self.assertEqual(ws.cell(row=9, column=6).value, "P4 (4, 6)")
-        self.assertEqual(ws.cell(row=9, column=7).value, "P5 (4, 1)")
-        self.assertEqual(ws.cell(row=9, column=8).value, "P5 (4, 2)")
-        self.assertEqual(ws.cell(row=9, column=9).value, "P5 (4, 3)")
-        self.assertEqual(ws.cell(row=9, column=10).value, "P5 (4, 4)")
-        self.assertEqual(ws.cell(row=9, column=11).value, "P5 (4, 5)")
-        self.assertEqual(ws.cell(row=9, column=12).value, "P5 (4, 6)")
-        self.assertEqual(ws.cell(row=9, column=13).value, "P6 (4, 1)")
-        self.assertEqual(ws.cell(row=9, column=14).value, "P6 (4, 2)")
-        self.assertEqual(ws.cell(row=9, column=15).value, "P6 (4, 3)")
-        self.assertEqual(ws.cell(row=9, column=16).value, "P6 (4, 4)")
-        self.assertEqual(ws.cell(row=9, column=17).value, "P6 (4, 5)")
-        self.assertEqual(ws.cell(row=9, column=18).value, "P6 (4, 6)")
-        self.assertEqual(ws.cell(row=11, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-
-    def test_save_rep_setup_instructions_inducer_rows_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=18, scale='log')
-        p.apply_inducer(iptg, apply_to='rows')
-        # Create second inducer for plate rows
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        atc.set_gradient(min=0.5, max=50, n=18, scale='log')
-        p.apply_inducer(atc, apply_to='rows')
-
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "I002")
-        self.assertEqual(ws.cell(row=1, column=3).value, "I003")
-        self.assertEqual(ws.cell(row=1, column=4).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=5).value, "I005")
-        self.assertEqual(ws.cell(row=1, column=6).value, "I006")
-        self.assertEqual(ws.cell(row=1, column=7).value, "I007")
-        self.assertEqual(ws.cell(row=1, column=8).value, "I008")
-        self.assertEqual(ws.cell(row=1, column=9).value, "I009")
-        self.assertEqual(ws.cell(row=1, column=10).value, "I010")
-        self.assertEqual(ws.cell(row=1, column=11).value, "I011")
-        self.assertEqual(ws.cell(row=1, column=12).value, "I012")
-        self.assertEqual(ws.cell(row=1, column=13).value, "I013")
-        self.assertEqual(ws.cell(row=1, column=14).value, "I014")
-        self.assertEqual(ws.cell(row=1, column=15).value, "I015")
-        self.assertEqual(ws.cell(row=1, column=16).value, "I016")
-        self.assertEqual(ws.cell(row=1, column=17).value, "I017")
-        self.assertEqual(ws.cell(row=1, column=18).value, "I018")
-        self.assertEqual(ws.cell(row=2, column=1).value, "a001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "a002")
-        self.assertEqual(ws.cell(row=2, column=3).value, "a003")
-        self.assertEqual(ws.cell(row=2, column=4).value, "a004")
-        self.assertEqual(ws.cell(row=2, column=5).value, "a005")
-        self.assertEqual(ws.cell(row=2, column=6).value, "a006")
-        self.assertEqual(ws.cell(row=2, column=7).value, "a007")
-        self.assertEqual(ws.cell(row=2, column=8).value, "a008")
-        self.assertEqual(ws.cell(row=2, column=9).value, "a009")
-        self.assertEqual(ws.cell(row=2, column=10).value, "a010")
-        self.assertEqual(ws.cell(row=2, column=11).value, "a011")
-        self.assertEqual(ws.cell(row=2, column=12).value, "a012")
-        self.assertEqual(ws.cell(row=2, column=13).value, "a013")
-        self.assertEqual(ws.cell(row=2, column=14).value, "a014")
-        self.assertEqual(ws.cell(row=2, column=15).value, "a015")
-        self.assertEqual(ws.cell(row=2, column=16).value, "a016")
-        self.assertEqual(ws.cell(row=2, column=17).value, "a017")
-        self.assertEqual(ws.cell(row=2, column=18).value, "a018")
-        self.assertEqual(ws.cell(row=3, column=1).value, "P1 (1, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (1, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (1, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (1, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (1, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (1, 6)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P2 (1, 1)")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (1, 2)")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (1, 3)")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (1, 4)")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (1, 5)")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (1, 6)")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P3 (1, 1)")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (1, 2)")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (1, 3)")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (1, 4)")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (1, 5)")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (1, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "P1 (2, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (2, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (2, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (2, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (2, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (2, 6)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P2 (2, 1)")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (2, 2)")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (2, 3)")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (2, 4)")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (2, 5)")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (2, 6)")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P3 (2, 1)")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (2, 2)")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (2, 3)")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (2, 4)")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (2, 5)")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (2, 6)")
-        self.assertEqual(ws.cell(row=5, column=1).value, "P1 (3, 1)")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P1 (3, 2)")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P1 (3, 3)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P1 (3, 4)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P1 (3, 5)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P1 (3, 6)")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P2 (3, 1)")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P2 (3, 2)")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P2 (3, 3)")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P2 (3, 4)")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P2 (3, 5)")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P2 (3, 6)")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P3 (3, 1)")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P3 (3, 2)")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P3 (3, 3)")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P3 (3, 4)")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P3 (3, 5)")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P3 (3, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value, "P1 (4, 1)")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P1 (4, 2)")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P1 (4, 3)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P1 (4, 4)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P1 (4, 5)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P1 (4, 6)")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P2 (4, 1)")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P2 (4, 2)")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P2 (4, 3)")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P2 (4, 4)")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P2 (4, 5)")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P2 (4, 6)")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P3 (4, 1)")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P3 (4, 2)")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P3 (4, 3)")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P3 (4, 4)")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P3 (4, 5)")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P3 (4, 6)")
-        self.assertEqual(ws.cell(row=7, column=1).value, "P4 (1, 1)")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (1, 2)")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (1, 3)")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (1, 4)")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (1, 5)")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (1, 6)")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P5 (1, 1)")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (1, 2)")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (1, 3)")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (1, 4)")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (1, 5)")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (1, 6)")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P6 (1, 1)")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (1, 2)")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (1, 3)")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (1, 4)")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (1, 5)")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (1, 6)")
-        self.assertEqual(ws.cell(row=8, column=1).value, "P4 (2, 1)")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (2, 2)")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (2, 3)")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (2, 4)")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (2, 5)")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (2, 6)")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P5 (2, 1)")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (2, 2)")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (2, 3)")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (2, 4)")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (2, 5)")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (2, 6)")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P6 (2, 1)")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (2, 2)")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (2, 3)")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (2, 4)")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (2, 5)")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (2, 6)")
-        self.assertEqual(ws.cell(row=9, column=1).value, "P4 (3, 1)")
-        self.assertEqual(ws.cell(row=9, column=2).value, "P4 (3, 2)")
-        self.assertEqual(ws.cell(row=9, column=3).value, "P4 (3, 3)")
-        self.assertEqual(ws.cell(row=9, column=4).value, "P4 (3, 4)")
-        self.assertEqual(ws.cell(row=9, column=5).value, "P4 (3, 5)")
-        self.assertEqual(ws.cell(row=9, column=6).value, "P4 (3, 6)")
-        self.assertEqual(ws.cell(row=9, column=7).value, "P5 (3, 1)")
-        self.assertEqual(ws.cell(row=9, column=8).value, "P5 (3, 2)")
-        self.assertEqual(ws.cell(row=9, column=9).value, "P5 (3, 3)")
-        self.assertEqual(ws.cell(row=9, column=10).value, "P5 (3, 4)")
-        self.assertEqual(ws.cell(row=9, column=11).value, "P5 (3, 5)")
-        self.assertEqual(ws.cell(row=9, column=12).value, "P5 (3, 6)")
-        self.assertEqual(ws.cell(row=9, column=13).value, "P6 (3, 1)")
-        self.assertEqual(ws.cell(row=9, column=14).value, "P6 (3, 2)")
-        self.assertEqual(ws.cell(row=9, column=15).value, "P6 (3, 3)")
-        self.assertEqual(ws.cell(row=9, column=16).value, "P6 (3, 4)")
-        self.assertEqual(ws.cell(row=9, column=17).value, "P6 (3, 5)")
-        self.assertEqual(ws.cell(row=9, column=18).value, "P6 (3, 6)")
-        self.assertEqual(ws.cell(row=10, column=1).value, "P4 (4, 1)")
-        self.assertEqual(ws.cell(row=10, column=2).value, "P4 (4, 2)")
-        self.assertEqual(ws.cell(row=10, column=3).value, "P4 (4, 3)")
-        self.assertEqual(ws.cell(row=10, column=4).value, "P4 (4, 4)")
-        self.assertEqual(ws.cell(row=10, column=5).value, "P4 (4, 5)")
-        self.assertEqual(ws.cell(row=10, column=6).value, "P4 (4, 6)")
-        self.assertEqual(ws.cell(row=10, column=7).value, "P5 (4, 1)")
-        self.assertEqual(ws.cell(row=10, column=8).value, "P5 (4, 2)")
-        self.assertEqual(ws.cell(row=10, column=9).value, "P5 (4, 3)")
-        self.assertEqual(ws.cell(row=10, column=10).value, "P5 (4, 4)")
-        self.assertEqual(ws.cell(row=10, column=11).value, "P5 (4, 5)")
-        self.assertEqual(ws.cell(row=10, column=12).value, "P5 (4, 6)")
-        self.assertEqual(ws.cell(row=10, column=13).value, "P6 (4, 1)")
-        self.assertEqual(ws.cell(row=10, column=14).value, "P6 (4, 2)")
-        self.assertEqual(ws.cell(row=10, column=15).value, "P6 (4, 3)")
-        self.assertEqual(ws.cell(row=10, column=16).value, "P6 (4, 4)")
-        self.assertEqual(ws.cell(row=10, column=17).value, "P6 (4, 5)")
-        self.assertEqual(ws.cell(row=10, column=18).value, "P6 (4, 6)")
-        self.assertEqual(ws.cell(row=12, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=13, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_rows_3(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=18, scale='log')
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='rows')
-        # Create second inducer for plate rows
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        atc.set_gradient(min=0.5, max=50, n=18, scale='log')
-        p.apply_inducer(atc, apply_to='rows')
-
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        # Shuffling results are different in python 2 and 3
-        if six.PY2:
-            self.assertEqual(ws.cell(row=1, column=1).value, "I012")
-            self.assertEqual(ws.cell(row=1, column=2).value, "I016")
-            self.assertEqual(ws.cell(row=1, column=3).value, "I018")
-            self.assertEqual(ws.cell(row=1, column=4).value, "I002")
-            self.assertEqual(ws.cell(row=1, column=5).value, "I011")
-            self.assertEqual(ws.cell(row=1, column=6).value, "I005")
-            self.assertEqual(ws.cell(row=1, column=7).value, "I017")
-            self.assertEqual(ws.cell(row=1, column=8).value, "I014")
-            self.assertEqual(ws.cell(row=1, column=9).value, "I010")
-            self.assertEqual(ws.cell(row=1, column=10).value, "I001")
-            self.assertEqual(ws.cell(row=1, column=11).value, "I009")
-            self.assertEqual(ws.cell(row=1, column=12).value, "I008")
-            self.assertEqual(ws.cell(row=1, column=13).value, "I006")
-            self.assertEqual(ws.cell(row=1, column=14).value, "I007")
-            self.assertEqual(ws.cell(row=1, column=15).value, "I004")
-            self.assertEqual(ws.cell(row=1, column=16).value, "I013")
-            self.assertEqual(ws.cell(row=1, column=17).value, "I015")
-            self.assertEqual(ws.cell(row=1, column=18).value, "I003")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=1, column=1).value, "I011")
-            self.assertEqual(ws.cell(row=1, column=2).value, "I006")
-            self.assertEqual(ws.cell(row=1, column=3).value, "I017")
-            self.assertEqual(ws.cell(row=1, column=4).value, "I018")
-            self.assertEqual(ws.cell(row=1, column=5).value, "I010")
-            self.assertEqual(ws.cell(row=1, column=6).value, "I001")
-            self.assertEqual(ws.cell(row=1, column=7).value, "I016")
-            self.assertEqual(ws.cell(row=1, column=8).value, "I015")
-            self.assertEqual(ws.cell(row=1, column=9).value, "I004")
-            self.assertEqual(ws.cell(row=1, column=10).value, "I007")
-            self.assertEqual(ws.cell(row=1, column=11).value, "I012")
-            self.assertEqual(ws.cell(row=1, column=12).value, "I014")
-            self.assertEqual(ws.cell(row=1, column=13).value, "I013")
-            self.assertEqual(ws.cell(row=1, column=14).value, "I008")
-            self.assertEqual(ws.cell(row=1, column=15).value, "I002")
-            self.assertEqual(ws.cell(row=1, column=16).value, "I009")
-            self.assertEqual(ws.cell(row=1, column=17).value, "I003")
-            self.assertEqual(ws.cell(row=1, column=18).value, "I005")
-        self.assertEqual(ws.cell(row=2, column=1).value, "a001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "a002")
-        self.assertEqual(ws.cell(row=2, column=3).value, "a003")
-        self.assertEqual(ws.cell(row=2, column=4).value, "a004")
-        self.assertEqual(ws.cell(row=2, column=5).value, "a005")
-        self.assertEqual(ws.cell(row=2, column=6).value, "a006")
-        self.assertEqual(ws.cell(row=2, column=7).value, "a007")
-        self.assertEqual(ws.cell(row=2, column=8).value, "a008")
-        self.assertEqual(ws.cell(row=2, column=9).value, "a009")
-        self.assertEqual(ws.cell(row=2, column=10).value, "a010")
-        self.assertEqual(ws.cell(row=2, column=11).value, "a011")
-        self.assertEqual(ws.cell(row=2, column=12).value, "a012")
-        self.assertEqual(ws.cell(row=2, column=13).value, "a013")
-        self.assertEqual(ws.cell(row=2, column=14).value, "a014")
-        self.assertEqual(ws.cell(row=2, column=15).value, "a015")
-        self.assertEqual(ws.cell(row=2, column=16).value, "a016")
-        self.assertEqual(ws.cell(row=2, column=17).value, "a017")
-        self.assertEqual(ws.cell(row=2, column=18).value, "a018")
-        self.assertEqual(ws.cell(row=3, column=1).value, "P1 (1, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (1, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (1, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (1, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (1, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (1, 6)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P2 (1, 1)")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (1, 2)")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (1, 3)")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (1, 4)")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (1, 5)")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (1, 6)")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P3 (1, 1)")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (1, 2)")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (1, 3)")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (1, 4)")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (1, 5)")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (1, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "P1 (2, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (2, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (2, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (2, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (2, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (2, 6)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P2 (2, 1)")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (2, 2)")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (2, 3)")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (2, 4)")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (2, 5)")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (2, 6)")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P3 (2, 1)")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (2, 2)")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (2, 3)")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (2, 4)")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (2, 5)")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (2, 6)")
-        self.assertEqual(ws.cell(row=5, column=1).value, "P1 (3, 1)")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P1 (3, 2)")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P1 (3, 3)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P1 (3, 4)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P1 (3, 5)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P1 (3, 6)")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P2 (3, 1)")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P2 (3, 2)")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P2 (3, 3)")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P2 (3, 4)")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P2 (3, 5)")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P2 (3, 6)")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P3 (3, 1)")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P3 (3, 2)")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P3 (3, 3)")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P3 (3, 4)")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P3 (3, 5)")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P3 (3, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value, "P1 (4, 1)")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P1 (4, 2)")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P1 (4, 3)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P1 (4, 4)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P1 (4, 5)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P1 (4, 6)")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P2 (4, 1)")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P2 (4, 2)")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P2 (4, 3)")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P2 (4, 4)")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P2 (4, 5)")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P2 (4, 6)")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P3 (4, 1)")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P3 (4, 2)")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P3 (4, 3)")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P3 (4, 4)")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P3 (4, 5)")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P3 (4, 6)")
-        self.assertEqual(ws.cell(row=7, column=1).value, "P4 (1, 1)")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (1, 2)")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (1, 3)")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (1, 4)")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (1, 5)")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (1, 6)")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P5 (1, 1)")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (1, 2)")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (1, 3)")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (1, 4)")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (1, 5)")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (1, 6)")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P6 (1, 1)")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (1, 2)")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (1, 3)")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (1, 4)")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (1, 5)")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (1, 6)")
-        self.assertEqual(ws.cell(row=8, column=1).value, "P4 (2, 1)")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (2, 2)")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (2, 3)")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (2, 4)")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (2, 5)")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (2, 6)")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P5 (2, 1)")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (2, 2)")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (2, 3)")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (2, 4)")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (2, 5)")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (2, 6)")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P6 (2, 1)")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (2, 2)")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (2, 3)")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (2, 4)")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (2, 5)")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (2, 6)")
-        self.assertEqual(ws.cell(row=9, column=1).value, "P4 (3, 1)")
-        self.assertEqual(ws.cell(row=9, column=2).value, "P4 (3, 2)")
-        self.assertEqual(ws.cell(row=9, column=3).value, "P4 (3, 3)")
-        self.assertEqual(ws.cell(row=9, column=4).value, "P4 (3, 4)")
-        self.assertEqual(ws.cell(row=9, column=5).value, "P4 (3, 5)")
-        self.assertEqual(ws.cell(row=9, column=6).value, "P4 (3, 6)")
-        self.assertEqual(ws.cell(row=9, column=7).value, "P5 (3, 1)")
-        self.assertEqual(ws.cell(row=9, column=8).value, "P5 (3, 2)")
-        self.assertEqual(ws.cell(row=9, column=9).value, "P5 (3, 3)")
-        self.assertEqual(ws.cell(row=9, column=10).value, "P5 (3, 4)")
-        self.assertEqual(ws.cell(row=9, column=11).value, "P5 (3, 5)")
-        self.assertEqual(ws.cell(row=9, column=12).value, "P5 (3, 6)")
-        self.assertEqual(ws.cell(row=9, column=13).value, "P6 (3, 1)")
-        self.assertEqual(ws.cell(row=9, column=14).value, "P6 (3, 2)")
-        self.assertEqual(ws.cell(row=9, column=15).value, "P6 (3, 3)")
-        self.assertEqual(ws.cell(row=9, column=16).value, "P6 (3, 4)")
-        self.assertEqual(ws.cell(row=9, column=17).value, "P6 (3, 5)")
-        self.assertEqual(ws.cell(row=9, column=18).value, "P6 (3, 6)")
-        self.assertEqual(ws.cell(row=10, column=1).value, "P4 (4, 1)")
-        self.assertEqual(ws.cell(row=10, column=2).value, "P4 (4, 2)")
-        self.assertEqual(ws.cell(row=10, column=3).value, "P4 (4, 3)")
-        self.assertEqual(ws.cell(row=10, column=4).value, "P4 (4, 4)")
-        self.assertEqual(ws.cell(row=10, column=5).value, "P4 (4, 5)")
-        self.assertEqual(ws.cell(row=10, column=6).value, "P4 (4, 6)")
-        self.assertEqual(ws.cell(row=10, column=7).value, "P5 (4, 1)")
-        self.assertEqual(ws.cell(row=10, column=8).value, "P5 (4, 2)")
-        self.assertEqual(ws.cell(row=10, column=9).value, "P5 (4, 3)")
-        self.assertEqual(ws.cell(row=10, column=10).value, "P5 (4, 4)")
-        self.assertEqual(ws.cell(row=10, column=11).value, "P5 (4, 5)")
-        self.assertEqual(ws.cell(row=10, column=12).value, "P5 (4, 6)")
-        self.assertEqual(ws.cell(row=10, column=13).value, "P6 (4, 1)")
-        self.assertEqual(ws.cell(row=10, column=14).value, "P6 (4, 2)")
-        self.assertEqual(ws.cell(row=10, column=15).value, "P6 (4, 3)")
-        self.assertEqual(ws.cell(row=10, column=16).value, "P6 (4, 4)")
-        self.assertEqual(ws.cell(row=10, column=17).value, "P6 (4, 5)")
-        self.assertEqual(ws.cell(row=10, column=18).value, "P6 (4, 6)")
-        self.assertEqual(ws.cell(row=12, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=13, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_cols_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer for plate columns
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=8, scale='log')
-        p.apply_inducer(iptg, apply_to='cols')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "P1 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=3).value, "P1 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=4).value, "P1 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=5).value, "P1 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=6).value, "P1 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=7).value, "P1 (1, 6)")
-        self.assertEqual(ws.cell(row=1, column=8).value, "P2 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=9).value, "P2 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=10).value, "P2 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=11).value, "P2 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=12).value, "P2 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=13).value, "P2 (1, 6)")
-        self.assertEqual(ws.cell(row=1, column=14).value, "P3 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=15).value, "P3 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=16).value, "P3 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=17).value, "P3 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=18).value, "P3 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=19).value, "P3 (1, 6)")
-        self.assertEqual(ws.cell(row=2, column=1).value, "I002")
-        self.assertEqual(ws.cell(row=2, column=2).value, "P1 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P1 (2, 6)")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P2 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P2 (2, 6)")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P3 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=19).value, "P3 (2, 6)")
-        self.assertEqual(ws.cell(row=3, column=1).value, "I003")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P1 (3, 6)")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P2 (3, 6)")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=19).value, "P3 (3, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "I004")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P1 (4, 6)")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P2 (4, 6)")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=19).value, "P3 (4, 6)")
-        self.assertEqual(ws.cell(row=5, column=1).value, "I005")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P4 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P4 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P4 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P4 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P4 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P4 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P5 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P5 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P5 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P5 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P5 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P5 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P6 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P6 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P6 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P6 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P6 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=19).value, "P6 (1, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value, "I006")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P4 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P4 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P5 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P5 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P6 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=19).value, "P6 (2, 6)")
-        self.assertEqual(ws.cell(row=7, column=1).value, "I007")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P4 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P5 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=19).value, "P6 (3, 6)")
-        self.assertEqual(ws.cell(row=8, column=1).value, "I008")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P4 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P5 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=19).value, "P6 (4, 6)")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-
-    def test_save_rep_setup_instructions_inducer_cols_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer for plate columns
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=8, scale='log')
-        p.apply_inducer(iptg, apply_to='cols')
-        # Create second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        atc.set_gradient(min=0.5, max=50, n=8, scale='log')
-        p.apply_inducer(atc, apply_to='cols')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "a001")
-        self.assertEqual(ws.cell(row=1, column=3).value, "P1 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=4).value, "P1 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=5).value, "P1 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=6).value, "P1 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=7).value, "P1 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=8).value, "P1 (1, 6)")
-        self.assertEqual(ws.cell(row=1, column=9).value, "P2 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=10).value, "P2 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=11).value, "P2 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=12).value, "P2 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=13).value, "P2 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=14).value, "P2 (1, 6)")
-        self.assertEqual(ws.cell(row=1, column=15).value, "P3 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=16).value, "P3 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=17).value, "P3 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=18).value, "P3 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=19).value, "P3 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=20).value, "P3 (1, 6)")
-        self.assertEqual(ws.cell(row=2, column=1).value, "I002")
-        self.assertEqual(ws.cell(row=2, column=2).value, "a002")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P1 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P1 (2, 6)")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P2 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P2 (2, 6)")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=19).value, "P3 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=20).value, "P3 (2, 6)")
-        self.assertEqual(ws.cell(row=3, column=1).value, "I003")
-        self.assertEqual(ws.cell(row=3, column=2).value, "a003")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P1 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P1 (3, 6)")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P2 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P2 (3, 6)")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=19).value, "P3 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=20).value, "P3 (3, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "I004")
-        self.assertEqual(ws.cell(row=4, column=2).value, "a004")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P1 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P1 (4, 6)")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P2 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P2 (4, 6)")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=19).value, "P3 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=20).value, "P3 (4, 6)")
-        self.assertEqual(ws.cell(row=5, column=1).value, "I005")
-        self.assertEqual(ws.cell(row=5, column=2).value, "a005")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P4 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P4 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P4 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P4 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P4 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P4 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P5 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P5 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P5 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P5 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P5 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P5 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P6 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P6 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P6 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P6 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=19).value, "P6 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=20).value, "P6 (1, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value, "I006")
-        self.assertEqual(ws.cell(row=6, column=2).value, "a006")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P4 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P4 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P5 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P5 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=19).value, "P6 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=20).value, "P6 (2, 6)")
-        self.assertEqual(ws.cell(row=7, column=1).value, "I007")
-        self.assertEqual(ws.cell(row=7, column=2).value, "a007")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P4 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P4 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P5 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P5 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=19).value, "P6 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=20).value, "P6 (3, 6)")
-        self.assertEqual(ws.cell(row=8, column=1).value, "I008")
-        self.assertEqual(ws.cell(row=8, column=2).value, "a008")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P4 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P4 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P5 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P5 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=19).value, "P6 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=20).value, "P6 (4, 6)")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=11, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_cols_3(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer for plate columns
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=8, scale='log')
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='cols')
-        # Create second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        atc.set_gradient(min=0.5, max=50, n=8, scale='log')
-        p.apply_inducer(atc, apply_to='cols')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        # Results of shuffling are different in python 2 and 3
-        ws = wb["Inducers for Plate Array A1"]
-        if six.PY2:
-            self.assertEqual(ws.cell(row=1, column=1).value, "I001")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=1, column=1).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=2).value, "a001")
-        self.assertEqual(ws.cell(row=1, column=3).value, "P1 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=4).value, "P1 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=5).value, "P1 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=6).value, "P1 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=7).value, "P1 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=8).value, "P1 (1, 6)")
-        self.assertEqual(ws.cell(row=1, column=9).value, "P2 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=10).value, "P2 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=11).value, "P2 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=12).value, "P2 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=13).value, "P2 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=14).value, "P2 (1, 6)")
-        self.assertEqual(ws.cell(row=1, column=15).value, "P3 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=16).value, "P3 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=17).value, "P3 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=18).value, "P3 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=19).value, "P3 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=20).value, "P3 (1, 6)")
-        if six.PY2:
-            self.assertEqual(ws.cell(row=2, column=1).value, "I003")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=2, column=1).value, "I007")
-        self.assertEqual(ws.cell(row=2, column=2).value, "a002")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P1 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P1 (2, 6)")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P2 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P2 (2, 6)")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=19).value, "P3 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=20).value, "P3 (2, 6)")
-        if six.PY2:
-            self.assertEqual(ws.cell(row=3, column=1).value, "I004")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=3, column=1).value, "I002")
-        self.assertEqual(ws.cell(row=3, column=2).value, "a003")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P1 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P1 (3, 6)")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P2 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P2 (3, 6)")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=19).value, "P3 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=20).value, "P3 (3, 6)")
-        if six.PY2:
-            self.assertEqual(ws.cell(row=4, column=1).value, "I007")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=4, column=1).value, "I006")
-        self.assertEqual(ws.cell(row=4, column=2).value, "a004")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P1 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P1 (4, 6)")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P2 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P2 (4, 6)")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=19).value, "P3 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=20).value, "P3 (4, 6)")
-        if six.PY2:
-            self.assertEqual(ws.cell(row=5, column=1).value, "I008")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=5, column=1).value, "I008")
-        self.assertEqual(ws.cell(row=5, column=2).value, "a005")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P4 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P4 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P4 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P4 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P4 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P4 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P5 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P5 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P5 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P5 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P5 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P5 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P6 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P6 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P6 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P6 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=19).value, "P6 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=20).value, "P6 (1, 6)")
-        if six.PY2:
-            self.assertEqual(ws.cell(row=6, column=1).value, "I005")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=6, column=1).value, "I001")
-        self.assertEqual(ws.cell(row=6, column=2).value, "a006")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P4 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P4 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P5 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P5 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=19).value, "P6 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=20).value, "P6 (2, 6)")
-        if six.PY2:
-            self.assertEqual(ws.cell(row=7, column=1).value, "I006")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=7, column=1).value, "I005")
-        self.assertEqual(ws.cell(row=7, column=2).value, "a007")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P4 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P4 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P5 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P5 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=19).value, "P6 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=20).value, "P6 (3, 6)")
-        if six.PY2:
-            self.assertEqual(ws.cell(row=8, column=1).value, "I002")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=8, column=1).value, "I003")
-        self.assertEqual(ws.cell(row=8, column=2).value, "a008")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P4 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P4 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P5 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P5 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=19).value, "P6 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=20).value, "P6 (4, 6)")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=11, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_wells_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=144, scale='log')
-        p.apply_inducer(iptg, apply_to='wells')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "P1 (1, 1)\nI001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "P1 (1, 2)\nI002")
-        self.assertEqual(ws.cell(row=1, column=3).value, "P1 (1, 3)\nI003")
-        self.assertEqual(ws.cell(row=1, column=4).value, "P1 (1, 4)\nI004")
-        self.assertEqual(ws.cell(row=1, column=5).value, "P1 (1, 5)\nI005")
-        self.assertEqual(ws.cell(row=1, column=6).value, "P1 (1, 6)\nI006")
-        self.assertEqual(ws.cell(row=1, column=7).value, "P2 (1, 1)\nI007")
-        self.assertEqual(ws.cell(row=1, column=8).value, "P2 (1, 2)\nI008")
-        self.assertEqual(ws.cell(row=1, column=9).value, "P2 (1, 3)\nI009")
-        self.assertEqual(ws.cell(row=1, column=10).value, "P2 (1, 4)\nI010")
-        self.assertEqual(ws.cell(row=1, column=11).value, "P2 (1, 5)\nI011")
-        self.assertEqual(ws.cell(row=1, column=12).value, "P2 (1, 6)\nI012")
-        self.assertEqual(ws.cell(row=1, column=13).value, "P3 (1, 1)\nI013")
-        self.assertEqual(ws.cell(row=1, column=14).value, "P3 (1, 2)\nI014")
-        self.assertEqual(ws.cell(row=1, column=15).value, "P3 (1, 3)\nI015")
-        self.assertEqual(ws.cell(row=1, column=16).value, "P3 (1, 4)\nI016")
-        self.assertEqual(ws.cell(row=1, column=17).value, "P3 (1, 5)\nI017")
-        self.assertEqual(ws.cell(row=1, column=18).value, "P3 (1, 6)\nI018")
-        self.assertEqual(ws.cell(row=2, column=1).value, "P1 (2, 1)\nI019")
-        self.assertEqual(ws.cell(row=2, column=2).value, "P1 (2, 2)\nI020")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (2, 3)\nI021")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (2, 4)\nI022")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (2, 5)\nI023")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (2, 6)\nI024")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P2 (2, 1)\nI025")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P2 (2, 2)\nI026")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (2, 3)\nI027")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (2, 4)\nI028")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (2, 5)\nI029")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (2, 6)\nI030")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P3 (2, 1)\nI031")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P3 (2, 2)\nI032")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (2, 3)\nI033")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (2, 4)\nI034")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (2, 5)\nI035")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (2, 6)\nI036")
-        self.assertEqual(ws.cell(row=3, column=1).value, "P1 (3, 1)\nI037")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (3, 2)\nI038")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (3, 3)\nI039")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (3, 4)\nI040")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (3, 5)\nI041")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (3, 6)\nI042")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P2 (3, 1)\nI043")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (3, 2)\nI044")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (3, 3)\nI045")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (3, 4)\nI046")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (3, 5)\nI047")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (3, 6)\nI048")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P3 (3, 1)\nI049")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (3, 2)\nI050")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (3, 3)\nI051")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (3, 4)\nI052")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (3, 5)\nI053")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (3, 6)\nI054")
-        self.assertEqual(ws.cell(row=4, column=1).value, "P1 (4, 1)\nI055")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (4, 2)\nI056")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (4, 3)\nI057")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (4, 4)\nI058")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (4, 5)\nI059")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (4, 6)\nI060")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P2 (4, 1)\nI061")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (4, 2)\nI062")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (4, 3)\nI063")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (4, 4)\nI064")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (4, 5)\nI065")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (4, 6)\nI066")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P3 (4, 1)\nI067")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (4, 2)\nI068")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (4, 3)\nI069")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (4, 4)\nI070")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (4, 5)\nI071")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (4, 6)\nI072")
-        self.assertEqual(ws.cell(row=5, column=1).value, "P4 (1, 1)\nI073")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P4 (1, 2)\nI074")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P4 (1, 3)\nI075")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P4 (1, 4)\nI076")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P4 (1, 5)\nI077")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P4 (1, 6)\nI078")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P5 (1, 1)\nI079")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P5 (1, 2)\nI080")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P5 (1, 3)\nI081")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P5 (1, 4)\nI082")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P5 (1, 5)\nI083")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P5 (1, 6)\nI084")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P6 (1, 1)\nI085")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P6 (1, 2)\nI086")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P6 (1, 3)\nI087")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P6 (1, 4)\nI088")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P6 (1, 5)\nI089")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P6 (1, 6)\nI090")
-        self.assertEqual(ws.cell(row=6, column=1).value, "P4 (2, 1)\nI091")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P4 (2, 2)\nI092")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (2, 3)\nI093")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (2, 4)\nI094")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (2, 5)\nI095")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (2, 6)\nI096")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P5 (2, 1)\nI097")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P5 (2, 2)\nI098")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (2, 3)\nI099")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (2, 4)\nI100")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (2, 5)\nI101")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (2, 6)\nI102")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P6 (2, 1)\nI103")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P6 (2, 2)\nI104")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (2, 3)\nI105")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (2, 4)\nI106")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (2, 5)\nI107")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (2, 6)\nI108")
-        self.assertEqual(ws.cell(row=7, column=1).value, "P4 (3, 1)\nI109")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (3, 2)\nI110")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (3, 3)\nI111")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (3, 4)\nI112")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (3, 5)\nI113")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (3, 6)\nI114")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P5 (3, 1)\nI115")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (3, 2)\nI116")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (3, 3)\nI117")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (3, 4)\nI118")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (3, 5)\nI119")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (3, 6)\nI120")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P6 (3, 1)\nI121")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (3, 2)\nI122")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (3, 3)\nI123")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (3, 4)\nI124")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (3, 5)\nI125")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (3, 6)\nI126")
-        self.assertEqual(ws.cell(row=8, column=1).value, "P4 (4, 1)\nI127")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (4, 2)\nI128")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (4, 3)\nI129")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (4, 4)\nI130")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (4, 5)\nI131")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (4, 6)\nI132")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P5 (4, 1)\nI133")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (4, 2)\nI134")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (4, 3)\nI135")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (4, 4)\nI136")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (4, 5)\nI137")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (4, 6)\nI138")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P6 (4, 1)\nI139")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (4, 2)\nI140")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (4, 3)\nI141")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (4, 4)\nI142")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (4, 5)\nI143")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (4, 6)\nI144")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-
-    def test_save_rep_setup_instructions_inducer_wells_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=144, scale='log')
-        p.apply_inducer(iptg, apply_to='wells')
-        # Create second inducer for plate
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        atc.set_gradient(min=0.5, max=50, n=144, scale='log')
-        p.apply_inducer(atc, apply_to='wells')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "P1 (1, 1)\nI001\na001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "P1 (1, 2)\nI002\na002")
-        self.assertEqual(ws.cell(row=1, column=3).value, "P1 (1, 3)\nI003\na003")
-        self.assertEqual(ws.cell(row=1, column=4).value, "P1 (1, 4)\nI004\na004")
-        self.assertEqual(ws.cell(row=1, column=5).value, "P1 (1, 5)\nI005\na005")
-        self.assertEqual(ws.cell(row=1, column=6).value, "P1 (1, 6)\nI006\na006")
-        self.assertEqual(ws.cell(row=1, column=7).value, "P2 (1, 1)\nI007\na007")
-        self.assertEqual(ws.cell(row=1, column=8).value, "P2 (1, 2)\nI008\na008")
-        self.assertEqual(ws.cell(row=1, column=9).value, "P2 (1, 3)\nI009\na009")
-        self.assertEqual(ws.cell(row=1, column=10).value, "P2 (1, 4)\nI010\na010")
-        self.assertEqual(ws.cell(row=1, column=11).value, "P2 (1, 5)\nI011\na011")
-        self.assertEqual(ws.cell(row=1, column=12).value, "P2 (1, 6)\nI012\na012")
-        self.assertEqual(ws.cell(row=1, column=13).value, "P3 (1, 1)\nI013\na013")
-        self.assertEqual(ws.cell(row=1, column=14).value, "P3 (1, 2)\nI014\na014")
-        self.assertEqual(ws.cell(row=1, column=15).value, "P3 (1, 3)\nI015\na015")
-        self.assertEqual(ws.cell(row=1, column=16).value, "P3 (1, 4)\nI016\na016")
-        self.assertEqual(ws.cell(row=1, column=17).value, "P3 (1, 5)\nI017\na017")
-        self.assertEqual(ws.cell(row=1, column=18).value, "P3 (1, 6)\nI018\na018")
-        self.assertEqual(ws.cell(row=2, column=1).value, "P1 (2, 1)\nI019\na019")
-        self.assertEqual(ws.cell(row=2, column=2).value, "P1 (2, 2)\nI020\na020")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (2, 3)\nI021\na021")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (2, 4)\nI022\na022")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (2, 5)\nI023\na023")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (2, 6)\nI024\na024")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P2 (2, 1)\nI025\na025")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P2 (2, 2)\nI026\na026")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (2, 3)\nI027\na027")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (2, 4)\nI028\na028")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (2, 5)\nI029\na029")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (2, 6)\nI030\na030")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P3 (2, 1)\nI031\na031")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P3 (2, 2)\nI032\na032")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (2, 3)\nI033\na033")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (2, 4)\nI034\na034")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (2, 5)\nI035\na035")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (2, 6)\nI036\na036")
-        self.assertEqual(ws.cell(row=3, column=1).value, "P1 (3, 1)\nI037\na037")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (3, 2)\nI038\na038")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (3, 3)\nI039\na039")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (3, 4)\nI040\na040")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (3, 5)\nI041\na041")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (3, 6)\nI042\na042")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P2 (3, 1)\nI043\na043")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (3, 2)\nI044\na044")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (3, 3)\nI045\na045")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (3, 4)\nI046\na046")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (3, 5)\nI047\na047")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (3, 6)\nI048\na048")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P3 (3, 1)\nI049\na049")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (3, 2)\nI050\na050")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (3, 3)\nI051\na051")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (3, 4)\nI052\na052")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (3, 5)\nI053\na053")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (3, 6)\nI054\na054")
-        self.assertEqual(ws.cell(row=4, column=1).value, "P1 (4, 1)\nI055\na055")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (4, 2)\nI056\na056")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (4, 3)\nI057\na057")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (4, 4)\nI058\na058")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (4, 5)\nI059\na059")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (4, 6)\nI060\na060")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P2 (4, 1)\nI061\na061")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (4, 2)\nI062\na062")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (4, 3)\nI063\na063")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (4, 4)\nI064\na064")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (4, 5)\nI065\na065")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (4, 6)\nI066\na066")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P3 (4, 1)\nI067\na067")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (4, 2)\nI068\na068")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (4, 3)\nI069\na069")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (4, 4)\nI070\na070")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (4, 5)\nI071\na071")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (4, 6)\nI072\na072")
-        self.assertEqual(ws.cell(row=5, column=1).value, "P4 (1, 1)\nI073\na073")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P4 (1, 2)\nI074\na074")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P4 (1, 3)\nI075\na075")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P4 (1, 4)\nI076\na076")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P4 (1, 5)\nI077\na077")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P4 (1, 6)\nI078\na078")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P5 (1, 1)\nI079\na079")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P5 (1, 2)\nI080\na080")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P5 (1, 3)\nI081\na081")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P5 (1, 4)\nI082\na082")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P5 (1, 5)\nI083\na083")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P5 (1, 6)\nI084\na084")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P6 (1, 1)\nI085\na085")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P6 (1, 2)\nI086\na086")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P6 (1, 3)\nI087\na087")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P6 (1, 4)\nI088\na088")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P6 (1, 5)\nI089\na089")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P6 (1, 6)\nI090\na090")
-        self.assertEqual(ws.cell(row=6, column=1).value, "P4 (2, 1)\nI091\na091")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P4 (2, 2)\nI092\na092")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (2, 3)\nI093\na093")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (2, 4)\nI094\na094")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (2, 5)\nI095\na095")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (2, 6)\nI096\na096")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P5 (2, 1)\nI097\na097")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P5 (2, 2)\nI098\na098")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (2, 3)\nI099\na099")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (2, 4)\nI100\na100")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (2, 5)\nI101\na101")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (2, 6)\nI102\na102")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P6 (2, 1)\nI103\na103")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P6 (2, 2)\nI104\na104")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (2, 3)\nI105\na105")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (2, 4)\nI106\na106")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (2, 5)\nI107\na107")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (2, 6)\nI108\na108")
-        self.assertEqual(ws.cell(row=7, column=1).value, "P4 (3, 1)\nI109\na109")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (3, 2)\nI110\na110")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (3, 3)\nI111\na111")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (3, 4)\nI112\na112")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (3, 5)\nI113\na113")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (3, 6)\nI114\na114")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P5 (3, 1)\nI115\na115")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (3, 2)\nI116\na116")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (3, 3)\nI117\na117")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (3, 4)\nI118\na118")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (3, 5)\nI119\na119")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (3, 6)\nI120\na120")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P6 (3, 1)\nI121\na121")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (3, 2)\nI122\na122")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (3, 3)\nI123\na123")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (3, 4)\nI124\na124")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (3, 5)\nI125\na125")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (3, 6)\nI126\na126")
-        self.assertEqual(ws.cell(row=8, column=1).value, "P4 (4, 1)\nI127\na127")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (4, 2)\nI128\na128")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (4, 3)\nI129\na129")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (4, 4)\nI130\na130")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (4, 5)\nI131\na131")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (4, 6)\nI132\na132")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P5 (4, 1)\nI133\na133")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (4, 2)\nI134\na134")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (4, 3)\nI135\na135")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (4, 4)\nI136\na136")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (4, 5)\nI137\na137")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (4, 6)\nI138\na138")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P6 (4, 1)\nI139\na139")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (4, 2)\nI140\na140")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (4, 3)\nI141\na141")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (4, 4)\nI142\na142")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (4, 5)\nI143\na143")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (4, 6)\nI144\na144")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=11, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_wells_3(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Limit number of samples to measure
-        p.samples_to_measure = 80
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=80, scale='log')
-        p.apply_inducer(iptg, apply_to='wells')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "P1 (1, 1)\nI001")
-        self.assertEqual(ws.cell(row=1, column=2).value, "P1 (1, 2)\nI002")
-        self.assertEqual(ws.cell(row=1, column=3).value, "P1 (1, 3)\nI003")
-        self.assertEqual(ws.cell(row=1, column=4).value, "P1 (1, 4)\nI004")
-        self.assertEqual(ws.cell(row=1, column=5).value, "P1 (1, 5)\nI005")
-        self.assertEqual(ws.cell(row=1, column=6).value, "P1 (1, 6)\nI006")
-        self.assertEqual(ws.cell(row=1, column=7).value, "P2 (1, 1)\nI007")
-        self.assertEqual(ws.cell(row=1, column=8).value, "P2 (1, 2)\nI008")
-        self.assertEqual(ws.cell(row=1, column=9).value, "P2 (1, 3)\nI009")
-        self.assertEqual(ws.cell(row=1, column=10).value, "P2 (1, 4)\nI010")
-        self.assertEqual(ws.cell(row=1, column=11).value, "P2 (1, 5)\nI011")
-        self.assertEqual(ws.cell(row=1, column=12).value, "P2 (1, 6)\nI012")
-        self.assertEqual(ws.cell(row=1, column=13).value, "P3 (1, 1)\nI013")
-        self.assertEqual(ws.cell(row=1, column=14).value, "P3 (1, 2)\nI014")
-        self.assertEqual(ws.cell(row=1, column=15).value, "P3 (1, 3)\nI015")
-        self.assertEqual(ws.cell(row=1, column=16).value, "P3 (1, 4)\nI016")
-        self.assertEqual(ws.cell(row=1, column=17).value, "P3 (1, 5)\nI017")
-        self.assertEqual(ws.cell(row=1, column=18).value, "P3 (1, 6)\nI018")
-        self.assertEqual(ws.cell(row=2, column=1).value, "P1 (2, 1)\nI019")
-        self.assertEqual(ws.cell(row=2, column=2).value, "P1 (2, 2)\nI020")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (2, 3)\nI021")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (2, 4)\nI022")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (2, 5)\nI023")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (2, 6)\nI024")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P2 (2, 1)\nI025")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P2 (2, 2)\nI026")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (2, 3)\nI027")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (2, 4)\nI028")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (2, 5)\nI029")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (2, 6)\nI030")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P3 (2, 1)\nI031")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P3 (2, 2)\nI032")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (2, 3)\nI033")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (2, 4)\nI034")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (2, 5)\nI035")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (2, 6)\nI036")
-        self.assertEqual(ws.cell(row=3, column=1).value, "P1 (3, 1)\nI037")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (3, 2)\nI038")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (3, 3)\nI039")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (3, 4)\nI040")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (3, 5)\nI041")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (3, 6)\nI042")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P2 (3, 1)\nI043")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (3, 2)\nI044")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (3, 3)\nI045")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (3, 4)\nI046")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (3, 5)\nI047")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (3, 6)\nI048")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P3 (3, 1)\nI049")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (3, 2)\nI050")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (3, 3)\nI051")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (3, 4)\nI052")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (3, 5)\nI053")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (3, 6)\nI054")
-        self.assertEqual(ws.cell(row=4, column=1).value, "P1 (4, 1)\nI055")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (4, 2)\nI056")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (4, 3)\nI057")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (4, 4)\nI058")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (4, 5)\nI059")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (4, 6)\nI060")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P2 (4, 1)\nI061")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (4, 2)\nI062")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (4, 3)\nI063")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (4, 4)\nI064")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (4, 5)\nI065")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (4, 6)\nI066")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P3 (4, 1)\nI067")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (4, 2)\nI068")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (4, 3)\nI069")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (4, 4)\nI070")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (4, 5)\nI071")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (4, 6)\nI072")
-        self.assertEqual(ws.cell(row=5, column=1).value, "P4 (1, 1)\nI073")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P4 (1, 2)\nI074")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P4 (1, 3)\nI075")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P4 (1, 4)\nI076")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P4 (1, 5)\nI077")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P4 (1, 6)\nI078")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P5 (1, 1)\nI079")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P5 (1, 2)\nI080")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P5 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P5 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P5 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P5 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P6 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P6 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P6 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P6 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P6 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P6 (1, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value, "P4 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P4 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P5 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P5 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P6 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P6 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (2, 6)")
-        self.assertEqual(ws.cell(row=7, column=1).value, "P4 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P5 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P6 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (3, 6)")
-        self.assertEqual(ws.cell(row=8, column=1).value, "P4 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P5 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P6 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (4, 6)")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-
-    def test_save_rep_setup_instructions_inducer_wells_4(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=144, scale='log')
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='wells')
-        # Create second inducer for plate
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        atc.set_gradient(min=0.5, max=50, n=144, scale='log')
-        p.apply_inducer(atc, apply_to='wells')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        # Results of shuffling are different in python 2 and 3
-        ws = wb["Inducers for Plate Array A1"]
-        if six.PY2:
-            self.assertEqual(ws.cell(row=1, column=1).value, "P1 (1, 1)\nI018\na001")
-            self.assertEqual(ws.cell(row=1, column=2).value, "P1 (1, 2)\nI116\na002")
-            self.assertEqual(ws.cell(row=1, column=3).value, "P1 (1, 3)\nI081\na003")
-            self.assertEqual(ws.cell(row=1, column=4).value, "P1 (1, 4)\nI049\na004")
-            self.assertEqual(ws.cell(row=1, column=5).value, "P1 (1, 5)\nI062\na005")
-            self.assertEqual(ws.cell(row=1, column=6).value, "P1 (1, 6)\nI059\na006")
-            self.assertEqual(ws.cell(row=1, column=7).value, "P2 (1, 1)\nI072\na007")
-            self.assertEqual(ws.cell(row=1, column=8).value, "P2 (1, 2)\nI011\na008")
-            self.assertEqual(ws.cell(row=1, column=9).value, "P2 (1, 3)\nI044\na009")
-            self.assertEqual(ws.cell(row=1, column=10).value, "P2 (1, 4)\nI123\na010")
-            self.assertEqual(ws.cell(row=1, column=11).value, "P2 (1, 5)\nI075\na011")
-            self.assertEqual(ws.cell(row=1, column=12).value, "P2 (1, 6)\nI033\na012")
-            self.assertEqual(ws.cell(row=1, column=13).value, "P3 (1, 1)\nI048\na013")
-            self.assertEqual(ws.cell(row=1, column=14).value, "P3 (1, 2)\nI129\na014")
-            self.assertEqual(ws.cell(row=1, column=15).value, "P3 (1, 3)\nI010\na015")
-            self.assertEqual(ws.cell(row=1, column=16).value, "P3 (1, 4)\nI028\na016")
-            self.assertEqual(ws.cell(row=1, column=17).value, "P3 (1, 5)\nI005\na017")
-            self.assertEqual(ws.cell(row=1, column=18).value, "P3 (1, 6)\nI043\na018")
-            self.assertEqual(ws.cell(row=2, column=1).value, "P1 (2, 1)\nI023\na019")
-            self.assertEqual(ws.cell(row=2, column=2).value, "P1 (2, 2)\nI110\na020")
-            self.assertEqual(ws.cell(row=2, column=3).value, "P1 (2, 3)\nI002\na021")
-            self.assertEqual(ws.cell(row=2, column=4).value, "P1 (2, 4)\nI061\na022")
-            self.assertEqual(ws.cell(row=2, column=5).value, "P1 (2, 5)\nI085\na023")
-            self.assertEqual(ws.cell(row=2, column=6).value, "P1 (2, 6)\nI007\na024")
-            self.assertEqual(ws.cell(row=2, column=7).value, "P2 (2, 1)\nI083\na025")
-            self.assertEqual(ws.cell(row=2, column=8).value, "P2 (2, 2)\nI098\na026")
-            self.assertEqual(ws.cell(row=2, column=9).value, "P2 (2, 3)\nI079\na027")
-            self.assertEqual(ws.cell(row=2, column=10).value, "P2 (2, 4)\nI127\na028")
-            self.assertEqual(ws.cell(row=2, column=11).value, "P2 (2, 5)\nI017\na029")
-            self.assertEqual(ws.cell(row=2, column=12).value, "P2 (2, 6)\nI006\na030")
-            self.assertEqual(ws.cell(row=2, column=13).value, "P3 (2, 1)\nI008\na031")
-            self.assertEqual(ws.cell(row=2, column=14).value, "P3 (2, 2)\nI103\na032")
-            self.assertEqual(ws.cell(row=2, column=15).value, "P3 (2, 3)\nI056\na033")
-            self.assertEqual(ws.cell(row=2, column=16).value, "P3 (2, 4)\nI076\na034")
-            self.assertEqual(ws.cell(row=2, column=17).value, "P3 (2, 5)\nI087\na035")
-            self.assertEqual(ws.cell(row=2, column=18).value, "P3 (2, 6)\nI065\na036")
-            self.assertEqual(ws.cell(row=3, column=1).value, "P1 (3, 1)\nI102\na037")
-            self.assertEqual(ws.cell(row=3, column=2).value, "P1 (3, 2)\nI014\na038")
-            self.assertEqual(ws.cell(row=3, column=3).value, "P1 (3, 3)\nI019\na039")
-            self.assertEqual(ws.cell(row=3, column=4).value, "P1 (3, 4)\nI021\na040")
-            self.assertEqual(ws.cell(row=3, column=5).value, "P1 (3, 5)\nI009\na041")
-            self.assertEqual(ws.cell(row=3, column=6).value, "P1 (3, 6)\nI024\na042")
-            self.assertEqual(ws.cell(row=3, column=7).value, "P2 (3, 1)\nI038\na043")
-            self.assertEqual(ws.cell(row=3, column=8).value, "P2 (3, 2)\nI100\na044")
-            self.assertEqual(ws.cell(row=3, column=9).value, "P2 (3, 3)\nI105\na045")
-            self.assertEqual(ws.cell(row=3, column=10).value, "P2 (3, 4)\nI117\na046")
-            self.assertEqual(ws.cell(row=3, column=11).value, "P2 (3, 5)\nI134\na047")
-            self.assertEqual(ws.cell(row=3, column=12).value, "P2 (3, 6)\nI039\na048")
-            self.assertEqual(ws.cell(row=3, column=13).value, "P3 (3, 1)\nI074\na049")
-            self.assertEqual(ws.cell(row=3, column=14).value, "P3 (3, 2)\nI045\na050")
-            self.assertEqual(ws.cell(row=3, column=15).value, "P3 (3, 3)\nI042\na051")
-            self.assertEqual(ws.cell(row=3, column=16).value, "P3 (3, 4)\nI140\na052")
-            self.assertEqual(ws.cell(row=3, column=17).value, "P3 (3, 5)\nI131\na053")
-            self.assertEqual(ws.cell(row=3, column=18).value, "P3 (3, 6)\nI111\na054")
-            self.assertEqual(ws.cell(row=4, column=1).value, "P1 (4, 1)\nI077\na055")
-            self.assertEqual(ws.cell(row=4, column=2).value, "P1 (4, 2)\nI016\na056")
-            self.assertEqual(ws.cell(row=4, column=3).value, "P1 (4, 3)\nI068\na057")
-            self.assertEqual(ws.cell(row=4, column=4).value, "P1 (4, 4)\nI139\na058")
-            self.assertEqual(ws.cell(row=4, column=5).value, "P1 (4, 5)\nI057\na059")
-            self.assertEqual(ws.cell(row=4, column=6).value, "P1 (4, 6)\nI031\na060")
-            self.assertEqual(ws.cell(row=4, column=7).value, "P2 (4, 1)\nI084\na061")
-            self.assertEqual(ws.cell(row=4, column=8).value, "P2 (4, 2)\nI054\na062")
-            self.assertEqual(ws.cell(row=4, column=9).value, "P2 (4, 3)\nI066\na063")
-            self.assertEqual(ws.cell(row=4, column=10).value, "P2 (4, 4)\nI099\na064")
-            self.assertEqual(ws.cell(row=4, column=11).value, "P2 (4, 5)\nI095\na065")
-            self.assertEqual(ws.cell(row=4, column=12).value, "P2 (4, 6)\nI132\na066")
-            self.assertEqual(ws.cell(row=4, column=13).value, "P3 (4, 1)\nI012\na067")
-            self.assertEqual(ws.cell(row=4, column=14).value, "P3 (4, 2)\nI113\na068")
-            self.assertEqual(ws.cell(row=4, column=15).value, "P3 (4, 3)\nI097\na069")
-            self.assertEqual(ws.cell(row=4, column=16).value, "P3 (4, 4)\nI086\na070")
-            self.assertEqual(ws.cell(row=4, column=17).value, "P3 (4, 5)\nI050\na071")
-            self.assertEqual(ws.cell(row=4, column=18).value, "P3 (4, 6)\nI088\na072")
-            self.assertEqual(ws.cell(row=5, column=1).value, "P4 (1, 1)\nI137\na073")
-            self.assertEqual(ws.cell(row=5, column=2).value, "P4 (1, 2)\nI037\na074")
-            self.assertEqual(ws.cell(row=5, column=3).value, "P4 (1, 3)\nI096\na075")
-            self.assertEqual(ws.cell(row=5, column=4).value, "P4 (1, 4)\nI108\na076")
-            self.assertEqual(ws.cell(row=5, column=5).value, "P4 (1, 5)\nI107\na077")
-            self.assertEqual(ws.cell(row=5, column=6).value, "P4 (1, 6)\nI040\na078")
-            self.assertEqual(ws.cell(row=5, column=7).value, "P5 (1, 1)\nI035\na079")
-            self.assertEqual(ws.cell(row=5, column=8).value, "P5 (1, 2)\nI128\na080")
-            self.assertEqual(ws.cell(row=5, column=9).value, "P5 (1, 3)\nI093\na081")
-            self.assertEqual(ws.cell(row=5, column=10).value, "P5 (1, 4)\nI143\na082")
-            self.assertEqual(ws.cell(row=5, column=11).value, "P5 (1, 5)\nI138\na083")
-            self.assertEqual(ws.cell(row=5, column=12).value, "P5 (1, 6)\nI015\na084")
-            self.assertEqual(ws.cell(row=5, column=13).value, "P6 (1, 1)\nI141\na085")
-            self.assertEqual(ws.cell(row=5, column=14).value, "P6 (1, 2)\nI106\na086")
-            self.assertEqual(ws.cell(row=5, column=15).value, "P6 (1, 3)\nI022\na087")
-            self.assertEqual(ws.cell(row=5, column=16).value, "P6 (1, 4)\nI118\na088")
-            self.assertEqual(ws.cell(row=5, column=17).value, "P6 (1, 5)\nI053\na089")
-            self.assertEqual(ws.cell(row=5, column=18).value, "P6 (1, 6)\nI046\na090")
-            self.assertEqual(ws.cell(row=6, column=1).value, "P4 (2, 1)\nI078\na091")
-            self.assertEqual(ws.cell(row=6, column=2).value, "P4 (2, 2)\nI082\na092")
-            self.assertEqual(ws.cell(row=6, column=3).value, "P4 (2, 3)\nI055\na093")
-            self.assertEqual(ws.cell(row=6, column=4).value, "P4 (2, 4)\nI029\na094")
-            self.assertEqual(ws.cell(row=6, column=5).value, "P4 (2, 5)\nI064\na095")
-            self.assertEqual(ws.cell(row=6, column=6).value, "P4 (2, 6)\nI080\na096")
-            self.assertEqual(ws.cell(row=6, column=7).value, "P5 (2, 1)\nI041\na097")
-            self.assertEqual(ws.cell(row=6, column=8).value, "P5 (2, 2)\nI092\na098")
-            self.assertEqual(ws.cell(row=6, column=9).value, "P5 (2, 3)\nI071\na099")
-            self.assertEqual(ws.cell(row=6, column=10).value, "P5 (2, 4)\nI073\na100")
-            self.assertEqual(ws.cell(row=6, column=11).value, "P5 (2, 5)\nI034\na101")
-            self.assertEqual(ws.cell(row=6, column=12).value, "P5 (2, 6)\nI136\na102")
-            self.assertEqual(ws.cell(row=6, column=13).value, "P6 (2, 1)\nI089\na103")
-            self.assertEqual(ws.cell(row=6, column=14).value, "P6 (2, 2)\nI104\na104")
-            self.assertEqual(ws.cell(row=6, column=15).value, "P6 (2, 3)\nI144\na105")
-            self.assertEqual(ws.cell(row=6, column=16).value, "P6 (2, 4)\nI069\na106")
-            self.assertEqual(ws.cell(row=6, column=17).value, "P6 (2, 5)\nI060\na107")
-            self.assertEqual(ws.cell(row=6, column=18).value, "P6 (2, 6)\nI091\na108")
-            self.assertEqual(ws.cell(row=7, column=1).value, "P4 (3, 1)\nI003\na109")
-            self.assertEqual(ws.cell(row=7, column=2).value, "P4 (3, 2)\nI032\na110")
-            self.assertEqual(ws.cell(row=7, column=3).value, "P4 (3, 3)\nI052\na111")
-            self.assertEqual(ws.cell(row=7, column=4).value, "P4 (3, 4)\nI025\na112")
-            self.assertEqual(ws.cell(row=7, column=5).value, "P4 (3, 5)\nI126\na113")
-            self.assertEqual(ws.cell(row=7, column=6).value, "P4 (3, 6)\nI027\na114")
-            self.assertEqual(ws.cell(row=7, column=7).value, "P5 (3, 1)\nI130\na115")
-            self.assertEqual(ws.cell(row=7, column=8).value, "P5 (3, 2)\nI119\na116")
-            self.assertEqual(ws.cell(row=7, column=9).value, "P5 (3, 3)\nI120\na117")
-            self.assertEqual(ws.cell(row=7, column=10).value, "P5 (3, 4)\nI124\na118")
-            self.assertEqual(ws.cell(row=7, column=11).value, "P5 (3, 5)\nI051\na119")
-            self.assertEqual(ws.cell(row=7, column=12).value, "P5 (3, 6)\nI026\na120")
-            self.assertEqual(ws.cell(row=7, column=13).value, "P6 (3, 1)\nI047\na121")
-            self.assertEqual(ws.cell(row=7, column=14).value, "P6 (3, 2)\nI115\na122")
-            self.assertEqual(ws.cell(row=7, column=15).value, "P6 (3, 3)\nI067\na123")
-            self.assertEqual(ws.cell(row=7, column=16).value, "P6 (3, 4)\nI125\na124")
-            self.assertEqual(ws.cell(row=7, column=17).value, "P6 (3, 5)\nI135\na125")
-            self.assertEqual(ws.cell(row=7, column=18).value, "P6 (3, 6)\nI114\na126")
-            self.assertEqual(ws.cell(row=8, column=1).value, "P4 (4, 1)\nI121\na127")
-            self.assertEqual(ws.cell(row=8, column=2).value, "P4 (4, 2)\nI030\na128")
-            self.assertEqual(ws.cell(row=8, column=3).value, "P4 (4, 3)\nI094\na129")
-            self.assertEqual(ws.cell(row=8, column=4).value, "P4 (4, 4)\nI133\na130")
-            self.assertEqual(ws.cell(row=8, column=5).value, "P4 (4, 5)\nI001\na131")
-            self.assertEqual(ws.cell(row=8, column=6).value, "P4 (4, 6)\nI101\na132")
-            self.assertEqual(ws.cell(row=8, column=7).value, "P5 (4, 1)\nI058\na133")
-            self.assertEqual(ws.cell(row=8, column=8).value, "P5 (4, 2)\nI112\na134")
-            self.assertEqual(ws.cell(row=8, column=9).value, "P5 (4, 3)\nI004\na135")
-            self.assertEqual(ws.cell(row=8, column=10).value, "P5 (4, 4)\nI013\na136")
-            self.assertEqual(ws.cell(row=8, column=11).value, "P5 (4, 5)\nI142\na137")
-            self.assertEqual(ws.cell(row=8, column=12).value, "P5 (4, 6)\nI090\na138")
-            self.assertEqual(ws.cell(row=8, column=13).value, "P6 (4, 1)\nI063\na139")
-            self.assertEqual(ws.cell(row=8, column=14).value, "P6 (4, 2)\nI070\na140")
-            self.assertEqual(ws.cell(row=8, column=15).value, "P6 (4, 3)\nI036\na141")
-            self.assertEqual(ws.cell(row=8, column=16).value, "P6 (4, 4)\nI109\na142")
-            self.assertEqual(ws.cell(row=8, column=17).value, "P6 (4, 5)\nI122\na143")
-            self.assertEqual(ws.cell(row=8, column=18).value, "P6 (4, 6)\nI020\na144")
-        elif six.PY3:
-            self.assertEqual(ws.cell(row=1, column=1).value, "P1 (1, 1)\nI096\na001")
-            self.assertEqual(ws.cell(row=1, column=2).value, "P1 (1, 2)\nI129\na002")
-            self.assertEqual(ws.cell(row=1, column=3).value, "P1 (1, 3)\nI027\na003")
-            self.assertEqual(ws.cell(row=1, column=4).value, "P1 (1, 4)\nI021\na004")
-            self.assertEqual(ws.cell(row=1, column=5).value, "P1 (1, 5)\nI085\na005")
-            self.assertEqual(ws.cell(row=1, column=6).value, "P1 (1, 6)\nI060\na006")
-            self.assertEqual(ws.cell(row=1, column=7).value, "P2 (1, 1)\nI104\na007")
-            self.assertEqual(ws.cell(row=1, column=8).value, "P2 (1, 2)\nI082\na008")
-            self.assertEqual(ws.cell(row=1, column=9).value, "P2 (1, 3)\nI120\na009")
-            self.assertEqual(ws.cell(row=1, column=10).value, "P2 (1, 4)\nI107\na010")
-            self.assertEqual(ws.cell(row=1, column=11).value, "P2 (1, 5)\nI058\na011")
-            self.assertEqual(ws.cell(row=1, column=12).value, "P2 (1, 6)\nI010\na012")
-            self.assertEqual(ws.cell(row=1, column=13).value, "P3 (1, 1)\nI006\na013")
-            self.assertEqual(ws.cell(row=1, column=14).value, "P3 (1, 2)\nI133\na014")
-            self.assertEqual(ws.cell(row=1, column=15).value, "P3 (1, 3)\nI080\na015")
-            self.assertEqual(ws.cell(row=1, column=16).value, "P3 (1, 4)\nI122\na016")
-            self.assertEqual(ws.cell(row=1, column=17).value, "P3 (1, 5)\nI061\na017")
-            self.assertEqual(ws.cell(row=1, column=18).value, "P3 (1, 6)\nI077\na018")
-            self.assertEqual(ws.cell(row=2, column=1).value, "P1 (2, 1)\nI073\na019")
-            self.assertEqual(ws.cell(row=2, column=2).value, "P1 (2, 2)\nI143\na020")
-            self.assertEqual(ws.cell(row=2, column=3).value, "P1 (2, 3)\nI078\na021")
-            self.assertEqual(ws.cell(row=2, column=4).value, "P1 (2, 4)\nI099\na022")
-            self.assertEqual(ws.cell(row=2, column=5).value, "P1 (2, 5)\nI112\na023")
-            self.assertEqual(ws.cell(row=2, column=6).value, "P1 (2, 6)\nI018\na024")
-            self.assertEqual(ws.cell(row=2, column=7).value, "P2 (2, 1)\nI022\na025")
-            self.assertEqual(ws.cell(row=2, column=8).value, "P2 (2, 2)\nI009\na026")
-            self.assertEqual(ws.cell(row=2, column=9).value, "P2 (2, 3)\nI036\na027")
-            self.assertEqual(ws.cell(row=2, column=10).value, "P2 (2, 4)\nI075\na028")
-            self.assertEqual(ws.cell(row=2, column=11).value, "P2 (2, 5)\nI019\na029")
-            self.assertEqual(ws.cell(row=2, column=12).value, "P2 (2, 6)\nI110\na030")
-            self.assertEqual(ws.cell(row=2, column=13).value, "P3 (2, 1)\nI074\na031")
-            self.assertEqual(ws.cell(row=2, column=14).value, "P3 (2, 2)\nI106\na032")
-            self.assertEqual(ws.cell(row=2, column=15).value, "P3 (2, 3)\nI053\na033")
-            self.assertEqual(ws.cell(row=2, column=16).value, "P3 (2, 4)\nI044\na034")
-            self.assertEqual(ws.cell(row=2, column=17).value, "P3 (2, 5)\nI079\na035")
-            self.assertEqual(ws.cell(row=2, column=18).value, "P3 (2, 6)\nI144\na036")
-            self.assertEqual(ws.cell(row=3, column=1).value, "P1 (3, 1)\nI089\na037")
-            self.assertEqual(ws.cell(row=3, column=2).value, "P1 (3, 2)\nI130\na038")
-            self.assertEqual(ws.cell(row=3, column=3).value, "P1 (3, 3)\nI015\na039")
-            self.assertEqual(ws.cell(row=3, column=4).value, "P1 (3, 4)\nI091\na040")
-            self.assertEqual(ws.cell(row=3, column=5).value, "P1 (3, 5)\nI063\na041")
-            self.assertEqual(ws.cell(row=3, column=6).value, "P1 (3, 6)\nI095\na042")
-            self.assertEqual(ws.cell(row=3, column=7).value, "P2 (3, 1)\nI042\na043")
-            self.assertEqual(ws.cell(row=3, column=8).value, "P2 (3, 2)\nI056\na044")
-            self.assertEqual(ws.cell(row=3, column=9).value, "P2 (3, 3)\nI142\na045")
-            self.assertEqual(ws.cell(row=3, column=10).value, "P2 (3, 4)\nI086\na046")
-            self.assertEqual(ws.cell(row=3, column=11).value, "P2 (3, 5)\nI040\na047")
-            self.assertEqual(ws.cell(row=3, column=12).value, "P2 (3, 6)\nI046\na048")
-            self.assertEqual(ws.cell(row=3, column=13).value, "P3 (3, 1)\nI020\na049")
-            self.assertEqual(ws.cell(row=3, column=14).value, "P3 (3, 2)\nI108\na050")
-            self.assertEqual(ws.cell(row=3, column=15).value, "P3 (3, 3)\nI141\na051")
-            self.assertEqual(ws.cell(row=3, column=16).value, "P3 (3, 4)\nI114\na052")
-            self.assertEqual(ws.cell(row=3, column=17).value, "P3 (3, 5)\nI067\na053")
-            self.assertEqual(ws.cell(row=3, column=18).value, "P3 (3, 6)\nI101\na054")
-            self.assertEqual(ws.cell(row=4, column=1).value, "P1 (4, 1)\nI131\na055")
-            self.assertEqual(ws.cell(row=4, column=2).value, "P1 (4, 2)\nI026\na056")
-            self.assertEqual(ws.cell(row=4, column=3).value, "P1 (4, 3)\nI128\na057")
-            self.assertEqual(ws.cell(row=4, column=4).value, "P1 (4, 4)\nI034\na058")
-            self.assertEqual(ws.cell(row=4, column=5).value, "P1 (4, 5)\nI011\na059")
-            self.assertEqual(ws.cell(row=4, column=6).value, "P1 (4, 6)\nI050\na060")
-            self.assertEqual(ws.cell(row=4, column=7).value, "P2 (4, 1)\nI007\na061")
-            self.assertEqual(ws.cell(row=4, column=8).value, "P2 (4, 2)\nI033\na062")
-            self.assertEqual(ws.cell(row=4, column=9).value, "P2 (4, 3)\nI123\na063")
-            self.assertEqual(ws.cell(row=4, column=10).value, "P2 (4, 4)\nI126\na064")
-            self.assertEqual(ws.cell(row=4, column=11).value, "P2 (4, 5)\nI012\na065")
-            self.assertEqual(ws.cell(row=4, column=12).value, "P2 (4, 6)\nI048\na066")
-            self.assertEqual(ws.cell(row=4, column=13).value, "P3 (4, 1)\nI047\na067")
-            self.assertEqual(ws.cell(row=4, column=14).value, "P3 (4, 2)\nI023\na068")
-            self.assertEqual(ws.cell(row=4, column=15).value, "P3 (4, 3)\nI092\na069")
-            self.assertEqual(ws.cell(row=4, column=16).value, "P3 (4, 4)\nI052\na070")
-            self.assertEqual(ws.cell(row=4, column=17).value, "P3 (4, 5)\nI032\na071")
-            self.assertEqual(ws.cell(row=4, column=18).value, "P3 (4, 6)\nI062\na072")
-            self.assertEqual(ws.cell(row=5, column=1).value, "P4 (1, 1)\nI005\na073")
-            self.assertEqual(ws.cell(row=5, column=2).value, "P4 (1, 2)\nI051\na074")
-            self.assertEqual(ws.cell(row=5, column=3).value, "P4 (1, 3)\nI097\na075")
-            self.assertEqual(ws.cell(row=5, column=4).value, "P4 (1, 4)\nI102\na076")
-            self.assertEqual(ws.cell(row=5, column=5).value, "P4 (1, 5)\nI124\na077")
-            self.assertEqual(ws.cell(row=5, column=6).value, "P4 (1, 6)\nI037\na078")
-            self.assertEqual(ws.cell(row=5, column=7).value, "P5 (1, 1)\nI039\na079")
-            self.assertEqual(ws.cell(row=5, column=8).value, "P5 (1, 2)\nI135\na080")
-            self.assertEqual(ws.cell(row=5, column=9).value, "P5 (1, 3)\nI090\na081")
-            self.assertEqual(ws.cell(row=5, column=10).value, "P5 (1, 4)\nI109\na082")
-            self.assertEqual(ws.cell(row=5, column=11).value, "P5 (1, 5)\nI065\na083")
-            self.assertEqual(ws.cell(row=5, column=12).value, "P5 (1, 6)\nI043\na084")
-            self.assertEqual(ws.cell(row=5, column=13).value, "P6 (1, 1)\nI016\na085")
-            self.assertEqual(ws.cell(row=5, column=14).value, "P6 (1, 2)\nI094\na086")
-            self.assertEqual(ws.cell(row=5, column=15).value, "P6 (1, 3)\nI081\na087")
-            self.assertEqual(ws.cell(row=5, column=16).value, "P6 (1, 4)\nI024\na088")
-            self.assertEqual(ws.cell(row=5, column=17).value, "P6 (1, 5)\nI013\na089")
-            self.assertEqual(ws.cell(row=5, column=18).value, "P6 (1, 6)\nI083\na090")
-            self.assertEqual(ws.cell(row=6, column=1).value, "P4 (2, 1)\nI072\na091")
-            self.assertEqual(ws.cell(row=6, column=2).value, "P4 (2, 2)\nI136\na092")
-            self.assertEqual(ws.cell(row=6, column=3).value, "P4 (2, 3)\nI118\na093")
-            self.assertEqual(ws.cell(row=6, column=4).value, "P4 (2, 4)\nI038\na094")
-            self.assertEqual(ws.cell(row=6, column=5).value, "P4 (2, 5)\nI059\na095")
-            self.assertEqual(ws.cell(row=6, column=6).value, "P4 (2, 6)\nI105\na096")
-            self.assertEqual(ws.cell(row=6, column=7).value, "P5 (2, 1)\nI087\na097")
-            self.assertEqual(ws.cell(row=6, column=8).value, "P5 (2, 2)\nI132\na098")
-            self.assertEqual(ws.cell(row=6, column=9).value, "P5 (2, 3)\nI045\na099")
-            self.assertEqual(ws.cell(row=6, column=10).value, "P5 (2, 4)\nI134\na100")
-            self.assertEqual(ws.cell(row=6, column=11).value, "P5 (2, 5)\nI071\na101")
-            self.assertEqual(ws.cell(row=6, column=12).value, "P5 (2, 6)\nI064\na102")
-            self.assertEqual(ws.cell(row=6, column=13).value, "P6 (2, 1)\nI057\na103")
-            self.assertEqual(ws.cell(row=6, column=14).value, "P6 (2, 2)\nI137\na104")
-            self.assertEqual(ws.cell(row=6, column=15).value, "P6 (2, 3)\nI029\na105")
-            self.assertEqual(ws.cell(row=6, column=16).value, "P6 (2, 4)\nI068\na106")
-            self.assertEqual(ws.cell(row=6, column=17).value, "P6 (2, 5)\nI117\na107")
-            self.assertEqual(ws.cell(row=6, column=18).value, "P6 (2, 6)\nI140\na108")
-            self.assertEqual(ws.cell(row=7, column=1).value, "P4 (3, 1)\nI055\na109")
-            self.assertEqual(ws.cell(row=7, column=2).value, "P4 (3, 2)\nI028\na110")
-            self.assertEqual(ws.cell(row=7, column=3).value, "P4 (3, 3)\nI088\na111")
-            self.assertEqual(ws.cell(row=7, column=4).value, "P4 (3, 4)\nI049\na112")
-            self.assertEqual(ws.cell(row=7, column=5).value, "P4 (3, 5)\nI113\na113")
-            self.assertEqual(ws.cell(row=7, column=6).value, "P4 (3, 6)\nI002\na114")
-            self.assertEqual(ws.cell(row=7, column=7).value, "P5 (3, 1)\nI070\na115")
-            self.assertEqual(ws.cell(row=7, column=8).value, "P5 (3, 2)\nI084\na116")
-            self.assertEqual(ws.cell(row=7, column=9).value, "P5 (3, 3)\nI119\na117")
-            self.assertEqual(ws.cell(row=7, column=10).value, "P5 (3, 4)\nI003\na118")
-            self.assertEqual(ws.cell(row=7, column=11).value, "P5 (3, 5)\nI004\na119")
-            self.assertEqual(ws.cell(row=7, column=12).value, "P5 (3, 6)\nI041\na120")
-            self.assertEqual(ws.cell(row=7, column=13).value, "P6 (3, 1)\nI139\na121")
-            self.assertEqual(ws.cell(row=7, column=14).value, "P6 (3, 2)\nI014\na122")
-            self.assertEqual(ws.cell(row=7, column=15).value, "P6 (3, 3)\nI138\na123")
-            self.assertEqual(ws.cell(row=7, column=16).value, "P6 (3, 4)\nI076\na124")
-            self.assertEqual(ws.cell(row=7, column=17).value, "P6 (3, 5)\nI030\na125")
-            self.assertEqual(ws.cell(row=7, column=18).value, "P6 (3, 6)\nI103\na126")
-            self.assertEqual(ws.cell(row=8, column=1).value, "P4 (4, 1)\nI093\na127")
-            self.assertEqual(ws.cell(row=8, column=2).value, "P4 (4, 2)\nI069\na128")
-            self.assertEqual(ws.cell(row=8, column=3).value, "P4 (4, 3)\nI115\na129")
-            self.assertEqual(ws.cell(row=8, column=4).value, "P4 (4, 4)\nI001\na130")
-            self.assertEqual(ws.cell(row=8, column=5).value, "P4 (4, 5)\nI111\na131")
-            self.assertEqual(ws.cell(row=8, column=6).value, "P4 (4, 6)\nI100\na132")
-            self.assertEqual(ws.cell(row=8, column=7).value, "P5 (4, 1)\nI008\na133")
-            self.assertEqual(ws.cell(row=8, column=8).value, "P5 (4, 2)\nI125\na134")
-            self.assertEqual(ws.cell(row=8, column=9).value, "P5 (4, 3)\nI025\na135")
-            self.assertEqual(ws.cell(row=8, column=10).value, "P5 (4, 4)\nI054\na136")
-            self.assertEqual(ws.cell(row=8, column=11).value, "P5 (4, 5)\nI098\na137")
-            self.assertEqual(ws.cell(row=8, column=12).value, "P5 (4, 6)\nI121\na138")
-            self.assertEqual(ws.cell(row=8, column=13).value, "P6 (4, 1)\nI116\na139")
-            self.assertEqual(ws.cell(row=8, column=14).value, "P6 (4, 2)\nI127\na140")
-            self.assertEqual(ws.cell(row=8, column=15).value, "P6 (4, 3)\nI031\na141")
-            self.assertEqual(ws.cell(row=8, column=16).value, "P6 (4, 4)\nI066\na142")
-            self.assertEqual(ws.cell(row=8, column=17).value, "P6 (4, 5)\nI017\na143")
-            self.assertEqual(ws.cell(row=8, column=18).value, "P6 (4, 6)\nI035\na144")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=11, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-
-    def test_save_rep_setup_instructions_inducer_media_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Limit number of samples to measure
-        p.samples_to_measure = 80
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.concentrations = [10]
-        p.apply_inducer(iptg, apply_to='media')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "P1 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=2).value, "P1 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=3).value, "P1 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=4).value, "P1 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=5).value, "P1 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=6).value, "P1 (1, 6)")
-        self.assertEqual(ws.cell(row=1, column=7).value, "P2 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=8).value, "P2 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=9).value, "P2 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=10).value, "P2 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=11).value, "P2 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=12).value, "P2 (1, 6)")
-        self.assertEqual(ws.cell(row=1, column=13).value, "P3 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=14).value, "P3 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=15).value, "P3 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=16).value, "P3 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=17).value, "P3 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=18).value, "P3 (1, 6)")
-        self.assertEqual(ws.cell(row=2, column=1).value, "P1 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=2).value, "P1 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (2, 6)")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P2 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P2 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (2, 6)")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P3 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P3 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (2, 6)")
-        self.assertEqual(ws.cell(row=3, column=1).value, "P1 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (3, 6)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P2 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (3, 6)")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P3 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (3, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "P1 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (4, 6)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P2 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (4, 6)")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P3 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (4, 6)")
-        self.assertEqual(ws.cell(row=5, column=1).value, "P4 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P4 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P4 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P4 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P4 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P4 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P5 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P5 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P5 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P5 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P5 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P5 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P6 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P6 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P6 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P6 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P6 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P6 (1, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value, "P4 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P4 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P5 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P5 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P6 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P6 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (2, 6)")
-        self.assertEqual(ws.cell(row=7, column=1).value, "P4 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P5 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P6 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (3, 6)")
-        self.assertEqual(ws.cell(row=8, column=1).value, "P4 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P5 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P6 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (4, 6)")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 5.00µL of IPTG to media.")
-
-    def test_save_rep_setup_instructions_inducer_media_2(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Limit number of samples to measure
-        p.samples_to_measure = 80
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.concentrations = [10]
-        p.apply_inducer(iptg, apply_to='media')
-        # Create second inducer for plate
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        atc.concentrations = [12]
-        p.apply_inducer(atc, apply_to='media')
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "P1 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=2).value, "P1 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=3).value, "P1 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=4).value, "P1 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=5).value, "P1 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=6).value, "P1 (1, 6)")
-        self.assertEqual(ws.cell(row=1, column=7).value, "P2 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=8).value, "P2 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=9).value, "P2 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=10).value, "P2 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=11).value, "P2 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=12).value, "P2 (1, 6)")
-        self.assertEqual(ws.cell(row=1, column=13).value, "P3 (1, 1)")
-        self.assertEqual(ws.cell(row=1, column=14).value, "P3 (1, 2)")
-        self.assertEqual(ws.cell(row=1, column=15).value, "P3 (1, 3)")
-        self.assertEqual(ws.cell(row=1, column=16).value, "P3 (1, 4)")
-        self.assertEqual(ws.cell(row=1, column=17).value, "P3 (1, 5)")
-        self.assertEqual(ws.cell(row=1, column=18).value, "P3 (1, 6)")
-        self.assertEqual(ws.cell(row=2, column=1).value, "P1 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=2).value, "P1 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (2, 6)")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P2 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P2 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (2, 6)")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P3 (2, 1)")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P3 (2, 2)")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (2, 3)")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (2, 4)")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (2, 5)")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (2, 6)")
-        self.assertEqual(ws.cell(row=3, column=1).value, "P1 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (3, 6)")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P2 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (3, 6)")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P3 (3, 1)")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (3, 2)")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (3, 3)")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (3, 4)")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (3, 5)")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (3, 6)")
-        self.assertEqual(ws.cell(row=4, column=1).value, "P1 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (4, 6)")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P2 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (4, 6)")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P3 (4, 1)")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (4, 2)")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (4, 3)")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (4, 4)")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (4, 5)")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (4, 6)")
-        self.assertEqual(ws.cell(row=5, column=1).value, "P4 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P4 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P4 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P4 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P4 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P4 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P5 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P5 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P5 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P5 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P5 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P5 (1, 6)")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P6 (1, 1)")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P6 (1, 2)")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P6 (1, 3)")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P6 (1, 4)")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P6 (1, 5)")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P6 (1, 6)")
-        self.assertEqual(ws.cell(row=6, column=1).value, "P4 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P4 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P5 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P5 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (2, 6)")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P6 (2, 1)")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P6 (2, 2)")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (2, 3)")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (2, 4)")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (2, 5)")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (2, 6)")
-        self.assertEqual(ws.cell(row=7, column=1).value, "P4 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P5 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (3, 6)")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P6 (3, 1)")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (3, 2)")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (3, 3)")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (3, 4)")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (3, 5)")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (3, 6)")
-        self.assertEqual(ws.cell(row=8, column=1).value, "P4 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P5 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (4, 6)")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P6 (4, 1)")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (4, 2)")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (4, 3)")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (4, 4)")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (4, 5)")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (4, 6)")
-        self.assertEqual(ws.cell(row=10, column=1).value,
-                         u"Add 5.00µL of IPTG to media.")
-        self.assertEqual(ws.cell(row=11, column=1).value,
-                         u"Add 10.00µL of aTc to media.")
-
-    def test_save_rep_setup_instructions_inducer_mixed(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=18, scale='log')
-        p.apply_inducer(iptg, apply_to='rows')
-
-        # Create second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        atc.set_gradient(min=0.5, max=50, n=8, scale='log')
-        p.apply_inducer(atc, apply_to='cols')
-
-        # Create inducer for plate wells
-        xyl = platedesign.inducer.ChemicalInducer(
-            name='Xylose',
-            units=u'%')
-        xyl.shot_vol = 3.
-        xyl.set_gradient(min=1e-6, max=1e-3, n=144, scale='log')
-        p.apply_inducer(xyl, apply_to='wells')
-
-        # Create inducer for plate
-        sugar = platedesign.inducer.ChemicalInducer(
-            name='Sugar',
-            units=u'ng/µL')
-        sugar.shot_vol = 8.
-        sugar.concentrations = [2]
-        p.apply_inducer(sugar, apply_to='media')
-
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Spreadsheet should contain one sheet
-        self.assertEqual(wb.sheetnames, ["Inducers for Plate Array A1"])
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, None)
-        self.assertEqual(ws.cell(row=1, column=2).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=3).value, "I002")
-        self.assertEqual(ws.cell(row=1, column=4).value, "I003")
-        self.assertEqual(ws.cell(row=1, column=5).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=6).value, "I005")
-        self.assertEqual(ws.cell(row=1, column=7).value, "I006")
-        self.assertEqual(ws.cell(row=1, column=8).value, "I007")
-        self.assertEqual(ws.cell(row=1, column=9).value, "I008")
-        self.assertEqual(ws.cell(row=1, column=10).value, "I009")
-        self.assertEqual(ws.cell(row=1, column=11).value, "I010")
-        self.assertEqual(ws.cell(row=1, column=12).value, "I011")
-        self.assertEqual(ws.cell(row=1, column=13).value, "I012")
-        self.assertEqual(ws.cell(row=1, column=14).value, "I013")
-        self.assertEqual(ws.cell(row=1, column=15).value, "I014")
-        self.assertEqual(ws.cell(row=1, column=16).value, "I015")
-        self.assertEqual(ws.cell(row=1, column=17).value, "I016")
-        self.assertEqual(ws.cell(row=1, column=18).value, "I017")
-        self.assertEqual(ws.cell(row=1, column=19).value, "I018")
-        self.assertEqual(ws.cell(row=2, column=1).value, "a001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "P1 (1, 1)\nX001")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (1, 2)\nX002")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (1, 3)\nX003")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (1, 4)\nX004")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (1, 5)\nX005")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P1 (1, 6)\nX006")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P2 (1, 1)\nX007")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (1, 2)\nX008")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (1, 3)\nX009")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (1, 4)\nX010")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (1, 5)\nX011")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P2 (1, 6)\nX012")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P3 (1, 1)\nX013")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (1, 2)\nX014")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (1, 3)\nX015")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (1, 4)\nX016")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (1, 5)\nX017")
-        self.assertEqual(ws.cell(row=2, column=19).value, "P3 (1, 6)\nX018")
-        self.assertEqual(ws.cell(row=3, column=1).value, "a002")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (2, 1)\nX019")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (2, 2)\nX020")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (2, 3)\nX021")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (2, 4)\nX022")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (2, 5)\nX023")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P1 (2, 6)\nX024")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (2, 1)\nX025")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (2, 2)\nX026")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (2, 3)\nX027")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (2, 4)\nX028")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (2, 5)\nX029")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P2 (2, 6)\nX030")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (2, 1)\nX031")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (2, 2)\nX032")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (2, 3)\nX033")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (2, 4)\nX034")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (2, 5)\nX035")
-        self.assertEqual(ws.cell(row=3, column=19).value, "P3 (2, 6)\nX036")
-        self.assertEqual(ws.cell(row=4, column=1).value, "a003")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (3, 1)\nX037")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (3, 2)\nX038")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (3, 3)\nX039")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (3, 4)\nX040")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (3, 5)\nX041")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P1 (3, 6)\nX042")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (3, 1)\nX043")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (3, 2)\nX044")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (3, 3)\nX045")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (3, 4)\nX046")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (3, 5)\nX047")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P2 (3, 6)\nX048")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (3, 1)\nX049")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (3, 2)\nX050")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (3, 3)\nX051")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (3, 4)\nX052")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (3, 5)\nX053")
-        self.assertEqual(ws.cell(row=4, column=19).value, "P3 (3, 6)\nX054")
-        self.assertEqual(ws.cell(row=5, column=1).value, "a004")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P1 (4, 1)\nX055")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P1 (4, 2)\nX056")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P1 (4, 3)\nX057")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P1 (4, 4)\nX058")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P1 (4, 5)\nX059")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P1 (4, 6)\nX060")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P2 (4, 1)\nX061")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P2 (4, 2)\nX062")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P2 (4, 3)\nX063")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P2 (4, 4)\nX064")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P2 (4, 5)\nX065")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P2 (4, 6)\nX066")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P3 (4, 1)\nX067")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P3 (4, 2)\nX068")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P3 (4, 3)\nX069")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P3 (4, 4)\nX070")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P3 (4, 5)\nX071")
-        self.assertEqual(ws.cell(row=5, column=19).value, "P3 (4, 6)\nX072")
-        self.assertEqual(ws.cell(row=6, column=1).value, "a005")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P4 (1, 1)\nX073")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (1, 2)\nX074")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (1, 3)\nX075")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (1, 4)\nX076")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (1, 5)\nX077")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P4 (1, 6)\nX078")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P5 (1, 1)\nX079")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (1, 2)\nX080")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (1, 3)\nX081")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (1, 4)\nX082")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (1, 5)\nX083")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P5 (1, 6)\nX084")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P6 (1, 1)\nX085")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (1, 2)\nX086")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (1, 3)\nX087")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (1, 4)\nX088")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (1, 5)\nX089")
-        self.assertEqual(ws.cell(row=6, column=19).value, "P6 (1, 6)\nX090")
-        self.assertEqual(ws.cell(row=7, column=1).value, "a006")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (2, 1)\nX091")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (2, 2)\nX092")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (2, 3)\nX093")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (2, 4)\nX094")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (2, 5)\nX095")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P4 (2, 6)\nX096")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (2, 1)\nX097")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (2, 2)\nX098")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (2, 3)\nX099")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (2, 4)\nX100")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (2, 5)\nX101")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P5 (2, 6)\nX102")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (2, 1)\nX103")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (2, 2)\nX104")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (2, 3)\nX105")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (2, 4)\nX106")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (2, 5)\nX107")
-        self.assertEqual(ws.cell(row=7, column=19).value, "P6 (2, 6)\nX108")
-        self.assertEqual(ws.cell(row=8, column=1).value, "a007")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (3, 1)\nX109")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (3, 2)\nX110")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (3, 3)\nX111")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (3, 4)\nX112")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (3, 5)\nX113")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P4 (3, 6)\nX114")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (3, 1)\nX115")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (3, 2)\nX116")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (3, 3)\nX117")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (3, 4)\nX118")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (3, 5)\nX119")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P5 (3, 6)\nX120")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (3, 1)\nX121")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (3, 2)\nX122")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (3, 3)\nX123")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (3, 4)\nX124")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (3, 5)\nX125")
-        self.assertEqual(ws.cell(row=8, column=19).value, "P6 (3, 6)\nX126")
-        self.assertEqual(ws.cell(row=9, column=1).value, "a008")
-        self.assertEqual(ws.cell(row=9, column=2).value, "P4 (4, 1)\nX127")
-        self.assertEqual(ws.cell(row=9, column=3).value, "P4 (4, 2)\nX128")
-        self.assertEqual(ws.cell(row=9, column=4).value, "P4 (4, 3)\nX129")
-        self.assertEqual(ws.cell(row=9, column=5).value, "P4 (4, 4)\nX130")
-        self.assertEqual(ws.cell(row=9, column=6).value, "P4 (4, 5)\nX131")
-        self.assertEqual(ws.cell(row=9, column=7).value, "P4 (4, 6)\nX132")
-        self.assertEqual(ws.cell(row=9, column=8).value, "P5 (4, 1)\nX133")
-        self.assertEqual(ws.cell(row=9, column=9).value, "P5 (4, 2)\nX134")
-        self.assertEqual(ws.cell(row=9, column=10).value, "P5 (4, 3)\nX135")
-        self.assertEqual(ws.cell(row=9, column=11).value, "P5 (4, 4)\nX136")
-        self.assertEqual(ws.cell(row=9, column=12).value, "P5 (4, 5)\nX137")
-        self.assertEqual(ws.cell(row=9, column=13).value, "P5 (4, 6)\nX138")
-        self.assertEqual(ws.cell(row=9, column=14).value, "P6 (4, 1)\nX139")
-        self.assertEqual(ws.cell(row=9, column=15).value, "P6 (4, 2)\nX140")
-        self.assertEqual(ws.cell(row=9, column=16).value, "P6 (4, 3)\nX141")
-        self.assertEqual(ws.cell(row=9, column=17).value, "P6 (4, 4)\nX142")
-        self.assertEqual(ws.cell(row=9, column=18).value, "P6 (4, 5)\nX143")
-        self.assertEqual(ws.cell(row=9, column=19).value, "P6 (4, 6)\nX144")
-        self.assertEqual(ws.cell(row=11, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=12, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-        self.assertEqual(ws.cell(row=13, column=1).value,
-                         u"Add 3.00µL of Xylose to each well.")
-        self.assertEqual(ws.cell(row=14, column=1).value,
-                         u"Add 8.00µL of Sugar to media.")
-
-    def test_save_rep_setup_instructions_cells_and_inducer(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_initial_od600 = 1e-5
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=18, scale='log')
-        p.apply_inducer(iptg, apply_to='rows')
-
-        # Create second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        atc.set_gradient(min=0.5, max=50, n=8, scale='log')
-        p.apply_inducer(atc, apply_to='cols')
-
-        # Create inducer for plate wells
-        xyl = platedesign.inducer.ChemicalInducer(
-            name='Xylose',
-            units=u'%')
-        xyl.shot_vol = 3.
-        xyl.set_gradient(min=1e-6, max=1e-3, n=144, scale='log')
-        p.apply_inducer(xyl, apply_to='wells')
-
-        # Create inducer for plate
-        sugar = platedesign.inducer.ChemicalInducer(
-            name='Sugar',
-            units=u'ng/µL')
-        sugar.shot_vol = 8.
-        sugar.concentrations = [2]
-        p.apply_inducer(sugar, apply_to='media')
-
-        # Run save_rep_setup_instructions
-        p.save_rep_setup_instructions(file_name=os.path.join(self.temp_dir,
-                                                             'plate_rep.xlsx'))
-        # Load spreadsheet
-        wb = openpyxl.load_workbook(filename=os.path.join(self.temp_dir,
-                                                          'plate_rep.xlsx'))
-        # Check that sheet exists in spreadsheet
-        self.assertTrue("Inducers for Plate Array A1" in wb.sheetnames)
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, None)
-        self.assertEqual(ws.cell(row=1, column=2).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=3).value, "I002")
-        self.assertEqual(ws.cell(row=1, column=4).value, "I003")
-        self.assertEqual(ws.cell(row=1, column=5).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=6).value, "I005")
-        self.assertEqual(ws.cell(row=1, column=7).value, "I006")
-        self.assertEqual(ws.cell(row=1, column=8).value, "I007")
-        self.assertEqual(ws.cell(row=1, column=9).value, "I008")
-        self.assertEqual(ws.cell(row=1, column=10).value, "I009")
-        self.assertEqual(ws.cell(row=1, column=11).value, "I010")
-        self.assertEqual(ws.cell(row=1, column=12).value, "I011")
-        self.assertEqual(ws.cell(row=1, column=13).value, "I012")
-        self.assertEqual(ws.cell(row=1, column=14).value, "I013")
-        self.assertEqual(ws.cell(row=1, column=15).value, "I014")
-        self.assertEqual(ws.cell(row=1, column=16).value, "I015")
-        self.assertEqual(ws.cell(row=1, column=17).value, "I016")
-        self.assertEqual(ws.cell(row=1, column=18).value, "I017")
-        self.assertEqual(ws.cell(row=1, column=19).value, "I018")
-        self.assertEqual(ws.cell(row=2, column=1).value, "a001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "P1 (1, 1)\nX001")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (1, 2)\nX002")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (1, 3)\nX003")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (1, 4)\nX004")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (1, 5)\nX005")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P1 (1, 6)\nX006")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P2 (1, 1)\nX007")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (1, 2)\nX008")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (1, 3)\nX009")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (1, 4)\nX010")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (1, 5)\nX011")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P2 (1, 6)\nX012")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P3 (1, 1)\nX013")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (1, 2)\nX014")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (1, 3)\nX015")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (1, 4)\nX016")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (1, 5)\nX017")
-        self.assertEqual(ws.cell(row=2, column=19).value, "P3 (1, 6)\nX018")
-        self.assertEqual(ws.cell(row=3, column=1).value, "a002")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (2, 1)\nX019")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (2, 2)\nX020")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (2, 3)\nX021")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (2, 4)\nX022")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (2, 5)\nX023")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P1 (2, 6)\nX024")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (2, 1)\nX025")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (2, 2)\nX026")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (2, 3)\nX027")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (2, 4)\nX028")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (2, 5)\nX029")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P2 (2, 6)\nX030")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (2, 1)\nX031")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (2, 2)\nX032")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (2, 3)\nX033")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (2, 4)\nX034")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (2, 5)\nX035")
-        self.assertEqual(ws.cell(row=3, column=19).value, "P3 (2, 6)\nX036")
-        self.assertEqual(ws.cell(row=4, column=1).value, "a003")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (3, 1)\nX037")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (3, 2)\nX038")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (3, 3)\nX039")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (3, 4)\nX040")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (3, 5)\nX041")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P1 (3, 6)\nX042")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (3, 1)\nX043")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (3, 2)\nX044")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (3, 3)\nX045")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (3, 4)\nX046")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (3, 5)\nX047")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P2 (3, 6)\nX048")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (3, 1)\nX049")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (3, 2)\nX050")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (3, 3)\nX051")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (3, 4)\nX052")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (3, 5)\nX053")
-        self.assertEqual(ws.cell(row=4, column=19).value, "P3 (3, 6)\nX054")
-        self.assertEqual(ws.cell(row=5, column=1).value, "a004")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P1 (4, 1)\nX055")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P1 (4, 2)\nX056")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P1 (4, 3)\nX057")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P1 (4, 4)\nX058")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P1 (4, 5)\nX059")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P1 (4, 6)\nX060")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P2 (4, 1)\nX061")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P2 (4, 2)\nX062")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P2 (4, 3)\nX063")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P2 (4, 4)\nX064")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P2 (4, 5)\nX065")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P2 (4, 6)\nX066")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P3 (4, 1)\nX067")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P3 (4, 2)\nX068")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P3 (4, 3)\nX069")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P3 (4, 4)\nX070")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P3 (4, 5)\nX071")
-        self.assertEqual(ws.cell(row=5, column=19).value, "P3 (4, 6)\nX072")
-        self.assertEqual(ws.cell(row=6, column=1).value, "a005")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P4 (1, 1)\nX073")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (1, 2)\nX074")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (1, 3)\nX075")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (1, 4)\nX076")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (1, 5)\nX077")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P4 (1, 6)\nX078")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P5 (1, 1)\nX079")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (1, 2)\nX080")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (1, 3)\nX081")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (1, 4)\nX082")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (1, 5)\nX083")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P5 (1, 6)\nX084")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P6 (1, 1)\nX085")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (1, 2)\nX086")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (1, 3)\nX087")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (1, 4)\nX088")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (1, 5)\nX089")
-        self.assertEqual(ws.cell(row=6, column=19).value, "P6 (1, 6)\nX090")
-        self.assertEqual(ws.cell(row=7, column=1).value, "a006")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (2, 1)\nX091")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (2, 2)\nX092")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (2, 3)\nX093")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (2, 4)\nX094")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (2, 5)\nX095")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P4 (2, 6)\nX096")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (2, 1)\nX097")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (2, 2)\nX098")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (2, 3)\nX099")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (2, 4)\nX100")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (2, 5)\nX101")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P5 (2, 6)\nX102")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (2, 1)\nX103")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (2, 2)\nX104")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (2, 3)\nX105")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (2, 4)\nX106")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (2, 5)\nX107")
-        self.assertEqual(ws.cell(row=7, column=19).value, "P6 (2, 6)\nX108")
-        self.assertEqual(ws.cell(row=8, column=1).value, "a007")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (3, 1)\nX109")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (3, 2)\nX110")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (3, 3)\nX111")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (3, 4)\nX112")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (3, 5)\nX113")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P4 (3, 6)\nX114")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (3, 1)\nX115")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (3, 2)\nX116")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (3, 3)\nX117")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (3, 4)\nX118")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (3, 5)\nX119")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P5 (3, 6)\nX120")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (3, 1)\nX121")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (3, 2)\nX122")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (3, 3)\nX123")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (3, 4)\nX124")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (3, 5)\nX125")
-        self.assertEqual(ws.cell(row=8, column=19).value, "P6 (3, 6)\nX126")
-        self.assertEqual(ws.cell(row=9, column=1).value, "a008")
-        self.assertEqual(ws.cell(row=9, column=2).value, "P4 (4, 1)\nX127")
-        self.assertEqual(ws.cell(row=9, column=3).value, "P4 (4, 2)\nX128")
-        self.assertEqual(ws.cell(row=9, column=4).value, "P4 (4, 3)\nX129")
-        self.assertEqual(ws.cell(row=9, column=5).value, "P4 (4, 4)\nX130")
-        self.assertEqual(ws.cell(row=9, column=6).value, "P4 (4, 5)\nX131")
-        self.assertEqual(ws.cell(row=9, column=7).value, "P4 (4, 6)\nX132")
-        self.assertEqual(ws.cell(row=9, column=8).value, "P5 (4, 1)\nX133")
-        self.assertEqual(ws.cell(row=9, column=9).value, "P5 (4, 2)\nX134")
-        self.assertEqual(ws.cell(row=9, column=10).value, "P5 (4, 3)\nX135")
-        self.assertEqual(ws.cell(row=9, column=11).value, "P5 (4, 4)\nX136")
-        self.assertEqual(ws.cell(row=9, column=12).value, "P5 (4, 5)\nX137")
-        self.assertEqual(ws.cell(row=9, column=13).value, "P5 (4, 6)\nX138")
-        self.assertEqual(ws.cell(row=9, column=14).value, "P6 (4, 1)\nX139")
-        self.assertEqual(ws.cell(row=9, column=15).value, "P6 (4, 2)\nX140")
-        self.assertEqual(ws.cell(row=9, column=16).value, "P6 (4, 3)\nX141")
-        self.assertEqual(ws.cell(row=9, column=17).value, "P6 (4, 4)\nX142")
-        self.assertEqual(ws.cell(row=9, column=18).value, "P6 (4, 5)\nX143")
-        self.assertEqual(ws.cell(row=9, column=19).value, "P6 (4, 6)\nX144")
-        self.assertEqual(ws.cell(row=11, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=12, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-        self.assertEqual(ws.cell(row=13, column=1).value,
-                         u"Add 3.00µL of Xylose to each well.")
-        self.assertEqual(ws.cell(row=14, column=1).value,
-                         u"Add 8.00µL of Sugar to media.")
-
-        # Check that sheet exists in spreadsheet
-        self.assertTrue("Cells for Plate Array A1" in wb.sheetnames)
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=3, column=2).value, 100)
-        self.assertEqual(ws.cell(row=3, column=3).value, "x")
-        self.assertEqual(ws.cell(row=4, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=4, column=2).value, 990)
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 10)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=6, column=1).value, "Predilution OD600")
-        self.assertEqual(ws.cell(row=6, column=2).value, None)
-        self.assertEqual(ws.cell(row=6, column=3).value, None)
-        self.assertTrue('A7:C7' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=7, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Target OD600")
-        self.assertEqual(ws.cell(row=8, column=2).value, 1e-5)
-        self.assertEqual(ws.cell(row=8, column=3).value, None)
-        self.assertEqual(ws.cell(row=9, column=1).value, "Predilution volume")
-        test_excel_division_formula(self, ws.cell(row=9, column=2).value, 0.8, "B6")
-        self.assertEqual(ws.cell(row=9, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=10, column=1).value, "Add into 80.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_cells_and_inducer_workbook(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.total_media_vol = 80000.
-        # Add some information for cell setup
-        p.cell_strain_name = 'Test strain 1'
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_initial_od600 = 1e-5
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.shot_vol = 5.
-        iptg.set_gradient(min=1e-6, max=1e-3, n=18, scale='log')
-        p.apply_inducer(iptg, apply_to='rows')
-
-        # Create second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.shot_vol = 10.
-        atc.set_gradient(min=0.5, max=50, n=8, scale='log')
-        p.apply_inducer(atc, apply_to='cols')
-
-        # Create inducer for plate wells
-        xyl = platedesign.inducer.ChemicalInducer(
-            name='Xylose',
-            units=u'%')
-        xyl.shot_vol = 3.
-        xyl.set_gradient(min=1e-6, max=1e-3, n=144, scale='log')
-        p.apply_inducer(xyl, apply_to='wells')
-
-        # Create inducer for plate
-        sugar = platedesign.inducer.ChemicalInducer(
-            name='Sugar',
-            units=u'ng/µL')
-        sugar.shot_vol = 8.
-        sugar.concentrations = [2]
-        p.apply_inducer(sugar, apply_to='media')
-
-        # Create new spreadsheet
-        wb = openpyxl.Workbook()
-        # Save instructions on existing spreadsheet
-        p.save_rep_setup_instructions(workbook=wb)
-
-        # Check that sheet exists in spreadsheet
-        self.assertTrue("Inducers for Plate Array A1" in wb.sheetnames)
-        # Check inducer inoculation instructions
-        ws = wb["Inducers for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, '')
-        self.assertEqual(ws.cell(row=1, column=2).value, "I001")
-        self.assertEqual(ws.cell(row=1, column=3).value, "I002")
-        self.assertEqual(ws.cell(row=1, column=4).value, "I003")
-        self.assertEqual(ws.cell(row=1, column=5).value, "I004")
-        self.assertEqual(ws.cell(row=1, column=6).value, "I005")
-        self.assertEqual(ws.cell(row=1, column=7).value, "I006")
-        self.assertEqual(ws.cell(row=1, column=8).value, "I007")
-        self.assertEqual(ws.cell(row=1, column=9).value, "I008")
-        self.assertEqual(ws.cell(row=1, column=10).value, "I009")
-        self.assertEqual(ws.cell(row=1, column=11).value, "I010")
-        self.assertEqual(ws.cell(row=1, column=12).value, "I011")
-        self.assertEqual(ws.cell(row=1, column=13).value, "I012")
-        self.assertEqual(ws.cell(row=1, column=14).value, "I013")
-        self.assertEqual(ws.cell(row=1, column=15).value, "I014")
-        self.assertEqual(ws.cell(row=1, column=16).value, "I015")
-        self.assertEqual(ws.cell(row=1, column=17).value, "I016")
-        self.assertEqual(ws.cell(row=1, column=18).value, "I017")
-        self.assertEqual(ws.cell(row=1, column=19).value, "I018")
-        self.assertEqual(ws.cell(row=2, column=1).value, "a001")
-        self.assertEqual(ws.cell(row=2, column=2).value, "P1 (1, 1)\nX001")
-        self.assertEqual(ws.cell(row=2, column=3).value, "P1 (1, 2)\nX002")
-        self.assertEqual(ws.cell(row=2, column=4).value, "P1 (1, 3)\nX003")
-        self.assertEqual(ws.cell(row=2, column=5).value, "P1 (1, 4)\nX004")
-        self.assertEqual(ws.cell(row=2, column=6).value, "P1 (1, 5)\nX005")
-        self.assertEqual(ws.cell(row=2, column=7).value, "P1 (1, 6)\nX006")
-        self.assertEqual(ws.cell(row=2, column=8).value, "P2 (1, 1)\nX007")
-        self.assertEqual(ws.cell(row=2, column=9).value, "P2 (1, 2)\nX008")
-        self.assertEqual(ws.cell(row=2, column=10).value, "P2 (1, 3)\nX009")
-        self.assertEqual(ws.cell(row=2, column=11).value, "P2 (1, 4)\nX010")
-        self.assertEqual(ws.cell(row=2, column=12).value, "P2 (1, 5)\nX011")
-        self.assertEqual(ws.cell(row=2, column=13).value, "P2 (1, 6)\nX012")
-        self.assertEqual(ws.cell(row=2, column=14).value, "P3 (1, 1)\nX013")
-        self.assertEqual(ws.cell(row=2, column=15).value, "P3 (1, 2)\nX014")
-        self.assertEqual(ws.cell(row=2, column=16).value, "P3 (1, 3)\nX015")
-        self.assertEqual(ws.cell(row=2, column=17).value, "P3 (1, 4)\nX016")
-        self.assertEqual(ws.cell(row=2, column=18).value, "P3 (1, 5)\nX017")
-        self.assertEqual(ws.cell(row=2, column=19).value, "P3 (1, 6)\nX018")
-        self.assertEqual(ws.cell(row=3, column=1).value, "a002")
-        self.assertEqual(ws.cell(row=3, column=2).value, "P1 (2, 1)\nX019")
-        self.assertEqual(ws.cell(row=3, column=3).value, "P1 (2, 2)\nX020")
-        self.assertEqual(ws.cell(row=3, column=4).value, "P1 (2, 3)\nX021")
-        self.assertEqual(ws.cell(row=3, column=5).value, "P1 (2, 4)\nX022")
-        self.assertEqual(ws.cell(row=3, column=6).value, "P1 (2, 5)\nX023")
-        self.assertEqual(ws.cell(row=3, column=7).value, "P1 (2, 6)\nX024")
-        self.assertEqual(ws.cell(row=3, column=8).value, "P2 (2, 1)\nX025")
-        self.assertEqual(ws.cell(row=3, column=9).value, "P2 (2, 2)\nX026")
-        self.assertEqual(ws.cell(row=3, column=10).value, "P2 (2, 3)\nX027")
-        self.assertEqual(ws.cell(row=3, column=11).value, "P2 (2, 4)\nX028")
-        self.assertEqual(ws.cell(row=3, column=12).value, "P2 (2, 5)\nX029")
-        self.assertEqual(ws.cell(row=3, column=13).value, "P2 (2, 6)\nX030")
-        self.assertEqual(ws.cell(row=3, column=14).value, "P3 (2, 1)\nX031")
-        self.assertEqual(ws.cell(row=3, column=15).value, "P3 (2, 2)\nX032")
-        self.assertEqual(ws.cell(row=3, column=16).value, "P3 (2, 3)\nX033")
-        self.assertEqual(ws.cell(row=3, column=17).value, "P3 (2, 4)\nX034")
-        self.assertEqual(ws.cell(row=3, column=18).value, "P3 (2, 5)\nX035")
-        self.assertEqual(ws.cell(row=3, column=19).value, "P3 (2, 6)\nX036")
-        self.assertEqual(ws.cell(row=4, column=1).value, "a003")
-        self.assertEqual(ws.cell(row=4, column=2).value, "P1 (3, 1)\nX037")
-        self.assertEqual(ws.cell(row=4, column=3).value, "P1 (3, 2)\nX038")
-        self.assertEqual(ws.cell(row=4, column=4).value, "P1 (3, 3)\nX039")
-        self.assertEqual(ws.cell(row=4, column=5).value, "P1 (3, 4)\nX040")
-        self.assertEqual(ws.cell(row=4, column=6).value, "P1 (3, 5)\nX041")
-        self.assertEqual(ws.cell(row=4, column=7).value, "P1 (3, 6)\nX042")
-        self.assertEqual(ws.cell(row=4, column=8).value, "P2 (3, 1)\nX043")
-        self.assertEqual(ws.cell(row=4, column=9).value, "P2 (3, 2)\nX044")
-        self.assertEqual(ws.cell(row=4, column=10).value, "P2 (3, 3)\nX045")
-        self.assertEqual(ws.cell(row=4, column=11).value, "P2 (3, 4)\nX046")
-        self.assertEqual(ws.cell(row=4, column=12).value, "P2 (3, 5)\nX047")
-        self.assertEqual(ws.cell(row=4, column=13).value, "P2 (3, 6)\nX048")
-        self.assertEqual(ws.cell(row=4, column=14).value, "P3 (3, 1)\nX049")
-        self.assertEqual(ws.cell(row=4, column=15).value, "P3 (3, 2)\nX050")
-        self.assertEqual(ws.cell(row=4, column=16).value, "P3 (3, 3)\nX051")
-        self.assertEqual(ws.cell(row=4, column=17).value, "P3 (3, 4)\nX052")
-        self.assertEqual(ws.cell(row=4, column=18).value, "P3 (3, 5)\nX053")
-        self.assertEqual(ws.cell(row=4, column=19).value, "P3 (3, 6)\nX054")
-        self.assertEqual(ws.cell(row=5, column=1).value, "a004")
-        self.assertEqual(ws.cell(row=5, column=2).value, "P1 (4, 1)\nX055")
-        self.assertEqual(ws.cell(row=5, column=3).value, "P1 (4, 2)\nX056")
-        self.assertEqual(ws.cell(row=5, column=4).value, "P1 (4, 3)\nX057")
-        self.assertEqual(ws.cell(row=5, column=5).value, "P1 (4, 4)\nX058")
-        self.assertEqual(ws.cell(row=5, column=6).value, "P1 (4, 5)\nX059")
-        self.assertEqual(ws.cell(row=5, column=7).value, "P1 (4, 6)\nX060")
-        self.assertEqual(ws.cell(row=5, column=8).value, "P2 (4, 1)\nX061")
-        self.assertEqual(ws.cell(row=5, column=9).value, "P2 (4, 2)\nX062")
-        self.assertEqual(ws.cell(row=5, column=10).value, "P2 (4, 3)\nX063")
-        self.assertEqual(ws.cell(row=5, column=11).value, "P2 (4, 4)\nX064")
-        self.assertEqual(ws.cell(row=5, column=12).value, "P2 (4, 5)\nX065")
-        self.assertEqual(ws.cell(row=5, column=13).value, "P2 (4, 6)\nX066")
-        self.assertEqual(ws.cell(row=5, column=14).value, "P3 (4, 1)\nX067")
-        self.assertEqual(ws.cell(row=5, column=15).value, "P3 (4, 2)\nX068")
-        self.assertEqual(ws.cell(row=5, column=16).value, "P3 (4, 3)\nX069")
-        self.assertEqual(ws.cell(row=5, column=17).value, "P3 (4, 4)\nX070")
-        self.assertEqual(ws.cell(row=5, column=18).value, "P3 (4, 5)\nX071")
-        self.assertEqual(ws.cell(row=5, column=19).value, "P3 (4, 6)\nX072")
-        self.assertEqual(ws.cell(row=6, column=1).value, "a005")
-        self.assertEqual(ws.cell(row=6, column=2).value, "P4 (1, 1)\nX073")
-        self.assertEqual(ws.cell(row=6, column=3).value, "P4 (1, 2)\nX074")
-        self.assertEqual(ws.cell(row=6, column=4).value, "P4 (1, 3)\nX075")
-        self.assertEqual(ws.cell(row=6, column=5).value, "P4 (1, 4)\nX076")
-        self.assertEqual(ws.cell(row=6, column=6).value, "P4 (1, 5)\nX077")
-        self.assertEqual(ws.cell(row=6, column=7).value, "P4 (1, 6)\nX078")
-        self.assertEqual(ws.cell(row=6, column=8).value, "P5 (1, 1)\nX079")
-        self.assertEqual(ws.cell(row=6, column=9).value, "P5 (1, 2)\nX080")
-        self.assertEqual(ws.cell(row=6, column=10).value, "P5 (1, 3)\nX081")
-        self.assertEqual(ws.cell(row=6, column=11).value, "P5 (1, 4)\nX082")
-        self.assertEqual(ws.cell(row=6, column=12).value, "P5 (1, 5)\nX083")
-        self.assertEqual(ws.cell(row=6, column=13).value, "P5 (1, 6)\nX084")
-        self.assertEqual(ws.cell(row=6, column=14).value, "P6 (1, 1)\nX085")
-        self.assertEqual(ws.cell(row=6, column=15).value, "P6 (1, 2)\nX086")
-        self.assertEqual(ws.cell(row=6, column=16).value, "P6 (1, 3)\nX087")
-        self.assertEqual(ws.cell(row=6, column=17).value, "P6 (1, 4)\nX088")
-        self.assertEqual(ws.cell(row=6, column=18).value, "P6 (1, 5)\nX089")
-        self.assertEqual(ws.cell(row=6, column=19).value, "P6 (1, 6)\nX090")
-        self.assertEqual(ws.cell(row=7, column=1).value, "a006")
-        self.assertEqual(ws.cell(row=7, column=2).value, "P4 (2, 1)\nX091")
-        self.assertEqual(ws.cell(row=7, column=3).value, "P4 (2, 2)\nX092")
-        self.assertEqual(ws.cell(row=7, column=4).value, "P4 (2, 3)\nX093")
-        self.assertEqual(ws.cell(row=7, column=5).value, "P4 (2, 4)\nX094")
-        self.assertEqual(ws.cell(row=7, column=6).value, "P4 (2, 5)\nX095")
-        self.assertEqual(ws.cell(row=7, column=7).value, "P4 (2, 6)\nX096")
-        self.assertEqual(ws.cell(row=7, column=8).value, "P5 (2, 1)\nX097")
-        self.assertEqual(ws.cell(row=7, column=9).value, "P5 (2, 2)\nX098")
-        self.assertEqual(ws.cell(row=7, column=10).value, "P5 (2, 3)\nX099")
-        self.assertEqual(ws.cell(row=7, column=11).value, "P5 (2, 4)\nX100")
-        self.assertEqual(ws.cell(row=7, column=12).value, "P5 (2, 5)\nX101")
-        self.assertEqual(ws.cell(row=7, column=13).value, "P5 (2, 6)\nX102")
-        self.assertEqual(ws.cell(row=7, column=14).value, "P6 (2, 1)\nX103")
-        self.assertEqual(ws.cell(row=7, column=15).value, "P6 (2, 2)\nX104")
-        self.assertEqual(ws.cell(row=7, column=16).value, "P6 (2, 3)\nX105")
-        self.assertEqual(ws.cell(row=7, column=17).value, "P6 (2, 4)\nX106")
-        self.assertEqual(ws.cell(row=7, column=18).value, "P6 (2, 5)\nX107")
-        self.assertEqual(ws.cell(row=7, column=19).value, "P6 (2, 6)\nX108")
-        self.assertEqual(ws.cell(row=8, column=1).value, "a007")
-        self.assertEqual(ws.cell(row=8, column=2).value, "P4 (3, 1)\nX109")
-        self.assertEqual(ws.cell(row=8, column=3).value, "P4 (3, 2)\nX110")
-        self.assertEqual(ws.cell(row=8, column=4).value, "P4 (3, 3)\nX111")
-        self.assertEqual(ws.cell(row=8, column=5).value, "P4 (3, 4)\nX112")
-        self.assertEqual(ws.cell(row=8, column=6).value, "P4 (3, 5)\nX113")
-        self.assertEqual(ws.cell(row=8, column=7).value, "P4 (3, 6)\nX114")
-        self.assertEqual(ws.cell(row=8, column=8).value, "P5 (3, 1)\nX115")
-        self.assertEqual(ws.cell(row=8, column=9).value, "P5 (3, 2)\nX116")
-        self.assertEqual(ws.cell(row=8, column=10).value, "P5 (3, 3)\nX117")
-        self.assertEqual(ws.cell(row=8, column=11).value, "P5 (3, 4)\nX118")
-        self.assertEqual(ws.cell(row=8, column=12).value, "P5 (3, 5)\nX119")
-        self.assertEqual(ws.cell(row=8, column=13).value, "P5 (3, 6)\nX120")
-        self.assertEqual(ws.cell(row=8, column=14).value, "P6 (3, 1)\nX121")
-        self.assertEqual(ws.cell(row=8, column=15).value, "P6 (3, 2)\nX122")
-        self.assertEqual(ws.cell(row=8, column=16).value, "P6 (3, 3)\nX123")
-        self.assertEqual(ws.cell(row=8, column=17).value, "P6 (3, 4)\nX124")
-        self.assertEqual(ws.cell(row=8, column=18).value, "P6 (3, 5)\nX125")
-        self.assertEqual(ws.cell(row=8, column=19).value, "P6 (3, 6)\nX126")
-        self.assertEqual(ws.cell(row=9, column=1).value, "a008")
-        self.assertEqual(ws.cell(row=9, column=2).value, "P4 (4, 1)\nX127")
-        self.assertEqual(ws.cell(row=9, column=3).value, "P4 (4, 2)\nX128")
-        self.assertEqual(ws.cell(row=9, column=4).value, "P4 (4, 3)\nX129")
-        self.assertEqual(ws.cell(row=9, column=5).value, "P4 (4, 4)\nX130")
-        self.assertEqual(ws.cell(row=9, column=6).value, "P4 (4, 5)\nX131")
-        self.assertEqual(ws.cell(row=9, column=7).value, "P4 (4, 6)\nX132")
-        self.assertEqual(ws.cell(row=9, column=8).value, "P5 (4, 1)\nX133")
-        self.assertEqual(ws.cell(row=9, column=9).value, "P5 (4, 2)\nX134")
-        self.assertEqual(ws.cell(row=9, column=10).value, "P5 (4, 3)\nX135")
-        self.assertEqual(ws.cell(row=9, column=11).value, "P5 (4, 4)\nX136")
-        self.assertEqual(ws.cell(row=9, column=12).value, "P5 (4, 5)\nX137")
-        self.assertEqual(ws.cell(row=9, column=13).value, "P5 (4, 6)\nX138")
-        self.assertEqual(ws.cell(row=9, column=14).value, "P6 (4, 1)\nX139")
-        self.assertEqual(ws.cell(row=9, column=15).value, "P6 (4, 2)\nX140")
-        self.assertEqual(ws.cell(row=9, column=16).value, "P6 (4, 3)\nX141")
-        self.assertEqual(ws.cell(row=9, column=17).value, "P6 (4, 4)\nX142")
-        self.assertEqual(ws.cell(row=9, column=18).value, "P6 (4, 5)\nX143")
-        self.assertEqual(ws.cell(row=9, column=19).value, "P6 (4, 6)\nX144")
-        self.assertEqual(ws.cell(row=11, column=1).value,
-                         u"Add 5.00µL of IPTG to each well.")
-        self.assertEqual(ws.cell(row=12, column=1).value,
-                         u"Add 10.00µL of aTc to each well.")
-        self.assertEqual(ws.cell(row=13, column=1).value,
-                         u"Add 3.00µL of Xylose to each well.")
-        self.assertEqual(ws.cell(row=14, column=1).value,
-                         u"Add 8.00µL of Sugar to media.")
-
-        # Check that sheet exists in spreadsheet
-        self.assertTrue("Cells for Plate Array A1" in wb.sheetnames)
-        # Check cell inoculation instructions
-        ws = wb["Cells for Plate Array A1"]
-        self.assertEqual(ws.cell(row=1, column=1).value, "Strain Name")
-        self.assertEqual(ws.cell(row=1, column=2).value, "Test strain 1")
-        self.assertTrue('A2:C2' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=2, column=1).value, "Predilution")
-        self.assertEqual(ws.cell(row=3, column=1).value, "Predilution factor")
-        self.assertEqual(ws.cell(row=3, column=2).value, 100)
-        self.assertEqual(ws.cell(row=3, column=3).value, "x")
-        self.assertEqual(ws.cell(row=4, column=1).value, "Media volume")
-        self.assertEqual(ws.cell(row=4, column=2).value, 990)
-        self.assertEqual(ws.cell(row=4, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=5, column=1).value, "Preculture/aliquot volume")
-        self.assertEqual(ws.cell(row=5, column=2).value, 10)
-        self.assertEqual(ws.cell(row=5, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=6, column=1).value, "Predilution OD600")
-        self.assertEqual(ws.cell(row=6, column=2).value, None)
-        self.assertEqual(ws.cell(row=6, column=3).value, None)
-        self.assertTrue('A7:C7' in [r.coord for r in ws.merged_cells.ranges])
-        self.assertEqual(ws.cell(row=7, column=1).value, "Inoculation")
-        self.assertEqual(ws.cell(row=8, column=1).value, "Target OD600")
-        self.assertEqual(ws.cell(row=8, column=2).value, 1e-5)
-        self.assertEqual(ws.cell(row=8, column=3).value, None)
-        self.assertEqual(ws.cell(row=9, column=1).value, "Predilution volume")
-        test_excel_division_formula(self, ws.cell(row=9, column=2).value, 0.8, "B6")
-        self.assertEqual(ws.cell(row=9, column=3).value, u"µL")
-        self.assertEqual(ws.cell(row=10, column=1).value, "Add into 80.00mL "
-            "media, and distribute into plate wells.")
-
-    def test_save_rep_setup_instructions_argument_error(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Run save_rep_setup_instructions with no arguments
-        self.assertRaises(ValueError, p.save_rep_setup_instructions)
-
-    def test_save_rep_setup_files(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Check that save_rep_setup_files runs successfully
-        p.save_rep_setup_files()
-        # save_exp_setup_files does not do anything in Plate. There is no need
-        # to check for results.
-
-    def test_add_inducer_setup_instructions_sheet_error(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create workbook
-        wb = openpyxl.Workbook()
-        # Add sheet
-        wb.create_sheet("Test sheet")
-        # Attempt to add cell setup instructions
-        self.assertRaises(ValueError,
-                          p.add_inducer_setup_instructions,
-                          wb,
-                          "Test sheet")
-
-    def test_add_cell_setup_instructions_sheet_error(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        # Create workbook
-        wb = openpyxl.Workbook()
-        # Add sheet
-        wb.create_sheet("Test sheet")
-        # Attempt to add cell setup instructions
-        self.assertRaises(ValueError,
-                          p.add_cell_setup_instructions,
-                          wb,
-                          "Test sheet")
-
-    def test_close_plates_no_inducer_no_cell_inoculation(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-            # Check well info
-            well_info = pandas.DataFrame()
-            well_info['Measure'] = [True]*24
-            pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_resources(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-        # Add some resources
-        p.resources['Incubator'] = ['Incubator 1',
-                                    'Incubator 2',
-                                    'Incubator 3',
-                                    'Incubator 4',
-                                    'Incubator 5',
-                                    'Incubator 6',
-                                    ]
-        p.resources['Thermometer'] = ['Alcohol thermometer 1',
-                                      'Mercury thermometer 1',
-                                      'Alcohol thermometer 2',
-                                      'Mercury thermometer 2',
-                                      'Alcohol thermometer 3',
-                                      'Mercury thermometer 3',
-                                      ]
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-
-        # Check plate info
-        for cp in cps:
-            self.assertEqual(len(cp.plate_info), 4)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-            self.assertTrue('Incubator' in cp.plate_info)
-            self.assertTrue('Thermometer' in cp.plate_info)
-        self.assertEqual(cps[0].plate_info['Incubator'], 'Incubator 1')
-        self.assertEqual(cps[1].plate_info['Incubator'], 'Incubator 2')
-        self.assertEqual(cps[2].plate_info['Incubator'], 'Incubator 3')
-        self.assertEqual(cps[3].plate_info['Incubator'], 'Incubator 4')
-        self.assertEqual(cps[4].plate_info['Incubator'], 'Incubator 5')
-        self.assertEqual(cps[5].plate_info['Incubator'], 'Incubator 6')
-        self.assertEqual(cps[0].plate_info['Thermometer'], 'Alcohol thermometer 1')
-        self.assertEqual(cps[1].plate_info['Thermometer'], 'Mercury thermometer 1')
-        self.assertEqual(cps[2].plate_info['Thermometer'], 'Alcohol thermometer 2')
-        self.assertEqual(cps[3].plate_info['Thermometer'], 'Mercury thermometer 2')
-        self.assertEqual(cps[4].plate_info['Thermometer'], 'Alcohol thermometer 3')
-        self.assertEqual(cps[5].plate_info['Thermometer'], 'Mercury thermometer 3')
-
-        # Check well info
-        for cp in cps:
-            well_info = pandas.DataFrame()
-            well_info['Measure'] = [True]*24
-            pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_resources_error_1(self):
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-        # Add some resources
-        p.resources['Incubator'] = ['Incubator 1',
-                                    'Incubator 2',
-                                    'Incubator 3',
-                                    ]
-        p.resources['Thermometer'] = ['Alcohol thermometer 1',
-                                      'Mercury thermometer 1',
-                                      'Alcohol thermometer 2',
-                                      'Mercury thermometer 2',
-                                      'Alcohol thermometer 3',
-                                      'Mercury thermometer 3',
-                                      ]
-        # Call close plates and check length of output
-        six.assertRaisesRegex(self,
-                              ValueError,
-                              "3 resources of type Incubator specified, should be 6",
-                              p.close_plates,)
-
-    def test_close_plates_metadata(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-        # Add some metadata
-        p.metadata['Meta 1'] = 'Value 1'
-        p.metadata['Meta 2'] = 'Value 2'
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 4)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-            self.assertTrue('Meta 1' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Meta 1'], 'Value 1')
-            self.assertTrue('Meta 2' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Meta 2'], 'Value 2')
-            # Check well info
-            well_info = pandas.DataFrame()
-            well_info['Measure'] = [True]*24
-            pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_cell_inoculation_1(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-        # Add cell inoculation info
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_initial_od600 = 1e-5
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 4)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 1)
-            self.assertTrue('Initial OD600' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Initial OD600'], 1e-5)
-            # Check well info
-            well_info = pandas.DataFrame()
-            well_info['Measure'] = [True]*24
-            pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_cell_inoculation_2(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-        # Add cell inoculation info
-        p.cell_setup_method = 'fixed_od600'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_initial_od600 = 1e-5
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 4)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 100)
-            self.assertTrue('Initial OD600' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Initial OD600'], 1e-5)
-            # Check well info
-            well_info = pandas.DataFrame()
-            well_info['Measure'] = [True]*24
-            pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_cell_inoculation_3(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-        # Add cell inoculation info
-        p.cell_setup_method = 'fixed_volume'
-        p.cell_shot_vol = 5
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 4)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 1)
-            self.assertTrue('Cell Inoculated Vol.' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Cell Inoculated Vol.'], 5)
-            # Check well info
-            well_info = pandas.DataFrame()
-            well_info['Measure'] = [True]*24
-            pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_cell_inoculation_4(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-        # Add cell inoculation info
-        p.cell_setup_method = 'fixed_volume'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_shot_vol = 5
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 4)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 100)
-            self.assertTrue('Cell Inoculated Vol.' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Cell Inoculated Vol.'], 5)
-            # Check well info
-            well_info = pandas.DataFrame()
-            well_info['Measure'] = [True]*24
-            pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_cell_inoculation_5(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-        # Add cell inoculation info
-        p.cell_setup_method = 'fixed_dilution'
-        p.cell_total_dilution = 1e4
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 4)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 1)
-            self.assertTrue('Total Cell Dilution' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Total Cell Dilution'], 1e4)
-            # Check well info
-            well_info = pandas.DataFrame()
-            well_info['Measure'] = [True]*24
-            pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_cell_inoculation_6(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-        # Add cell inoculation info
-        p.cell_setup_method = 'fixed_dilution'
-        p.cell_predilution = 100
-        p.cell_predilution_vol = 1000
-        p.cell_total_dilution = 1e5
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 4)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 100)
-            self.assertTrue('Total Cell Dilution' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Total Cell Dilution'], 1e5)
-            # Check well info
-            well_info = pandas.DataFrame()
-            well_info['Measure'] = [True]*24
-            pandas.util.testing.assert_frame_equal(cp.well_info, well_info)
-
-    def test_close_plates_inducer_row_1(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(18) + 3
-        p.apply_inducer(iptg, apply_to='rows')
-
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-
-        # Check well info
-        well_info_1 = pandas.DataFrame()
-        well_info_1[u'IPTG Concentration (µM)'] = \
-            [3., 4., 5., 6., 7., 8.,
-             3., 4., 5., 6., 7., 8.,
-             3., 4., 5., 6., 7., 8.,
-             3., 4., 5., 6., 7., 8.]
-        well_info_1['Measure'] = [True]*24
-
-        well_info_2 = pandas.DataFrame()
-        well_info_2[u'IPTG Concentration (µM)'] = \
-            [9., 10., 11., 12., 13., 14.,
-             9., 10., 11., 12., 13., 14.,
-             9., 10., 11., 12., 13., 14.,
-             9., 10., 11., 12., 13., 14.,]
-        well_info_2['Measure'] = [True]*24
-
-        well_info_3 = pandas.DataFrame()
-        well_info_3[u'IPTG Concentration (µM)'] = \
-            [15., 16., 17., 18., 19., 20,
-             15., 16., 17., 18., 19., 20,
-             15., 16., 17., 18., 19., 20,
-             15., 16., 17., 18., 19., 20,]
-        well_info_3['Measure'] = [True]*24
-
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_3)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_3)
-
-    def test_close_plates_inducer_row_2(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
+    def test_apply_inducer_error_1(self):
+        p = self.p
+        # Create inducer
+        iptg = _ChemicalInducer(
             name='IPTG',
             units=u'µM')
-        iptg.concentrations = numpy.arange(18) + 3
-        p.apply_inducer(iptg, apply_to='rows')
+        # Set concentrations
+        iptg.concentrations = [1]
+        # Apply inducer to plate
+        self.assertRaises(ValueError, p.apply_inducer, iptg, apply_to='all')
+        # Check that inducers dictionary in plate has been updated
+        self.assertEqual(p.inducers, EMPTY_INDUCERS)
 
-        # Second inducer for plate rows
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = (numpy.arange(18.) + 1)/10.
-        p.apply_inducer(atc, apply_to='rows')
+    def test_save_exp_setup_instructions_1(self):
+        p = self.p
+        # Run save_exp_setup_instructions
+        p.save_exp_setup_instructions(file_name=self._xlsx_path())
+        # save_exp_setup_instructions does not do anything in Plate. There is
+        # no need to check for results.
 
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+    def test_save_exp_setup_instructions_2(self):
+        p = self.p
+        # Create new spreadsheet
+        wb_test = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb_test.remove(wb_test.active)
+        # Run save_exp_setup_instructions
+        p.save_exp_setup_instructions(workbook=wb_test)
+        # save_exp_setup_instructions does not do anything in Plate. There is
+        # no need to check for results.
 
-        # Check well info
-        well_info_1 = pandas.DataFrame()
-        well_info_1[u'IPTG Concentration (µM)'] = \
-            [3., 4., 5., 6., 7., 8.,
-             3., 4., 5., 6., 7., 8.,
-             3., 4., 5., 6., 7., 8.,
-             3., 4., 5., 6., 7., 8.]
-        well_info_1[u'aTc Concentration (ng/µL)'] = \
-            [0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-             0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-             0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-             0.1, 0.2, 0.3, 0.4, 0.5, 0.6,]
-        well_info_1['Measure'] = [True]*24
+    def test_save_exp_setup_instructions_argument_error(self):
+        p = self.p
+        # Run save_exp_setup_instructions with no arguments
+        self.assertRaises(ValueError, p.save_exp_setup_instructions)
 
-        well_info_2 = pandas.DataFrame()
-        well_info_2[u'IPTG Concentration (µM)'] = \
-            [9., 10., 11., 12., 13., 14.,
-             9., 10., 11., 12., 13., 14.,
-             9., 10., 11., 12., 13., 14.,
-             9., 10., 11., 12., 13., 14.,]
-        well_info_2[u'aTc Concentration (ng/µL)'] = \
-            [0.7, 0.8, 0.9, 1.0, 1.1, 1.2,
-             0.7, 0.8, 0.9, 1.0, 1.1, 1.2,
-             0.7, 0.8, 0.9, 1.0, 1.1, 1.2,
-             0.7, 0.8, 0.9, 1.0, 1.1, 1.2,]
-        well_info_2['Measure'] = [True]*24
+    def test_save_exp_setup_files(self):
+        p = self.p
+        # Check that save_exp_setup_files runs successfully
+        p.save_exp_setup_files()
+        # save_exp_setup_files does not do anything in Plate. There is no need
+        # to check for results.
 
-        well_info_3 = pandas.DataFrame()
-        well_info_3[u'IPTG Concentration (µM)'] = \
-            [15., 16., 17., 18., 19., 20,
-             15., 16., 17., 18., 19., 20,
-             15., 16., 17., 18., 19., 20,
-             15., 16., 17., 18., 19., 20,]
-        well_info_3[u'aTc Concentration (ng/µL)'] = \
-            [1.3, 1.4, 1.5, 1.6, 1.7, 1.8,
-             1.3, 1.4, 1.5, 1.6, 1.7, 1.8,
-             1.3, 1.4, 1.5, 1.6, 1.7, 1.8,
-             1.3, 1.4, 1.5, 1.6, 1.7, 1.8,]
-        well_info_3['Measure'] = [True]*24
+    def test_save_rep_setup_instructions_empty(self):
+        p = self.p
+        # Run save_rep_setup_instructions
+        file_name = self._xlsx_path()
+        p.save_rep_setup_instructions(file_name=file_name)
+        # Load spreadsheet in read-only mode
+        wb = openpyxl.load_workbook(filename=file_name, read_only=True)
+        # Spreadsheet should only contain an empty sheet named "Sheet 1"
+        self.assertEqual(wb.sheetnames, ["Sheet 1"])
+        # Read-only workbooks keep the file open until closed
+        wb.close()
 
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_3)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_3)
+    def test_save_rep_setup_instructions_cell_setup_fixed_od600_1(self):
+        p = self.p
+        p.total_media_vol = 80000.
+        # Add some information for cell setup
+        p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_od600'
+        p.cell_initial_od600 = 1e-5
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
+        # Spreadsheet should contain one sheet
+        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate Array A1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Preculture/aliquot OD600",
+            (2, 2): None,
+            (2, 3): None,
+            (3, 1): "Target OD600",
+            (3, 2): 1e-5,
+            (3, 3): None,
+            (4, 1): "Preculture/aliquot volume",
+            (4, 3): u"µL",
+            (5, 1): MEDIA_80ML_INSTRUCTIONS,
+        }
+        # Read expected values and formula cell in a single pass
+        values = get_sheet_values(ws, list(expected_values) + [(4, 2)])
+        formula = values.pop((4, 2))
+        self.assertEqual(values, expected_values)
+        test_excel_division_formula(self, formula, 0.8, "B2")
 
-    def test_close_plates_inducer_row_3(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
+    def test_save_rep_setup_instructions_cell_setup_fixed_od600_2(self):
+        p = self.p
+        p.total_media_vol = 80000.
+        # Add some information for cell setup
         p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_od600'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_initial_od600 = 1e-5
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
+        # Spreadsheet should contain one sheet
+        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate Array A1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Predilution factor",
+            (3, 2): 100,
+            (3, 3): "x",
+            (4, 1): "Media volume",
+            (4, 2): 990,
+            (4, 3): u"µL",
+            (5, 1): "Preculture/aliquot volume",
+            (5, 2): 10,
+            (5, 3): u"µL",
+            (6, 1): "Predilution OD600",
+            (6, 2): None,
+            (6, 3): None,
+            (7, 1): "Inoculation",
+            (8, 1): "Target OD600",
+            (8, 2): 1e-5,
+            (8, 3): None,
+            (9, 1): "Predilution volume",
+            (9, 3): u"µL",
+            (10, 1): MEDIA_80ML_INSTRUCTIONS,
+        }
+        # Read expected values and formula cell in a single pass
+        values = get_sheet_values(ws, list(expected_values) + [(9, 2)])
+        formula = values.pop((9, 2))
+        self.assertEqual(values, expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A7:C7', merged)
+        test_excel_division_formula(self, formula, 0.8, "B6")
 
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(18) + 3
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='rows')
+    def test_save_rep_setup_instructions_cell_setup_fixed_od600_3(self):
+        p = self.p
+        p.total_media_vol = 80000.
+        # Add some information for cell setup
+        p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_od600'
+        p.cell_od600_measure_from_dilution = False
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_initial_od600 = 1e-5
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
+        # Spreadsheet should contain one sheet
+        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate Array A1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Preculture/aliquot OD600",
+            (3, 2): None,
+            (3, 3): None,
+            (4, 1): "Predilution factor",
+            (4, 2): 100,
+            (4, 3): "x",
+            (5, 1): "Media volume",
+            (5, 2): 990,
+            (5, 3): u"µL",
+            (6, 1): "Preculture/aliquot volume",
+            (6, 2): 10,
+            (6, 3): u"µL",
+            (7, 1): "Inoculation",
+            (8, 1): "Target OD600",
+            (8, 2): 1e-5,
+            (8, 3): None,
+            (9, 1): "Predilution volume",
+            (9, 3): u"µL",
+            (10, 1): MEDIA_80ML_INSTRUCTIONS,
+        }
+        # Read expected values and formula cell in a single pass
+        values = get_sheet_values(ws, list(expected_values) + [(9, 2)])
+        formula = values.pop((9, 2))
+        self.assertEqual(values, expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A7:C7', merged)
+        test_excel_division_formula(self, formula, 80., "B3")
+
+    def test_save_rep_setup_instructions_cell_setup_errors(self):
+        # Each case contains the cell setup method and the attributes to set.
+        # Every case lacks one attribute required by the method.
+        cases = [
+            # Do not include target od600
+            ('fixed_od600', {'cell_predilution_vol': 1000}),
+            # Do not include predilution volume
+            ('fixed_od600', {'cell_initial_od600': 1e-5}),
+            # Do not include shot volume
+            ('fixed_volume', {'cell_predilution_vol': 1000}),
+            # Do not include predilution volume
+            ('fixed_volume', {'cell_shot_vol': 5}),
+            # Do not include total dilution
+            ('fixed_dilution', {'cell_predilution_vol': 1000}),
+            # Do not include predilution volume
+            ('fixed_dilution', {'cell_total_dilution': 1e5}),
+        ]
+        for method, attrs in cases:
+            msg = "method={}, attrs={}".format(method, attrs)
+            p = create_plate_array()
+            p.total_media_vol = 80000.
+            # Add some information for cell setup
+            p.cell_strain_name = 'Test strain 1'
+            p.cell_setup_method = method
+            p.cell_predilution = 100
+            for attr, value in attrs.items():
+                setattr(p, attr, value)
+            # Run save_rep_setup_instructions
+            assert_raises_msg(self,
+                              ValueError,
+                              msg,
+                              p.save_rep_setup_instructions,
+                              file_name=self._xlsx_path())
 
-        # Second inducer for plate rows
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = (numpy.arange(18.) + 1)/10.
-        p.apply_inducer(atc, apply_to='rows')
+    def test_save_rep_setup_instructions_cell_setup_fixed_volume_1(self):
+        p = self.p
+        p.total_media_vol = 80000.
+        # Add some information for cell setup
+        p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_volume'
+        p.cell_shot_vol = 5
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
+        # Spreadsheet should contain one sheet
+        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate Array A1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Preculture/aliquot volume",
+            (2, 2): 5,
+            (2, 3): u"µL",
+            (3, 1): MEDIA_80ML_INSTRUCTIONS,
+        }
+        self.assertEqual(get_sheet_values(ws, expected_values),
+                         expected_values)
 
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+    def test_save_rep_setup_instructions_cell_setup_fixed_volume_2(self):
+        p = self.p
+        p.total_media_vol = 80000.
+        # Add some information for cell setup
+        p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_volume'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_shot_vol = 5
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
+        # Spreadsheet should contain one sheet
+        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate Array A1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Predilution factor",
+            (3, 2): 100,
+            (3, 3): "x",
+            (4, 1): "Media volume",
+            (4, 2): 990,
+            (4, 3): u"µL",
+            (5, 1): "Preculture/aliquot volume",
+            (5, 2): 10,
+            (5, 3): u"µL",
+            (6, 1): "Inoculation",
+            (7, 1): "Predilution volume",
+            (7, 2): 5,
+            (7, 3): u"µL",
+            (8, 1): MEDIA_80ML_INSTRUCTIONS,
+        }
+        self.assertEqual(get_sheet_values(ws, expected_values),
+                         expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A6:C6', merged)
 
-        # Check well info
-        # Shuffling results are different in python 2 and 3
-        well_info_1 = pandas.DataFrame()
+    def test_save_rep_setup_instructions_cell_setup_fixed_dilution_1(self):
+        p = self.p
+        p.total_media_vol = 80000.
+        # Add some information for cell setup
+        p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_dilution'
+        p.cell_total_dilution = 1e4
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
+        # Spreadsheet should contain one sheet
+        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate Array A1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Preculture/aliquot volume",
+            (2, 2): 8,
+            (2, 3): u"µL",
+            (3, 1): MEDIA_80ML_INSTRUCTIONS,
+        }
+        self.assertEqual(get_sheet_values(ws, expected_values),
+                         expected_values)
+
+    def test_save_rep_setup_instructions_cell_setup_fixed_dilution_2(self):
+        p = self.p
+        p.total_media_vol = 80000.
+        # Add some information for cell setup
+        p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_dilution'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_total_dilution = 1e5
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Remove sheet created by default
+        wb.remove(wb.active)
+        # Save instructions on spreadsheet in memory
+        p.save_rep_setup_instructions(workbook=wb)
+        # Spreadsheet should contain one sheet
+        self.assertEqual(wb.sheetnames, ["Cells for Plate Array A1"])
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate Array A1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Predilution factor",
+            (3, 2): 100,
+            (3, 3): "x",
+            (4, 1): "Media volume",
+            (4, 2): 990,
+            (4, 3): u"µL",
+            (5, 1): "Preculture/aliquot volume",
+            (5, 2): 10,
+            (5, 3): u"µL",
+            (6, 1): "Inoculation",
+            (7, 1): "Predilution volume",
+            (7, 2): 80,
+            (7, 3): u"µL",
+            (8, 1): MEDIA_80ML_INSTRUCTIONS,
+        }
+        self.assertEqual(get_sheet_values(ws, expected_values),
+                         expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A6:C6', merged)
+
+    def test_save_rep_setup_instructions_inducer_rows(self):
+        # Shuffled IPTG dose IDs used in the last case. Shuffling results are
+        # different in python 2 and 3.
         if six.PY2:
-            well_info_1[u'IPTG Concentration (µM)'] = \
-                [14., 18., 20., 4., 13., 7.,
-                 14., 18., 20., 4., 13., 7.,
-                 14., 18., 20., 4., 13., 7.,
-                 14., 18., 20., 4., 13., 7.,]
+            shuffled_iptg_ids = ("I012", "I016", "I018", "I002", "I011",
+                                 "I005", "I017", "I014", "I010", "I001",
+                                 "I009", "I008", "I006", "I007", "I004",
+                                 "I013", "I015", "I003")
         elif six.PY3:
-            well_info_1[u'IPTG Concentration (µM)'] = \
-                [13., 8., 19., 20., 12., 3.,
-                 13., 8., 19., 20., 12., 3.,
-                 13., 8., 19., 20., 12., 3.,
-                 13., 8., 19., 20., 12., 3.,]
-        well_info_1[u'aTc Concentration (ng/µL)'] = \
-            [0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-             0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-             0.1, 0.2, 0.3, 0.4, 0.5, 0.6,
-             0.1, 0.2, 0.3, 0.4, 0.5, 0.6,]
-        well_info_1['Measure'] = [True]*24
-
-        well_info_2 = pandas.DataFrame()
+            shuffled_iptg_ids = ("I011", "I006", "I017", "I018", "I010",
+                                 "I001", "I016", "I015", "I004", "I007",
+                                 "I012", "I014", "I013", "I008", "I002",
+                                 "I009", "I003", "I005")
+        # Each case contains a name, the inducers to apply as arguments to
+        # apply_inducers, the expected dose ID rows, and the expected
+        # instructions
+        cases = [
+            ('iptg',
+             [(iptg_gradient(n=18), 5., 'rows', False)],
+             (IPTG_IDS_18,),
+             [IPTG_WELLS_INSTRUCTION]),
+            ('iptg_atc',
+             [(iptg_gradient(n=18), 5., 'rows', False),
+              (atc_gradient(n=18), 10., 'rows', False)],
+             (IPTG_IDS_18, ATC_IDS_18),
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+            ('shuffled_iptg_atc',
+             [(iptg_gradient(n=18), 5., 'rows', True),
+              (atc_gradient(n=18), 10., 'rows', False)],
+             (shuffled_iptg_ids, ATC_IDS_18),
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+        ]
+        for name, inducers, id_rows, instructions in cases:
+            grids = inducer_setup_grids(create_plate_array(), inducers)
+            expected_grid = inducer_sheet_grid(
+                id_rows + PLATE_ARRAY_WELL_LABELS,
+                instructions)
+            self.assertEqual(
+                grids,
+                {"Inducers for Plate Array A1": expected_grid},
+                msg=name)
+
+    def test_save_rep_setup_instructions_inducer_cols(self):
+        # Shuffled IPTG dose IDs used in the last case. Shuffling results are
+        # different in python 2 and 3.
         if six.PY2:
-            well_info_2[u'IPTG Concentration (µM)'] = \
-                [19., 16., 12., 3., 11., 10.,
-                 19., 16., 12., 3., 11., 10.,
-                 19., 16., 12., 3., 11., 10.,
-                 19., 16., 12., 3., 11., 10.,]
+            shuffled_iptg_ids = ("I001", "I003", "I004", "I007",
+                                 "I008", "I005", "I006", "I002")
         elif six.PY3:
-            well_info_2[u'IPTG Concentration (µM)'] = \
-                [18., 17., 6., 9., 14., 16.,
-                 18., 17., 6., 9., 14., 16.,
-                 18., 17., 6., 9., 14., 16.,
-                 18., 17., 6., 9., 14., 16.,]
-        well_info_2[u'aTc Concentration (ng/µL)'] = \
-            [0.7, 0.8, 0.9, 1.0, 1.1, 1.2,
-             0.7, 0.8, 0.9, 1.0, 1.1, 1.2,
-             0.7, 0.8, 0.9, 1.0, 1.1, 1.2,
-             0.7, 0.8, 0.9, 1.0, 1.1, 1.2,]
-        well_info_2['Measure'] = [True]*24
-
-        well_info_3 = pandas.DataFrame()
+            shuffled_iptg_ids = ("I004", "I007", "I002", "I006",
+                                 "I008", "I001", "I005", "I003")
+        # Each case contains a name, the inducers to apply as arguments to
+        # apply_inducers, the expected dose ID columns, and the expected
+        # instructions
+        cases = [
+            ('iptg',
+             [(iptg_gradient(n=8), 5., 'cols', False)],
+             (IPTG_IDS_18[:8],),
+             [IPTG_WELLS_INSTRUCTION]),
+            ('iptg_atc',
+             [(iptg_gradient(n=8), 5., 'cols', False),
+              (atc_gradient(n=8), 10., 'cols', False)],
+             (IPTG_IDS_18[:8], ATC_IDS_18[:8]),
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+            ('shuffled_iptg_atc',
+             [(iptg_gradient(n=8), 5., 'cols', True),
+              (atc_gradient(n=8), 10., 'cols', False)],
+             (shuffled_iptg_ids, ATC_IDS_18[:8]),
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+        ]
+        for name, inducers, id_cols, instructions in cases:
+            grids = inducer_setup_grids(create_plate_array(), inducers)
+            expected_grid = inducer_sheet_grid(
+                with_dose_id_cols(id_cols, PLATE_ARRAY_WELL_LABELS),
+                instructions)
+            self.assertEqual(
+                grids,
+                {"Inducers for Plate Array A1": expected_grid},
+                msg=name)
+
+    def test_save_rep_setup_instructions_inducer_wells(self):
+        # Shuffled IPTG dose IDs used in the last case, one per well counted
+        # row by row. Shuffling results are different in python 2 and 3.
         if six.PY2:
-            well_info_3[u'IPTG Concentration (µM)'] = \
-                [8., 9., 6., 15., 17., 5.,
-                 8., 9., 6., 15., 17., 5.,
-                 8., 9., 6., 15., 17., 5.,
-                 8., 9., 6., 15., 17., 5.,]
+            shuffled_iptg_ids = (
+                "I018", "I116", "I081", "I049", "I062", "I059",
+                "I072", "I011", "I044", "I123", "I075", "I033",
+                "I048", "I129", "I010", "I028", "I005", "I043",
+                "I023", "I110", "I002", "I061", "I085", "I007",
+                "I083", "I098", "I079", "I127", "I017", "I006",
+                "I008", "I103", "I056", "I076", "I087", "I065",
+                "I102", "I014", "I019", "I021", "I009", "I024",
+                "I038", "I100", "I105", "I117", "I134", "I039",
+                "I074", "I045", "I042", "I140", "I131", "I111",
+                "I077", "I016", "I068", "I139", "I057", "I031",
+                "I084", "I054", "I066", "I099", "I095", "I132",
+                "I012", "I113", "I097", "I086", "I050", "I088",
+                "I137", "I037", "I096", "I108", "I107", "I040",
+                "I035", "I128", "I093", "I143", "I138", "I015",
+                "I141", "I106", "I022", "I118", "I053", "I046",
+                "I078", "I082", "I055", "I029", "I064", "I080",
+                "I041", "I092", "I071", "I073", "I034", "I136",
+                "I089", "I104", "I144", "I069", "I060", "I091",
+                "I003", "I032", "I052", "I025", "I126", "I027",
+                "I130", "I119", "I120", "I124", "I051", "I026",
+                "I047", "I115", "I067", "I125", "I135", "I114",
+                "I121", "I030", "I094", "I133", "I001", "I101",
+                "I058", "I112", "I004", "I013", "I142", "I090",
+                "I063", "I070", "I036", "I109", "I122", "I020")
         elif six.PY3:
-            well_info_3[u'IPTG Concentration (µM)'] = \
-                [15., 10., 4., 11., 5., 7.,
-                 15., 10., 4., 11., 5., 7.,
-                 15., 10., 4., 11., 5., 7.,
-                 15., 10., 4., 11., 5., 7.,]
-        well_info_3[u'aTc Concentration (ng/µL)'] = \
-            [1.3, 1.4, 1.5, 1.6, 1.7, 1.8,
-             1.3, 1.4, 1.5, 1.6, 1.7, 1.8,
-             1.3, 1.4, 1.5, 1.6, 1.7, 1.8,
-             1.3, 1.4, 1.5, 1.6, 1.7, 1.8,]
-        well_info_3['Measure'] = [True]*24
+            shuffled_iptg_ids = (
+                "I096", "I129", "I027", "I021", "I085", "I060",
+                "I104", "I082", "I120", "I107", "I058", "I010",
+                "I006", "I133", "I080", "I122", "I061", "I077",
+                "I073", "I143", "I078", "I099", "I112", "I018",
+                "I022", "I009", "I036", "I075", "I019", "I110",
+                "I074", "I106", "I053", "I044", "I079", "I144",
+                "I089", "I130", "I015", "I091", "I063", "I095",
+                "I042", "I056", "I142", "I086", "I040", "I046",
+                "I020", "I108", "I141", "I114", "I067", "I101",
+                "I131", "I026", "I128", "I034", "I011", "I050",
+                "I007", "I033", "I123", "I126", "I012", "I048",
+                "I047", "I023", "I092", "I052", "I032", "I062",
+                "I005", "I051", "I097", "I102", "I124", "I037",
+                "I039", "I135", "I090", "I109", "I065", "I043",
+                "I016", "I094", "I081", "I024", "I013", "I083",
+                "I072", "I136", "I118", "I038", "I059", "I105",
+                "I087", "I132", "I045", "I134", "I071", "I064",
+                "I057", "I137", "I029", "I068", "I117", "I140",
+                "I055", "I028", "I088", "I049", "I113", "I002",
+                "I070", "I084", "I119", "I003", "I004", "I041",
+                "I139", "I014", "I138", "I076", "I030", "I103",
+                "I093", "I069", "I115", "I001", "I111", "I100",
+                "I008", "I125", "I025", "I054", "I098", "I121",
+                "I116", "I127", "I031", "I066", "I017", "I035")
+        # Each case contains a name, the number of samples to measure, the
+        # inducers to apply as arguments to apply_inducers, the expected dose
+        # IDs of each inducer, and the expected instructions. Wells beyond
+        # the samples to measure only contain their labels.
+        cases = [
+            ('iptg',
+             144,
+             [(iptg_gradient(n=144), 5., 'wells', False)],
+             [dose_ids("I", 144)],
+             [IPTG_WELLS_INSTRUCTION]),
+            ('iptg_atc',
+             144,
+             [(iptg_gradient(n=144), 5., 'wells', False),
+              (atc_gradient(n=144), 10., 'wells', False)],
+             [dose_ids("I", 144), dose_ids("a", 144)],
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+            ('iptg_80_samples',
+             80,
+             [(iptg_gradient(n=80), 5., 'wells', False)],
+             [dose_ids("I", 80)],
+             [IPTG_WELLS_INSTRUCTION]),
+            ('shuffled_iptg_atc',
+             144,
+             [(iptg_gradient(n=144), 5., 'wells', True),
+              (atc_gradient(n=144), 10., 'wells', False)],
+             [shuffled_iptg_ids, dose_ids("a", 144)],
+             [IPTG_WELLS_INSTRUCTION, ATC_WELLS_INSTRUCTION]),
+        ]
+        for name, n_samples, inducers, id_lists, instructions in cases:
+            p = create_plate_array()
+            # Limit number of samples to measure
+            p.samples_to_measure = n_samples
+            grids = inducer_setup_grids(p, inducers)
+            expected_grid = inducer_sheet_grid(
+                well_contents(PLATE_ARRAY_WELL_LABELS, id_lists),
+                instructions)
+            self.assertEqual(
+                grids,
+                {"Inducers for Plate Array A1": expected_grid},
+                msg=name)
+
+    def test_save_rep_setup_instructions_inducer_media(self):
+        # Each case contains a name, the inducers to apply as arguments to
+        # apply_inducers, and the expected instructions
+        cases = [
+            ('iptg',
+             [(single_dose_inducer('IPTG', u'µM', 10), 5., 'media', False)],
+             [IPTG_MEDIA_INSTRUCTION]),
+            ('iptg_atc',
+             [(single_dose_inducer('IPTG', u'µM', 10), 5., 'media', False),
+              (single_dose_inducer('aTc', u'ng/µL', 12), 10., 'media', False)],
+             [IPTG_MEDIA_INSTRUCTION, ATC_MEDIA_INSTRUCTION]),
+        ]
+        for name, inducers, instructions in cases:
+            p = create_plate_array()
+            # Limit number of samples to measure
+            p.samples_to_measure = 80
+            grids = inducer_setup_grids(p, inducers)
+            expected_grid = inducer_sheet_grid(PLATE_ARRAY_WELL_LABELS,
+                                               instructions)
+            self.assertEqual(
+                grids,
+                {"Inducers for Plate Array A1": expected_grid},
+                msg=name)
+
+    def test_save_rep_setup_instructions_inducer_mixed(self):
+        grids = inducer_setup_grids(self.p, mixed_inducers(8, 18))
+        self.assertEqual(
+            grids,
+            {"Inducers for Plate Array A1":
+                 mixed_inducers_grid(PLATE_ARRAY_WELL_LABELS)})
+
+    def test_save_rep_setup_instructions_cells_and_inducer(self):
+        p = self.p
+        p.total_media_vol = 80000.
+        # Add some information for cell setup
+        p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_od600'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_initial_od600 = 1e-5
+
+        # Apply inducers to plate rows, columns, wells, and media
+        apply_inducers(p, mixed_inducers(8, 18))
+
+        # Run save_rep_setup_instructions, saving to an in-memory file
+        xlsx_file = io.BytesIO()
+        p.save_rep_setup_instructions(file_name=xlsx_file)
+        # Load spreadsheet
+        wb = openpyxl.load_workbook(filename=xlsx_file)
+        # Check that sheet exists in spreadsheet
+        self.assertTrue("Inducers for Plate Array A1" in wb.sheetnames)
+        # Check inducer inoculation instructions
+        ws = wb["Inducers for Plate Array A1"]
+        grid = get_sheet_grid(ws)
+        self.assertEqual(grid,
+                         mixed_inducers_grid(PLATE_ARRAY_WELL_LABELS))
 
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_3)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_3)
+        # Check that sheet exists in spreadsheet
+        self.assertTrue("Cells for Plate Array A1" in wb.sheetnames)
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate Array A1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Predilution factor",
+            (3, 2): 100,
+            (3, 3): "x",
+            (4, 1): "Media volume",
+            (4, 2): 990,
+            (4, 3): u"µL",
+            (5, 1): "Preculture/aliquot volume",
+            (5, 2): 10,
+            (5, 3): u"µL",
+            (6, 1): "Predilution OD600",
+            (6, 2): None,
+            (6, 3): None,
+            (7, 1): "Inoculation",
+            (8, 1): "Target OD600",
+            (8, 2): 1e-5,
+            (8, 3): None,
+            (9, 1): "Predilution volume",
+            (9, 3): u"µL",
+            (10, 1): MEDIA_80ML_INSTRUCTIONS,
+        }
+        # Read expected values and formula cell in a single pass
+        values = get_sheet_values(ws, list(expected_values) + [(9, 2)])
+        formula = values.pop((9, 2))
+        self.assertEqual(values, expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A7:C7', merged)
+        test_excel_division_formula(self, formula, 0.8, "B6")
 
-    def test_close_plates_inducer_col_1(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
+    def test_save_rep_setup_instructions_cells_and_inducer_workbook(self):
+        p = self.p
+        p.total_media_vol = 80000.
+        # Add some information for cell setup
         p.cell_strain_name = 'Test strain 1'
+        p.cell_setup_method = 'fixed_od600'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_initial_od600 = 1e-5
 
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(8) + 3
-        p.apply_inducer(iptg, apply_to='cols')
+        # Apply inducers to plate rows, columns, wells, and media
+        apply_inducers(p, mixed_inducers(8, 18))
 
-        # Call close plates and check length of output
-        cps = p.close_plates()
-        self.assertEqual(len(cps), 6)
-        # Check basic properties
-        self.assertEqual(cps[0].name, 'P1')
-        self.assertEqual(cps[1].name, 'P2')
-        self.assertEqual(cps[2].name, 'P3')
-        self.assertEqual(cps[3].name, 'P4')
-        self.assertEqual(cps[4].name, 'P5')
-        self.assertEqual(cps[5].name, 'P6')
-        for cp in cps:
-            self.assertEqual(cp.n_rows, 4)
-            self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
-            self.assertTrue('Plate Array' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+        # Create new spreadsheet
+        wb = openpyxl.Workbook()
+        # Save instructions on existing spreadsheet
+        p.save_rep_setup_instructions(workbook=wb)
 
-        # Check well info
-        well_info_1 = pandas.DataFrame()
-        well_info_1[u'IPTG Concentration (µM)'] = \
-            [3., 3., 3., 3., 3., 3.,
-             4., 4., 4., 4., 4., 4.,
-             5., 5., 5., 5., 5., 5.,
-             6., 6., 6., 6., 6., 6.]
-        well_info_1['Measure'] = [True]*24
-        well_info_2 = pandas.DataFrame()
-        well_info_2[u'IPTG Concentration (µM)'] = \
-            [7., 7., 7., 7., 7., 7.,
-             8., 8., 8., 8., 8., 8.,
-             9., 9., 9., 9., 9., 9.,
-             10., 10., 10., 10., 10., 10.]
-        well_info_2['Measure'] = [True]*24
+        # Check that sheet exists in spreadsheet
+        self.assertTrue("Inducers for Plate Array A1" in wb.sheetnames)
+        # Check inducer inoculation instructions
+        ws = wb["Inducers for Plate Array A1"]
+        grid = get_sheet_grid(ws)
+        self.assertEqual(grid,
+                         mixed_inducers_grid(PLATE_ARRAY_WELL_LABELS))
 
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_2)
+        # Check that sheet exists in spreadsheet
+        self.assertTrue("Cells for Plate Array A1" in wb.sheetnames)
+        # Check cell inoculation instructions
+        ws = wb["Cells for Plate Array A1"]
+        # Expected cell values, indexed by (row, column)
+        expected_values = {
+            (1, 1): "Strain Name",
+            (1, 2): "Test strain 1",
+            (2, 1): "Predilution",
+            (3, 1): "Predilution factor",
+            (3, 2): 100,
+            (3, 3): "x",
+            (4, 1): "Media volume",
+            (4, 2): 990,
+            (4, 3): u"µL",
+            (5, 1): "Preculture/aliquot volume",
+            (5, 2): 10,
+            (5, 3): u"µL",
+            (6, 1): "Predilution OD600",
+            (6, 2): None,
+            (6, 3): None,
+            (7, 1): "Inoculation",
+            (8, 1): "Target OD600",
+            (8, 2): 1e-5,
+            (8, 3): None,
+            (9, 1): "Predilution volume",
+            (9, 3): u"µL",
+            (10, 1): MEDIA_80ML_INSTRUCTIONS,
+        }
+        # Read expected values and formula cell in a single pass
+        values = get_sheet_values(ws, list(expected_values) + [(9, 2)])
+        formula = values.pop((9, 2))
+        self.assertEqual(values, expected_values)
+        merged = get_merged_ranges(ws)
+        self.assertIn('A2:C2', merged)
+        self.assertIn('A7:C7', merged)
+        test_excel_division_formula(self, formula, 0.8, "B6")
 
-    def test_close_plates_inducer_col_2(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.cell_strain_name = 'Test strain 1'
+    def test_save_rep_setup_instructions_argument_error(self):
+        p = self.p
+        # Run save_rep_setup_instructions with no arguments
+        self.assertRaises(ValueError, p.save_rep_setup_instructions)
 
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(8) + 3
-        p.apply_inducer(iptg, apply_to='cols')
+    def test_save_rep_setup_files(self):
+        p = self.p
+        # Check that save_rep_setup_files runs successfully
+        p.save_rep_setup_files()
+        # save_exp_setup_files does not do anything in Plate. There is no need
+        # to check for results.
 
-        # Second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = (numpy.arange(8.) + 1)/10.
-        p.apply_inducer(atc, apply_to='cols')
+    def test_add_inducer_setup_instructions_sheet_error(self):
+        p = self.p
+        # Create workbook
+        wb = openpyxl.Workbook()
+        # Add sheet
+        wb.create_sheet("Test sheet")
+        # Attempt to add cell setup instructions
+        self.assertRaises(ValueError,
+                          p.add_inducer_setup_instructions,
+                          wb,
+                          "Test sheet")
+
+    def test_add_cell_setup_instructions_sheet_error(self):
+        p = self.p
+        # Create workbook
+        wb = openpyxl.Workbook()
+        # Add sheet
+        wb.create_sheet("Test sheet")
+        # Attempt to add cell setup instructions
+        self.assertRaises(ValueError,
+                          p.add_cell_setup_instructions,
+                          wb,
+                          "Test sheet")
 
+    def test_close_plates_no_inducer_no_cell_inoculation(self):
+        # Create plate
+        p = self.p
+        p.cell_strain_name = 'Test strain 1'
         # Call close plates and check length of output
         cps = p.close_plates()
         self.assertEqual(len(cps), 6)
@@ -7899,66 +3082,29 @@ class TestPlateArray(unittest.TestCase):
             self.assertEqual(cp.plate_info['Plate Array'], 'A1')
             self.assertTrue('Strain' in cp.plate_info)
             self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+            # Check well info
+            well_info = pandas.DataFrame()
+            well_info['Measure'] = [True]*24
+            pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
-        # Check well info
-        well_info_1 = pandas.DataFrame()
-        well_info_1[u'IPTG Concentration (µM)'] = \
-            [3., 3., 3., 3., 3., 3.,
-             4., 4., 4., 4., 4., 4.,
-             5., 5., 5., 5., 5., 5.,
-             6., 6., 6., 6., 6., 6.]
-        well_info_1[u'aTc Concentration (ng/µL)'] = \
-            [0.1, 0.1, 0.1, 0.1, 0.1, 0.1,
-             0.2, 0.2, 0.2, 0.2, 0.2, 0.2,
-             0.3, 0.3, 0.3, 0.3, 0.3, 0.3,
-             0.4, 0.4, 0.4, 0.4, 0.4, 0.4,]
-        well_info_1['Measure'] = [True]*24
-
-        well_info_2 = pandas.DataFrame()
-        well_info_2[u'IPTG Concentration (µM)'] = \
-            [7., 7., 7., 7., 7., 7.,
-             8., 8., 8., 8., 8., 8.,
-             9., 9., 9., 9., 9., 9.,
-             10., 10., 10., 10., 10., 10.]
-        well_info_2[u'aTc Concentration (ng/µL)'] = \
-            [0.5, 0.5, 0.5, 0.5, 0.5, 0.5,
-             0.6, 0.6, 0.6, 0.6, 0.6, 0.6,
-             0.7, 0.7, 0.7, 0.7, 0.7, 0.7,
-             0.8, 0.8, 0.8, 0.8, 0.8, 0.8,]
-        well_info_2['Measure'] = [True]*24
-
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_2)
-
-    def test_close_plates_inducer_col_3(self):
-        # Create plate
-        # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
+    def test_close_plates_resources(self):
+        p = self.p
         p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(8) + 3
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='cols')
-
-        # Second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = (numpy.arange(8.) + 1)/10.
-        p.apply_inducer(atc, apply_to='cols')
-
+        # Add some resources
+        p.resources['Incubator'] = ['Incubator 1',
+                                    'Incubator 2',
+                                    'Incubator 3',
+                                    'Incubator 4',
+                                    'Incubator 5',
+                                    'Incubator 6',
+                                    ]
+        p.resources['Thermometer'] = ['Alcohol thermometer 1',
+                                      'Mercury thermometer 1',
+                                      'Alcohol thermometer 2',
+                                      'Mercury thermometer 2',
+                                      'Alcohol thermometer 3',
+                                      'Mercury thermometer 3',
+                                      ]
         # Call close plates and check length of output
         cps = p.close_plates()
         self.assertEqual(len(cps), 6)
@@ -7972,79 +3118,63 @@ class TestPlateArray(unittest.TestCase):
         for cp in cps:
             self.assertEqual(cp.n_rows, 4)
             self.assertEqual(cp.n_cols, 6)
-            # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
+
+        # Check plate info
+        for cp in cps:
+            self.assertEqual(len(cp.plate_info), 4)
             self.assertTrue('Plate Array' in cp.plate_info)
             self.assertEqual(cp.plate_info['Plate Array'], 'A1')
             self.assertTrue('Strain' in cp.plate_info)
             self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+            self.assertTrue('Incubator' in cp.plate_info)
+            self.assertTrue('Thermometer' in cp.plate_info)
+        self.assertEqual(cps[0].plate_info['Incubator'], 'Incubator 1')
+        self.assertEqual(cps[1].plate_info['Incubator'], 'Incubator 2')
+        self.assertEqual(cps[2].plate_info['Incubator'], 'Incubator 3')
+        self.assertEqual(cps[3].plate_info['Incubator'], 'Incubator 4')
+        self.assertEqual(cps[4].plate_info['Incubator'], 'Incubator 5')
+        self.assertEqual(cps[5].plate_info['Incubator'], 'Incubator 6')
+        self.assertEqual(cps[0].plate_info['Thermometer'], 'Alcohol thermometer 1')
+        self.assertEqual(cps[1].plate_info['Thermometer'], 'Mercury thermometer 1')
+        self.assertEqual(cps[2].plate_info['Thermometer'], 'Alcohol thermometer 2')
+        self.assertEqual(cps[3].plate_info['Thermometer'], 'Mercury thermometer 2')
+        self.assertEqual(cps[4].plate_info['Thermometer'], 'Alcohol thermometer 3')
+        self.assertEqual(cps[5].plate_info['Thermometer'], 'Mercury thermometer 3')
 
         # Check well info
-        # Shuffling results are different in python 2 and 3
-        well_info_1 = pandas.DataFrame()
-        if six.PY2:
-            well_info_1[u'IPTG Concentration (µM)'] = \
-                [3., 3., 3., 3., 3., 3.,
-                 5., 5., 5., 5., 5., 5.,
-                 6., 6., 6., 6., 6., 6.,
-                 9., 9., 9., 9., 9., 9.,]
-        elif six.PY3:
-            well_info_1[u'IPTG Concentration (µM)'] = \
-                [6., 6., 6., 6., 6., 6.,
-                 9., 9., 9., 9., 9., 9.,
-                 4., 4., 4., 4., 4., 4.,
-                 8., 8., 8., 8., 8., 8.,]
-        well_info_1[u'aTc Concentration (ng/µL)'] = \
-            [0.1, 0.1, 0.1, 0.1, 0.1, 0.1,
-             0.2, 0.2, 0.2, 0.2, 0.2, 0.2,
-             0.3, 0.3, 0.3, 0.3, 0.3, 0.3,
-             0.4, 0.4, 0.4, 0.4, 0.4, 0.4,]
-        well_info_1['Measure'] = [True]*24
-
-        well_info_2 = pandas.DataFrame()
-        if six.PY2:
-            well_info_2[u'IPTG Concentration (µM)'] = \
-                [10., 10., 10., 10., 10., 10.,
-                  7., 7., 7., 7., 7., 7.,
-                  8., 8., 8., 8., 8., 8.,
-                  4., 4., 4., 4., 4., 4.,]
-        elif six.PY3:
-            well_info_2[u'IPTG Concentration (µM)'] = \
-                [10., 10., 10., 10., 10., 10.,
-                  3., 3., 3., 3., 3., 3.,
-                  7., 7., 7., 7., 7., 7.,
-                  5., 5., 5., 5., 5., 5.,]
-        well_info_2[u'aTc Concentration (ng/µL)'] = \
-            [0.5, 0.5, 0.5, 0.5, 0.5, 0.5,
-             0.6, 0.6, 0.6, 0.6, 0.6, 0.6,
-             0.7, 0.7, 0.7, 0.7, 0.7, 0.7,
-             0.8, 0.8, 0.8, 0.8, 0.8, 0.8,]
-        well_info_2['Measure'] = [True]*24
+        for cp in cps:
+            well_info = pandas.DataFrame()
+            well_info['Measure'] = [True]*24
+            pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_2)
+    def test_close_plates_resources_error_1(self):
+        p = self.p
+        p.cell_strain_name = 'Test strain 1'
+        # Add some resources
+        p.resources['Incubator'] = ['Incubator 1',
+                                    'Incubator 2',
+                                    'Incubator 3',
+                                    ]
+        p.resources['Thermometer'] = ['Alcohol thermometer 1',
+                                      'Mercury thermometer 1',
+                                      'Alcohol thermometer 2',
+                                      'Mercury thermometer 2',
+                                      'Alcohol thermometer 3',
+                                      'Mercury thermometer 3',
+                                      ]
+        # Call close plates and check length of output
+        six.assertRaisesRegex(self,
+                              ValueError,
+                              "3 resources of type Incubator specified, should be 6",
+                              p.close_plates,)
 
-    def test_close_plates_inducer_wells_1(self):
-        # Create plate
+    def test_close_plates_metadata(self):
         # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
+        p = self.p
         p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(144) + 3
-        p.apply_inducer(iptg, apply_to='wells')
-
+        # Add some metadata
+        p.metadata['Meta 1'] = 'Value 1'
+        p.metadata['Meta 2'] = 'Value 2'
         # Call close plates and check length of output
         cps = p.close_plates()
         self.assertEqual(len(cps), 6)
@@ -8059,91 +3189,27 @@ class TestPlateArray(unittest.TestCase):
             self.assertEqual(cp.n_rows, 4)
             self.assertEqual(cp.n_cols, 6)
             # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
+            self.assertEqual(len(cp.plate_info), 4)
             self.assertTrue('Plate Array' in cp.plate_info)
             self.assertEqual(cp.plate_info['Plate Array'], 'A1')
-            self.assertTrue('Strain' in cp.plate_info)
-            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-
-        # Check well info
-        well_info_1 = pandas.DataFrame()
-        well_info_1[u'IPTG Concentration (µM)'] = \
-            [  3.,   4.,   5.,   6.,   7.,   8.,
-              21.,  22.,  23.,  24.,  25.,  26.,
-              39.,  40.,  41.,  42.,  43.,  44.,
-              57.,  58.,  59.,  60.,  61.,  62.]
-        well_info_1['Measure'] = [True]*24
-
-        well_info_2 = pandas.DataFrame()
-        well_info_2[u'IPTG Concentration (µM)'] = \
-            [  9.,  10.,  11.,  12.,  13.,  14.,
-              27.,  28.,  29.,  30.,  31.,  32.,
-              45.,  46.,  47.,  48.,  49.,  50.,
-              63.,  64.,  65.,  66.,  67.,  68.]
-        well_info_2['Measure'] = [True]*24
-
-        well_info_3 = pandas.DataFrame()
-        well_info_3[u'IPTG Concentration (µM)'] = \
-            [ 15.,  16.,  17.,  18.,  19.,  20.,
-              33.,  34.,  35.,  36.,  37.,  38.,
-              51.,  52.,  53.,  54.,  55.,  56.,
-              69.,  70.,  71.,  72.,  73.,  74.]
-        well_info_3['Measure'] = [True]*24
-
-        well_info_4 = pandas.DataFrame()
-        well_info_4[u'IPTG Concentration (µM)'] = \
-            [  75.,   76.,   77.,   78.,   79.,   80.,
-               93.,   94.,   95.,   96.,   97.,   98.,
-              111.,  112.,  113.,  114.,  115.,  116.,
-              129.,  130.,  131.,  132.,  133.,  134.]
-        well_info_4['Measure'] = [True]*24
-
-        well_info_5 = pandas.DataFrame()
-        well_info_5[u'IPTG Concentration (µM)'] = \
-            [  81.,   82.,   83.,   84.,   85.,   86.,
-               99.,  100.,  101.,  102.,  103.,  104.,
-              117.,  118.,  119.,  120.,  121.,  122.,
-              135.,  136.,  137.,  138.,  139.,  140.]
-        well_info_5['Measure'] = [True]*24
-
-        well_info_6 = pandas.DataFrame()
-        well_info_6[u'IPTG Concentration (µM)'] = \
-            [  87.,   88.,   89.,   90.,   91.,   92.,
-              105.,  106.,  107.,  108.,  109.,  110.,
-              123.,  124.,  125.,  126.,  127.,  128.,
-              141.,  142.,  143.,  144.,  145.,  146.]
-        well_info_6['Measure'] = [True]*24
-
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_3)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_4)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_5)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_6)
+            self.assertTrue('Strain' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+            self.assertTrue('Meta 1' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Meta 1'], 'Value 1')
+            self.assertTrue('Meta 2' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Meta 2'], 'Value 2')
+            # Check well info
+            well_info = pandas.DataFrame()
+            well_info['Measure'] = [True]*24
+            pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
-    def test_close_plates_inducer_wells_2(self):
-        # Create plate
+    def test_close_plates_cell_inoculation_1(self):
         # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
+        p = self.p
         p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(144) + 3
-        p.apply_inducer(iptg, apply_to='wells')
-
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = (numpy.arange(144) + 1)/10.
-        p.apply_inducer(atc, apply_to='wells')
-
+        # Add cell inoculation info
+        p.cell_setup_method = 'fixed_od600'
+        p.cell_initial_od600 = 1e-5
         # Call close plates and check length of output
         cps = p.close_plates()
         self.assertEqual(len(cps), 6)
@@ -8158,121 +3224,29 @@ class TestPlateArray(unittest.TestCase):
             self.assertEqual(cp.n_rows, 4)
             self.assertEqual(cp.n_cols, 6)
             # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
+            self.assertEqual(len(cp.plate_info), 4)
             self.assertTrue('Plate Array' in cp.plate_info)
             self.assertEqual(cp.plate_info['Plate Array'], 'A1')
             self.assertTrue('Strain' in cp.plate_info)
             self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 1)
+            self.assertTrue('Initial OD600' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Initial OD600'], 1e-5)
+            # Check well info
+            well_info = pandas.DataFrame()
+            well_info['Measure'] = [True]*24
+            pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
-        # Check well info
-        well_info_1 = pandas.DataFrame()
-        well_info_1[u'IPTG Concentration (µM)'] = \
-            [  3.,   4.,   5.,   6.,   7.,   8.,
-              21.,  22.,  23.,  24.,  25.,  26.,
-              39.,  40.,  41.,  42.,  43.,  44.,
-              57.,  58.,  59.,  60.,  61.,  62.]
-        well_info_1[u'aTc Concentration (ng/µL)'] = \
-            [ 0.1,  0.2,  0.3,  0.4,  0.5,  0.6,
-              1.9,  2. ,  2.1,  2.2,  2.3,  2.4,
-              3.7,  3.8,  3.9,  4. ,  4.1,  4.2,
-              5.5,  5.6,  5.7,  5.8,  5.9,  6. ]
-        well_info_1['Measure'] = [True]*24
-
-        well_info_2 = pandas.DataFrame()
-        well_info_2[u'IPTG Concentration (µM)'] = \
-            [  9.,  10.,  11.,  12.,  13.,  14.,
-              27.,  28.,  29.,  30.,  31.,  32.,
-              45.,  46.,  47.,  48.,  49.,  50.,
-              63.,  64.,  65.,  66.,  67.,  68.]
-        well_info_2[u'aTc Concentration (ng/µL)'] = \
-            [ 0.7,  0.8,  0.9,  1. ,  1.1,  1.2,
-              2.5,  2.6,  2.7,  2.8,  2.9,  3. ,
-              4.3,  4.4,  4.5,  4.6,  4.7,  4.8,
-              6.1,  6.2,  6.3,  6.4,  6.5,  6.6]
-        well_info_2['Measure'] = [True]*24
-
-        well_info_3 = pandas.DataFrame()
-        well_info_3[u'IPTG Concentration (µM)'] = \
-            [ 15.,  16.,  17.,  18.,  19.,  20.,
-              33.,  34.,  35.,  36.,  37.,  38.,
-              51.,  52.,  53.,  54.,  55.,  56.,
-              69.,  70.,  71.,  72.,  73.,  74.]
-        well_info_3[u'aTc Concentration (ng/µL)'] = \
-            [ 1.3,  1.4,  1.5,  1.6,  1.7,  1.8,
-              3.1,  3.2,  3.3,  3.4,  3.5,  3.6,
-              4.9,  5. ,  5.1,  5.2,  5.3,  5.4,
-              6.7,  6.8,  6.9,  7. ,  7.1,  7.2]
-        well_info_3['Measure'] = [True]*24
-
-        well_info_4 = pandas.DataFrame()
-        well_info_4[u'IPTG Concentration (µM)'] = \
-            [  75.,   76.,   77.,   78.,   79.,   80.,
-               93.,   94.,   95.,   96.,   97.,   98.,
-              111.,  112.,  113.,  114.,  115.,  116.,
-              129.,  130.,  131.,  132.,  133.,  134.]
-        well_info_4[u'aTc Concentration (ng/µL)'] = \
-            [  7.3,   7.4,   7.5,   7.6,   7.7,   7.8,
-               9.1,   9.2,   9.3,   9.4,   9.5,   9.6,
-              10.9,  11. ,  11.1,  11.2,  11.3,  11.4,
-              12.7,  12.8,  12.9,  13. ,  13.1,  13.2]
-        well_info_4['Measure'] = [True]*24
-
-        well_info_5 = pandas.DataFrame()
-        well_info_5[u'IPTG Concentration (µM)'] = \
-            [  81.,   82.,   83.,   84.,   85.,   86.,
-               99.,  100.,  101.,  102.,  103.,  104.,
-              117.,  118.,  119.,  120.,  121.,  122.,
-              135.,  136.,  137.,  138.,  139.,  140.]
-        well_info_5[u'aTc Concentration (ng/µL)'] = \
-            [  7.9,   8. ,   8.1,   8.2,   8.3,   8.4,
-               9.7,   9.8,   9.9,  10. ,  10.1,  10.2,
-              11.5,  11.6,  11.7,  11.8,  11.9,  12. ,
-              13.3,  13.4,  13.5,  13.6,  13.7,  13.8]
-        well_info_5['Measure'] = [True]*24
-
-        well_info_6 = pandas.DataFrame()
-        well_info_6[u'IPTG Concentration (µM)'] = \
-            [  87.,   88.,   89.,   90.,   91.,   92.,
-              105.,  106.,  107.,  108.,  109.,  110.,
-              123.,  124.,  125.,  126.,  127.,  128.,
-              141.,  142.,  143.,  144.,  145.,  146.]
-        well_info_6[u'aTc Concentration (ng/µL)'] = \
-            [  8.5,   8.6,   8.7,   8.8,   8.9,   9. ,
-              10.3,  10.4,  10.5,  10.6,  10.7,  10.8,
-              12.1,  12.2,  12.3,  12.4,  12.5,  12.6,
-              13.9,  14. ,  14.1,  14.2,  14.3,  14.4]
-        well_info_6['Measure'] = [True]*24
-
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_3)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_4)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_5)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_6)
-
-    def test_close_plates_inducer_wells_3(self):
+    def test_close_plates_cell_inoculation_2(self):
         # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
+        p = self.p
         p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(144) + 3
-        iptg.shuffle()
-        p.apply_inducer(iptg, apply_to='wells')
-
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = (numpy.arange(144) + 1)/10.
-        p.apply_inducer(atc, apply_to='wells')
-
+        # Add cell inoculation info
+        p.cell_setup_method = 'fixed_od600'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_initial_od600 = 1e-5
         # Call close plates and check length of output
         cps = p.close_plates()
         self.assertEqual(len(cps), 6)
@@ -8287,158 +3261,27 @@ class TestPlateArray(unittest.TestCase):
             self.assertEqual(cp.n_rows, 4)
             self.assertEqual(cp.n_cols, 6)
             # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
+            self.assertEqual(len(cp.plate_info), 4)
             self.assertTrue('Plate Array' in cp.plate_info)
             self.assertEqual(cp.plate_info['Plate Array'], 'A1')
             self.assertTrue('Strain' in cp.plate_info)
             self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 100)
+            self.assertTrue('Initial OD600' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Initial OD600'], 1e-5)
+            # Check well info
+            well_info = pandas.DataFrame()
+            well_info['Measure'] = [True]*24
+            pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
-        # Check well info
-        # Shuffling results are different in python 2 and 3
-        well_info_1 = pandas.DataFrame()
-        if six.PY2:
-            well_info_1[u'IPTG Concentration (µM)'] = \
-                [  20.,  118.,   83.,   51.,   64.,   61.,
-                   25.,  112.,    4.,   63.,   87.,    9.,
-                  104.,   16.,   21.,   23.,   11.,   26.,
-                   79.,   18.,   70.,  141.,   59.,   33.]
-        elif six.PY3:
-            well_info_1[u'IPTG Concentration (µM)'] = \
-                [ 98.0, 131.0,  29.0,  23.0,  87.0,  62.0,
-                  75.0, 145.0,  80.0, 101.0, 114.0,  20.0,
-                  91.0, 132.0,  17.0,  93.0,  65.0,  97.0,
-                 133.0,  28.0, 130.0,  36.0,  13.0,  52.0]
-        well_info_1[u'aTc Concentration (ng/µL)'] = \
-            [ 0.1,  0.2,  0.3,  0.4,  0.5,  0.6,
-              1.9,  2. ,  2.1,  2.2,  2.3,  2.4,
-              3.7,  3.8,  3.9,  4. ,  4.1,  4.2,
-              5.5,  5.6,  5.7,  5.8,  5.9,  6. ]
-        well_info_1['Measure'] = [True]*24
-
-        well_info_2 = pandas.DataFrame()
-        if six.PY2:
-            well_info_2[u'IPTG Concentration (µM)'] = \
-                [  74.,   13.,   46.,  125.,   77.,   35.,
-                   85.,  100.,   81.,  129.,   19.,    8.,
-                   40.,  102.,  107.,  119.,  136.,   41.,
-                   86.,   56.,   68.,  101.,   97.,  134.]
-        elif six.PY3:
-            well_info_2[u'IPTG Concentration (µM)'] = \
-                [106.0,  84.0, 122.0, 109.0,  60.0,  12.0,
-                  24.0,  11.0,  38.0,  77.0,  21.0, 112.0,
-                  44.0,  58.0, 144.0,  88.0,  42.0,  48.0,
-                   9.0,  35.0, 125.0, 128.0,  14.0,  50.0]
-        well_info_2[u'aTc Concentration (ng/µL)'] = \
-            [ 0.7,  0.8,  0.9,  1. ,  1.1,  1.2,
-              2.5,  2.6,  2.7,  2.8,  2.9,  3. ,
-              4.3,  4.4,  4.5,  4.6,  4.7,  4.8,
-              6.1,  6.2,  6.3,  6.4,  6.5,  6.6]
-        well_info_2['Measure'] = [True]*24
-
-        well_info_3 = pandas.DataFrame()
-        if six.PY2:
-            well_info_3[u'IPTG Concentration (µM)'] = \
-                [  50.,  131.,   12.,   30.,    7.,   45.,
-                   10.,  105.,   58.,   78.,   89.,   67.,
-                   76.,   47.,   44.,  142.,  133.,  113.,
-                   14.,  115.,   99.,   88.,   52.,   90.]
-        elif six.PY3:
-            well_info_3[u'IPTG Concentration (µM)'] = \
-                [  8.0, 135.0,  82.0, 124.0,  63.0,  79.0,
-                  76.0, 108.0,  55.0,  46.0,  81.0, 146.0,
-                  22.0, 110.0, 143.0, 116.0,  69.0, 103.0,
-                  49.0,  25.0,  94.0,  54.0,  34.0,  64.0]
-        well_info_3[u'aTc Concentration (ng/µL)'] = \
-            [ 1.3,  1.4,  1.5,  1.6,  1.7,  1.8,
-              3.1,  3.2,  3.3,  3.4,  3.5,  3.6,
-              4.9,  5. ,  5.1,  5.2,  5.3,  5.4,
-              6.7,  6.8,  6.9,  7. ,  7.1,  7.2]
-        well_info_3['Measure'] = [True]*24
-
-        well_info_4 = pandas.DataFrame()
-        if six.PY2:
-            well_info_4[u'IPTG Concentration (µM)'] = \
-                [ 139.,   39.,   98.,  110.,  109.,   42.,
-                   80.,   84.,   57.,   31.,   66.,   82.,
-                    5.,   34.,   54.,   27.,  128.,   29.,
-                  123.,   32.,   96.,  135.,    3.,  103.]
-        elif six.PY3:
-            well_info_4[u'IPTG Concentration (µM)'] = \
-                [  7.0,  53.0,  99.0, 104.0, 126.0,  39.0,
-                  74.0, 138.0, 120.0,  40.0,  61.0, 107.0,
-                  57.0,  30.0,  90.0,  51.0, 115.0,   4.0,
-                  95.0,  71.0, 117.0,   3.0, 113.0, 102.0]
-        well_info_4[u'aTc Concentration (ng/µL)'] = \
-            [  7.3,   7.4,   7.5,   7.6,   7.7,   7.8,
-               9.1,   9.2,   9.3,   9.4,   9.5,   9.6,
-              10.9,  11. ,  11.1,  11.2,  11.3,  11.4,
-              12.7,  12.8,  12.9,  13. ,  13.1,  13.2]
-        well_info_4['Measure'] = [True]*24
-
-        well_info_5 = pandas.DataFrame()
-        if six.PY2:
-            well_info_5[u'IPTG Concentration (µM)'] = \
-                [  37.,  130.,   95.,  145.,  140.,   17.,
-                   43.,   94.,   73.,   75.,   36.,  138.,
-                  132.,  121.,  122.,  126.,   53.,   28.,
-                   60.,  114.,    6.,   15.,  144.,   92.]
-        elif six.PY3:
-            well_info_5[u'IPTG Concentration (µM)'] = \
-                [ 41.0, 137.0,  92.0, 111.0,  67.0,  45.0,
-                  89.0, 134.0,  47.0, 136.0,  73.0,  66.0,
-                  72.0,  86.0, 121.0,   5.0,   6.0,  43.0,
-                  10.0, 127.0,  27.0,  56.0, 100.0, 123.0]
-        well_info_5[u'aTc Concentration (ng/µL)'] = \
-            [  7.9,   8. ,   8.1,   8.2,   8.3,   8.4,
-               9.7,   9.8,   9.9,  10. ,  10.1,  10.2,
-              11.5,  11.6,  11.7,  11.8,  11.9,  12. ,
-              13.3,  13.4,  13.5,  13.6,  13.7,  13.8]
-        well_info_5['Measure'] = [True]*24
-
-        well_info_6 = pandas.DataFrame()
-        if six.PY2:
-            well_info_6[u'IPTG Concentration (µM)'] = \
-                [ 143.,  108.,   24.,  120.,   55.,   48.,
-                   91.,  106.,  146.,   71.,   62.,   93.,
-                   49.,  117.,   69.,  127.,  137.,  116.,
-                   65.,   72.,   38.,  111.,  124.,   22.]
-        elif six.PY3:
-            well_info_6[u'IPTG Concentration (µM)'] = \
-                [ 18.0,  96.0,  83.0,  26.0,  15.0,  85.0,
-                  59.0, 139.0,  31.0,  70.0, 119.0, 142.0,
-                 141.0,  16.0, 140.0,  78.0,  32.0, 105.0,
-                 118.0, 129.0,  33.0,  68.0,  19.0,  37.0]
-        well_info_6[u'aTc Concentration (ng/µL)'] = \
-            [  8.5,   8.6,   8.7,   8.8,   8.9,   9. ,
-              10.3,  10.4,  10.5,  10.6,  10.7,  10.8,
-              12.1,  12.2,  12.3,  12.4,  12.5,  12.6,
-              13.9,  14. ,  14.1,  14.2,  14.3,  14.4]
-        well_info_6['Measure'] = [True]*24
-
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_3)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_4)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_5)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_6)
-
-    def test_close_plates_inducer_wells_4(self):
+    def test_close_plates_cell_inoculation_3(self):
         # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.samples_to_measure = 80
+        p = self.p
         p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = numpy.arange(80) + 3
-        p.apply_inducer(iptg, apply_to='wells')
-
+        # Add cell inoculation info
+        p.cell_setup_method = 'fixed_volume'
+        p.cell_shot_vol = 5
         # Call close plates and check length of output
         cps = p.close_plates()
         self.assertEqual(len(cps), 6)
@@ -8453,84 +3296,29 @@ class TestPlateArray(unittest.TestCase):
             self.assertEqual(cp.n_rows, 4)
             self.assertEqual(cp.n_cols, 6)
             # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
+            self.assertEqual(len(cp.plate_info), 4)
             self.assertTrue('Plate Array' in cp.plate_info)
             self.assertEqual(cp.plate_info['Plate Array'], 'A1')
             self.assertTrue('Strain' in cp.plate_info)
             self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 1)
+            self.assertTrue('Cell Inoculated Vol.' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Cell Inoculated Vol.'], 5)
+            # Check well info
+            well_info = pandas.DataFrame()
+            well_info['Measure'] = [True]*24
+            pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
-        # Check well info
-        well_info_1 = pandas.DataFrame()
-        well_info_1[u'IPTG Concentration (µM)'] = \
-            [  3.,   4.,   5.,   6.,   7.,   8.,
-              21.,  22.,  23.,  24.,  25.,  26.,
-              39.,  40.,  41.,  42.,  43.,  44.,
-              57.,  58.,  59.,  60.,  61.,  62.]
-        well_info_1['Measure'] = [True]*24
-
-        well_info_2 = pandas.DataFrame()
-        well_info_2[u'IPTG Concentration (µM)'] = \
-            [  9.,  10.,  11.,  12.,  13.,  14.,
-              27.,  28.,  29.,  30.,  31.,  32.,
-              45.,  46.,  47.,  48.,  49.,  50.,
-              63.,  64.,  65.,  66.,  67.,  68.]
-        well_info_2['Measure'] = [True]*24
-
-        well_info_3 = pandas.DataFrame()
-        well_info_3[u'IPTG Concentration (µM)'] = \
-            [ 15.,  16.,  17.,  18.,  19.,  20.,
-              33.,  34.,  35.,  36.,  37.,  38.,
-              51.,  52.,  53.,  54.,  55.,  56.,
-              69.,  70.,  71.,  72.,  73.,  74.]
-        well_info_3['Measure'] = [True]*24
-
-        well_info_4 = pandas.DataFrame()
-        well_info_4[u'IPTG Concentration (µM)'] = \
-            [       75.,        76.,        77.,        78.,        79.,        80.,
-              numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-              numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-              numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan]
-        well_info_4['Measure'] = [True]*6 + [False]* 18
-
-        well_info_5 = pandas.DataFrame()
-        well_info_5[u'IPTG Concentration (µM)'] = \
-            [      81.,        82.,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan]
-        well_info_5['Measure'] = [True]*2 + [False]* 22
-
-        well_info_6 = pandas.DataFrame()
-        well_info_6[u'IPTG Concentration (µM)'] = \
-            [numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan]
-        well_info_6['Measure'] = [False]*24
-
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_3)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_4)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_5)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_6)
-
-    def test_close_plates_inducer_media_1(self):
+    def test_close_plates_cell_inoculation_4(self):
         # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
+        p = self.p
         p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3]
-        p.apply_inducer(iptg, apply_to='media')
-
+        # Add cell inoculation info
+        p.cell_setup_method = 'fixed_volume'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_shot_vol = 5
         # Call close plates and check length of output
         cps = p.close_plates()
         self.assertEqual(len(cps), 6)
@@ -8545,50 +3333,27 @@ class TestPlateArray(unittest.TestCase):
             self.assertEqual(cp.n_rows, 4)
             self.assertEqual(cp.n_cols, 6)
             # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
+            self.assertEqual(len(cp.plate_info), 4)
             self.assertTrue('Plate Array' in cp.plate_info)
             self.assertEqual(cp.plate_info['Plate Array'], 'A1')
             self.assertTrue('Strain' in cp.plate_info)
             self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 100)
+            self.assertTrue('Cell Inoculated Vol.' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Cell Inoculated Vol.'], 5)
+            # Check well info
+            well_info = pandas.DataFrame()
+            well_info['Measure'] = [True]*24
+            pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
-        # Check well info
-        well_info_1 = pandas.DataFrame()
-        well_info_1[u'IPTG Concentration (µM)'] = \
-            [  3.,   3.,   3.,   3.,   3.,   3.,
-               3.,   3.,   3.,   3.,   3.,   3.,
-               3.,   3.,   3.,   3.,   3.,   3.,
-               3.,   3.,   3.,   3.,   3.,   3.]
-        well_info_1['Measure'] = [True]*24
-
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_1)
-
-    def test_close_plates_inducer_media_2(self):
+    def test_close_plates_cell_inoculation_5(self):
         # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
+        p = self.p
         p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3]
-        p.apply_inducer(iptg, apply_to='media')
-
-        atc = platedesign.inducer.ChemicalInducer(
-            name='aTc',
-            units=u'ng/µL')
-        atc.concentrations = [5]
-        p.apply_inducer(atc, apply_to='media')
-
+        # Add cell inoculation info
+        p.cell_setup_method = 'fixed_dilution'
+        p.cell_total_dilution = 1e4
         # Call close plates and check length of output
         cps = p.close_plates()
         self.assertEqual(len(cps), 6)
@@ -8603,50 +3368,29 @@ class TestPlateArray(unittest.TestCase):
             self.assertEqual(cp.n_rows, 4)
             self.assertEqual(cp.n_cols, 6)
             # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
+            self.assertEqual(len(cp.plate_info), 4)
             self.assertTrue('Plate Array' in cp.plate_info)
             self.assertEqual(cp.plate_info['Plate Array'], 'A1')
             self.assertTrue('Strain' in cp.plate_info)
             self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
+            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 1)
+            self.assertTrue('Total Cell Dilution' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Total Cell Dilution'], 1e4)
+            # Check well info
+            well_info = pandas.DataFrame()
+            well_info['Measure'] = [True]*24
+            pandas.testing.assert_frame_equal(cp.well_info, well_info)
 
-        # Check well info
-        well_info_1 = pandas.DataFrame()
-        well_info_1[u'IPTG Concentration (µM)'] = \
-        [  3.,   3.,   3.,   3.,   3.,   3.,
-           3.,   3.,   3.,   3.,   3.,   3.,
-           3.,   3.,   3.,   3.,   3.,   3.,
-           3.,   3.,   3.,   3.,   3.,   3.]
-        well_info_1[u'aTc Concentration (ng/µL)'] = \
-        [  5.,   5.,   5.,   5.,   5.,   5.,
-           5.,   5.,   5.,   5.,   5.,   5.,
-           5.,   5.,   5.,   5.,   5.,   5.,
-           5.,   5.,   5.,   5.,   5.,   5.]
-        well_info_1['Measure'] = [True]*24
-
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_1)
-
-    def test_close_plates_inducer_media_3(self):
+    def test_close_plates_cell_inoculation_6(self):
         # Create plate
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
-        p.samples_to_measure = 80
+        p = self.p
         p.cell_strain_name = 'Test strain 1'
-
-        # Create inducer for plate
-        iptg = platedesign.inducer.ChemicalInducer(
-            name='IPTG',
-            units=u'µM')
-        iptg.concentrations = [3]
-        p.apply_inducer(iptg, apply_to='media')
-
+        # Add cell inoculation info
+        p.cell_setup_method = 'fixed_dilution'
+        p.cell_predilution = 100
+        p.cell_predilution_vol = 1000
+        p.cell_total_dilution = 1e5
         # Call close plates and check length of output
         cps = p.close_plates()
         self.assertEqual(len(cps), 6)
@@ -8661,58 +3405,65 @@ class TestPlateArray(unittest.TestCase):
             self.assertEqual(cp.n_rows, 4)
             self.assertEqual(cp.n_cols, 6)
             # Check plate info
-            self.assertEqual(len(cp.plate_info), 2)
+            self.assertEqual(len(cp.plate_info), 4)
             self.assertTrue('Plate Array' in cp.plate_info)
             self.assertEqual(cp.plate_info['Plate Array'], 'A1')
             self.assertTrue('Strain' in cp.plate_info)
             self.assertEqual(cp.plate_info['Strain'], 'Test strain 1')
-
-        # Check well info
-        well_info_1 = pandas.DataFrame()
-        well_info_1[u'IPTG Concentration (µM)'] = \
-            [  3.,   3.,   3.,   3.,   3.,   3.,
-               3.,   3.,   3.,   3.,   3.,   3.,
-               3.,   3.,   3.,   3.,   3.,   3.,
-               3.,   3.,   3.,   3.,   3.,   3.]
-        well_info_1['Measure'] = [True]*24
-
-        well_info_4 = pandas.DataFrame()
-        well_info_4[u'IPTG Concentration (µM)'] = \
-            [        3.,         3.,         3.,         3.,         3.,         3.,
-              numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-              numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-              numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan]
-        well_info_4['Measure'] = [True]*6 + [False]* 18
-
-        well_info_5 = pandas.DataFrame()
-        well_info_5[u'IPTG Concentration (µM)'] = \
-            [       3.,         3.,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan]
-        well_info_5['Measure'] = [True]*2 + [False]* 22
-
-        well_info_6 = pandas.DataFrame()
-        well_info_6[u'IPTG Concentration (µM)'] = \
-            [numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,
-             numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan,  numpy.nan]
-        well_info_6['Measure'] = [False]*24
-
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_4)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_5)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_6)
+            self.assertTrue('Preculture/Aliquot Dilution' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Preculture/Aliquot Dilution'], 100)
+            self.assertTrue('Total Cell Dilution' in cp.plate_info)
+            self.assertEqual(cp.plate_info['Total Cell Dilution'], 1e5)
+            # Check well info
+            well_info = pandas.DataFrame()
+            well_info['Measure'] = [True]*24
+            pandas.testing.assert_frame_equal(cp.well_info, well_info)
+
+    def test_close_plates_inducer(self):
+        for case_name, samples_to_measure, inducers, inducer_columns in \
+                CLOSE_PLATE_ARRAY_INDUCER_CASES:
+            # Reset random seed so that shuffling is reproducible
+            random.seed(1)
+            # Create plate array
+            p = create_plate_array()
+            p.samples_to_measure = samples_to_measure
+            p.cell_strain_name = 'Test strain 1'
+            # Create and apply inducers
+            for inducer_args in inducers:
+                apply_chemical_inducer(p, *inducer_args)
+
+            # Call close plates and check length of output
+            cps = p.close_plates()
+            self.assertEqual(len(cps), 6, msg=case_name)
+            # Check basic properties
+            self.assertEqual([cp.name for cp in cps],
+                             list(PLATE_NAMES_6),
+                             msg=case_name)
+            # Expected well info of each closed plate
+            well_infos = split_plate_array_well_info(
+                inducer_columns +
+                [('Measure', [True]*samples_to_measure +
+                             [False]*(144 - samples_to_measure))])
+            for cp, well_info in zip(cps, well_infos):
+                msg = '{}, plate {}'.format(case_name, cp.name)
+                self.assertEqual((cp.n_rows, cp.n_cols), (4, 6), msg=msg)
+                # Check plate info
+                self.assertEqual(len(cp.plate_info), 2, msg=msg)
+                self.assertTrue('Plate Array' in cp.plate_info, msg=msg)
+                self.assertEqual(cp.plate_info['Plate Array'], 'A1', msg=msg)
+                self.assertTrue('Strain' in cp.plate_info, msg=msg)
+                self.assertEqual(cp.plate_info['Strain'],
+                                 'Test strain 1',
+                                 msg=msg)
+                # Check well info. The case and plate names are reported as
+                # the name of the compared object.
+                pandas.testing.assert_frame_equal(
+                    cp.well_info,
+                    well_info,
+                    obj='well_info of case {}'.format(msg))
 
     def test_close_plates_combined(self):
-        p = platedesign.plate.PlateArray(name='A1',
-                                         array_n_rows=2,
-                                         array_n_cols=3,
-                                         plate_names=['P{}'.format(i+1)
-                                                      for i in range(6)])
+        p = self.p
         p.cell_strain_name = 'Test strain 1'
         # Add some resources
         p.resources['Incubator'] = ['Incubator 1',
@@ -8739,14 +3490,14 @@ class TestPlateArray(unittest.TestCase):
         p.cell_shot_vol = 5
 
         # Create inducer for plate rows
-        iptg = platedesign.inducer.ChemicalInducer(
+        iptg = _ChemicalInducer(
             name='IPTG',
             units=u'µM')
         iptg.concentrations = numpy.arange(18) + 3
         p.apply_inducer(iptg, apply_to='rows')
 
         # Second inducer for plate columns
-        atc = platedesign.inducer.ChemicalInducer(
+        atc = _ChemicalInducer(
             name='aTc',
             units=u'ng/µL')
         atc.concentrations = (numpy.arange(8.) + 1)/10.
@@ -8876,12 +3627,12 @@ class TestPlateArray(unittest.TestCase):
              0.8, 0.8, 0.8, 0.8, 0.8, 0.8,]
         well_info_6['Measure'] = [True]*24
 
-        pandas.util.testing.assert_frame_equal(cps[0].well_info, well_info_1)
-        pandas.util.testing.assert_frame_equal(cps[1].well_info, well_info_2)
-        pandas.util.testing.assert_frame_equal(cps[2].well_info, well_info_3)
-        pandas.util.testing.assert_frame_equal(cps[3].well_info, well_info_4)
-        pandas.util.testing.assert_frame_equal(cps[4].well_info, well_info_5)
-        pandas.util.testing.assert_frame_equal(cps[5].well_info, well_info_6)
+        pandas.testing.assert_frame_equal(cps[0].well_info, well_info_1)
+        pandas.testing.assert_frame_equal(cps[1].well_info, well_info_2)
+        pandas.testing.assert_frame_equal(cps[2].well_info, well_info_3)
+        pandas.testing.assert_frame_equal(cps[3].well_info, well_info_4)
+        pandas.testing.assert_frame_equal(cps[4].well_info, well_info_5)
+        pandas.testing.assert_frame_equal(cps[5].well_info, well_info_6)
 
 class TestClosedPlate(unittest.TestCase):
     """
@@ -8910,7 +3661,7 @@ class TestClosedPlate(unittest.TestCase):
                      4,4,4,4,4,4],
              'Column': [1,2,3,4,5,6]*4})
         exp_samples_table = exp_samples_table[['Plate', 'Row', 'Column']]
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)
 
@@ -8936,7 +3687,7 @@ class TestClosedPlate(unittest.TestCase):
                      8,8,8,8,8,8,8,8,8,8,8,8],
              'Column': [1,2,3,4,5,6,7,8,9,10,11,12]*8})
         exp_samples_table = exp_samples_table[['Plate', 'Row', 'Column']]
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)
 
@@ -8967,7 +3718,7 @@ class TestClosedPlate(unittest.TestCase):
                                                'Initial OD',
                                                'Row',
                                                'Column']]
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)
 
@@ -8982,7 +3733,7 @@ class TestClosedPlate(unittest.TestCase):
         self.assertEqual(p.n_rows, 4)
         self.assertEqual(p.n_cols, 6)
         self.assertIsNone(p.plate_info)
-        pandas.util.testing.assert_frame_equal(p.well_info, well_info)
+        pandas.testing.assert_frame_equal(p.well_info, well_info)
         # Check samples table
         exp_samples_table = pandas.DataFrame(
             {'Plate': ['P1']*24,
@@ -8998,7 +3749,7 @@ class TestClosedPlate(unittest.TestCase):
                                                'Column',
                                                'IPTG',
                                                'Measure']]
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)
 
@@ -9018,7 +3769,7 @@ class TestClosedPlate(unittest.TestCase):
         self.assertEqual(p.n_rows, 4)
         self.assertEqual(p.n_cols, 6)
         self.assertEqual(p.plate_info, plate_info)
-        pandas.util.testing.assert_frame_equal(p.well_info, well_info)
+        pandas.testing.assert_frame_equal(p.well_info, well_info)
         # Check samples table
         exp_samples_table = pandas.DataFrame(
             {'Plate': ['P1']*24,
@@ -9038,7 +3789,7 @@ class TestClosedPlate(unittest.TestCase):
                                                'Column',
                                                'IPTG',
                                                'Measure']]
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)
 
@@ -9072,14 +3823,14 @@ class TestClosedPlate(unittest.TestCase):
                                                'Column',
                                                'IPTG',
                                                'Measure']]
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)
 
         # Add field to plate_info
         p.plate_info['Predilution'] = 10
         # Samples table should be the same as before
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)
         # Update and check that samples table has changed
@@ -9104,7 +3855,7 @@ class TestClosedPlate(unittest.TestCase):
                                                'Column',
                                                'IPTG',
                                                'Measure']]
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)
 
@@ -9120,7 +3871,7 @@ class TestClosedPlate(unittest.TestCase):
         p = platedesign.plate.ClosedPlate(name='P1',
                                           plate_info=plate_info,
                                           well_info=well_info)
-        pandas.util.testing.assert_frame_equal(p.well_info,
+        pandas.testing.assert_frame_equal(p.well_info,
                                                well_info,
                                                check_dtype=False)
         # Check samples table
@@ -9142,14 +3893,14 @@ class TestClosedPlate(unittest.TestCase):
                                                'Column',
                                                'IPTG',
                                                'Measure']]
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)
 
         # Change one of the columns in well_info
         p.well_info['Measure'] = [False]*8 + [True]*16
         # Samples table should be the same as before
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)
         # Update and check that samples table has changed
@@ -9172,6 +3923,6 @@ class TestClosedPlate(unittest.TestCase):
                                                'Column',
                                                'IPTG',
                                                'Measure']]
-        pandas.util.testing.assert_frame_equal(exp_samples_table,
+        pandas.testing.assert_frame_equal(exp_samples_table,
                                                p.samples_table,
                                                check_dtype=False)